@@ -0,0 +1,31 @@
+"""Generate the file of short statements for the B_003 benchmark.
+
+The file is generated rather than checked in, because of its size.
+Run from the root of the repository, with an optional number of
+statements (5000 by default).
+"""
+
+import sys
+
+STATEMENTS = (
+    "SELECT a_{i}, b + {i} AS c FROM tbl_{t} WHERE d = {i};\n",
+    "INSERT INTO tbl_{t} (a_{t}, b) VALUES ({i}, 'value {i}');\n",
+    "UPDATE tbl_{t} SET b = b + {i} WHERE a_{t} IN (1, 2, {i});\n",
+    "DELETE FROM tbl_{t} WHERE a_{t} = {i};\n",
+    "SELECT count(*) FROM tbl_{t} AS t JOIN other AS o ON t.id = o.id GROUP BY t.b;\n",
+)
+
+
+def generate(path: str, n: int) -> None:
+    """Write `n` short statements to `path`."""
+    with open(path, "w") as out:
+        out.write(f"-- {n} short statements, to check parsing scales linearly.\n")
+        for i in range(n):
+            out.write(STATEMENTS[i % len(STATEMENTS)].format(i=i, t=i % 7))
+
+
+if __name__ == "__main__":
+    generate(
+        "benchmarks/bench_003/bench_003_statements.sql",
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+    )
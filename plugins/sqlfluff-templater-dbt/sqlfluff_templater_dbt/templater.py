@@ -62,6 +62,12 @@ class DbtTemplater(JinjaTemplater):
 
     name = "dbt"
     sequential_fail_limit = 3
+    # Files are compiled in dependency order with a shared manifest,
+    # so they have to be rendered in the main process.
+    render_in_parallel = False
+    # The dbt project, profile and manifest are loaded from the config
+    # the first time it's used, so nested configs need their own instance.
+    shared_by_child_configs = False
 
     def __init__(self, **kwargs):
         self.sqlfluff_config = None
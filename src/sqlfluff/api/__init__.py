@@ -1,14 +1,17 @@
 """Elements which wrap the sqlfluff core library for public use."""
 
 # Expose the simple api
-from sqlfluff.api.simple import lint, fix, parse, APIParsingError
+from sqlfluff.api.simple import lint, lint_batch, fix, parse, APIParsingError
 from sqlfluff.api.info import list_rules, list_dialects
+from sqlfluff.api.asynchronous import AsyncLinter
 
 __all__ = (
     "lint",
+    "lint_batch",
     "fix",
     "parse",
     "APIParsingError",
     "list_rules",
     "list_dialects",
+    "AsyncLinter",
 )
@@ -0,0 +1,384 @@
+"""An asyncio API for linting, fixing and parsing SQL strings.
+
+Linting is CPU bound, so to avoid blocking the event loop, the work is
+done by a managed set of worker processes. Each worker keeps a warm
+`Linter` for each combination of arguments it's seen, so only the first
+request with a given dialect and rules pays for setting one up.
+
+Each worker handles one request at a time. If a request times out or
+is cancelled, its worker is killed (so that it stops work straight
+away) and replaced.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import multiprocessing
+import os
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlfluff.api.simple import (
+    _fix_string,
+    _lint_string,
+    _parse_string,
+    get_simple_config,
+)
+from sqlfluff.core import Linter
+
+# The warm linters of a worker process, by the arguments they were made with.
+_worker_linters: Dict[Tuple, Linter] = {}
+
+_commands = {"lint": _lint_string, "fix": _fix_string, "parse": _parse_string}
+
+
+def _get_worker_linter(
+    dialect: str,
+    rules: Optional[List[str]],
+    exclude_rules: Optional[List[str]],
+    config_path: Optional[str],
+) -> Linter:
+    """Get a warm linter in a worker process, making it if need be."""
+    key = (
+        dialect,
+        tuple(rules) if rules is not None else None,
+        tuple(exclude_rules) if exclude_rules is not None else None,
+        config_path,
+    )
+    if key not in _worker_linters:
+        _worker_linters[key] = Linter(
+            config=get_simple_config(
+                dialect=dialect,
+                rules=rules,
+                exclude_rules=exclude_rules,
+                config_path=config_path,
+            )
+        )
+    return _worker_linters[key]
+
+
+def _worker_main(conn: Connection) -> None:  # pragma: no cover
+    """Handle requests from a connection, until it sends None or closes."""
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        command, sql, kwargs = request
+        try:
+            response: Tuple[str, Any] = (
+                "ok",
+                _commands[command](_get_worker_linter(**kwargs), sql),
+            )
+        except Exception as err:
+            response = ("error", err)
+        try:
+            conn.send(response)
+        except Exception as err:
+            # The exception (or much less likely, the result) won't pickle.
+            conn.send(("error", RuntimeError(f"{command} failed: {err!r}")))
+
+
+class _Worker:
+    """A worker process, and the connection to send it requests over."""
+
+    def __init__(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_worker_main, args=(child_conn,), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def request(self, command: str, sql: str, kwargs: Dict[str, Any]) -> Tuple:
+        """Send a request and wait for the (status, result) response.
+
+        This blocks, so shouldn't be called from the event loop.
+        """
+        self.conn.send((command, sql, kwargs))
+        return self.conn.recv()
+
+    def stop(self) -> None:
+        """Ask the worker to stop, once it's done with any request."""
+        try:
+            self.conn.send(None)
+        except OSError:  # pragma: no cover
+            pass
+        self.conn.close()
+
+    def kill(self) -> None:
+        """Stop the worker straight away.
+
+        NB: We don't close the connection, because a thread may still be
+        waiting on it. That thread gets an EOFError once the worker's gone.
+        """
+        self.process.kill()
+        self.process.join()
+
+
+class AsyncLinter:
+    """Lints, fixes and parses SQL strings without blocking the event loop.
+
+    The worker processes are started as they're needed, and kept until
+    :meth:`close` is called (or the instance is used as an async context
+    manager, on exit).
+
+    Args:
+        processes (:obj:`int`, optional): The number of worker processes.
+            Defaults to the number of CPUs.
+        max_concurrency (:obj:`int`, optional): The most requests to
+            handle at once. Others wait their turn. Defaults to the
+            number of processes.
+        timeout (:obj:`float`, optional): The default timeout in seconds
+            for each request, including any time spent waiting its
+            turn. Defaults to None (no timeout).
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.processes = processes or os.cpu_count() or 1
+        self.max_concurrency = min(max_concurrency or self.processes, self.processes)
+        self.timeout = timeout
+        self._idle: List[_Worker] = []
+        self._busy = 0
+        self._closed = False
+        # The condition to wait for a turn on, and the loop it's for.
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Threads to wait on the workers, so that the event loop doesn't.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.processes, thread_name_prefix="sqlfluff-async"
+        )
+
+    async def __aenter__(self) -> "AsyncLinter":
+        return self
+
+    async def __aexit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the idle worker processes.
+
+        Busy workers are stopped as soon as they finish their request.
+        Any further requests raise a :exc:`RuntimeError`.
+        """
+        self._closed = True
+        for worker in self._idle:
+            worker.stop()
+        self._idle = []
+        self._executor.shutdown(wait=False)
+
+    async def _request(
+        self,
+        command: str,
+        sql: str,
+        timeout: Optional[float],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        if self._closed:
+            raise RuntimeError("This AsyncLinter has been closed.")
+        # The condition is made here, so that it's made in the running loop.
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._busy = 0
+        condition = self._condition
+
+        async def _run():
+            async with condition:
+                await condition.wait_for(lambda: self._busy < self.max_concurrency)
+                self._busy += 1
+            try:
+                if self._closed:
+                    # It was closed while this request waited its turn.
+                    raise RuntimeError("This AsyncLinter has been closed.")
+                worker = self._idle.pop() if self._idle else _Worker()
+                try:
+                    status, result = await loop.run_in_executor(
+                        self._executor, worker.request, command, sql, kwargs
+                    )
+                except BaseException:
+                    # On cancellation or timeout, the worker may still be busy
+                    # with the request, so kill it rather than wait for it.
+                    worker.kill()
+                    raise
+                if self._closed:
+                    worker.stop()
+                else:
+                    self._idle.append(worker)
+            finally:
+                async with condition:
+                    self._busy -= 1
+                    condition.notify()
+            if status == "error":
+                raise result
+            return result
+
+        if timeout is None:
+            timeout = self.timeout
+        return await asyncio.wait_for(_run(), timeout)
+
+    async def lint(
+        self,
+        sql: str,
+        dialect: str = "ansi",
+        rules: Optional[List[str]] = None,
+        exclude_rules: Optional[List[str]] = None,
+        config_path: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Lint a SQL string.
+
+        Takes the same arguments as :func:`sqlfluff.lint`, and optionally
+        a `timeout` in seconds to override the default for this request.
+        On timeout, an :exc:`asyncio.TimeoutError` is raised.
+
+        Returns:
+            :obj:`List[Dict[str, Any]]` for each violation found.
+        """
+        return await self._request(
+            "lint",
+            sql,
+            timeout,
+            dict(
+                dialect=dialect,
+                rules=rules,
+                exclude_rules=exclude_rules,
+                config_path=config_path,
+            ),
+        )
+
+    async def fix(
+        self,
+        sql: str,
+        dialect: str = "ansi",
+        rules: Optional[List[str]] = None,
+        exclude_rules: Optional[List[str]] = None,
+        config_path: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Fix a SQL string.
+
+        Takes the same arguments as :func:`sqlfluff.fix`, and optionally
+        a `timeout` in seconds to override the default for this request.
+
+        Returns:
+            :obj:`str` for the fixed SQL if possible.
+        """
+        return await self._request(
+            "fix",
+            sql,
+            timeout,
+            dict(
+                dialect=dialect,
+                rules=rules,
+                exclude_rules=exclude_rules,
+                config_path=config_path,
+            ),
+        )
+
+    async def parse(
+        self,
+        sql: str,
+        dialect: str = "ansi",
+        config_path: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Parse a SQL string.
+
+        Takes the same arguments as :func:`sqlfluff.parse`, and optionally
+        a `timeout` in seconds to override the default for this request.
+        Parsing errors raise an :exc:`APIParsingError`, as they do there.
+
+        Returns:
+            :obj:`Dict[str, Any]` JSON containing the parsed structure.
+        """
+        return await self._request(
+            "parse",
+            sql,
+            timeout,
+            dict(
+                dialect=dialect,
+                rules=None,
+                exclude_rules=None,
+                config_path=config_path,
+            ),
+        )
+
+
+# The AsyncLinter used by the module level functions, once it's needed.
+_default_linter: Optional[AsyncLinter] = None
+
+
+def _get_default_linter() -> AsyncLinter:
+    global _default_linter
+    if _default_linter is None:
+        _default_linter = AsyncLinter()
+        atexit.register(_default_linter.close)
+    return _default_linter
+
+
+async def lint(
+    sql: str,
+    dialect: str = "ansi",
+    rules: Optional[List[str]] = None,
+    exclude_rules: Optional[List[str]] = None,
+    config_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Lint a SQL string, with a shared :class:`AsyncLinter`.
+
+    See :meth:`AsyncLinter.lint`.
+    """
+    return await _get_default_linter().lint(
+        sql,
+        dialect=dialect,
+        rules=rules,
+        exclude_rules=exclude_rules,
+        config_path=config_path,
+        timeout=timeout,
+    )
+
+
+async def fix(
+    sql: str,
+    dialect: str = "ansi",
+    rules: Optional[List[str]] = None,
+    exclude_rules: Optional[List[str]] = None,
+    config_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> str:
+    """Fix a SQL string, with a shared :class:`AsyncLinter`.
+
+    See :meth:`AsyncLinter.fix`.
+    """
+    return await _get_default_linter().fix(
+        sql,
+        dialect=dialect,
+        rules=rules,
+        exclude_rules=exclude_rules,
+        config_path=config_path,
+        timeout=timeout,
+    )
+
+
+async def parse(
+    sql: str,
+    dialect: str = "ansi",
+    config_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Parse a SQL string, with a shared :class:`AsyncLinter`.
+
+    See :meth:`AsyncLinter.parse`.
+    """
+    return await _get_default_linter().parse(
+        sql, dialect=dialect, config_path=config_path, timeout=timeout
+    )
@@ -1,6 +1,6 @@
 """The simple public API methods."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from sqlfluff.core import (
     dialect_selector,
     FluffConfig,
@@ -54,6 +54,33 @@ class APIParsingError(ValueError):
         super().__init__(self.msg, *args)
 
 
+def _lint_string(linter: Linter, sql: str) -> List[Dict[str, Any]]:
+    """Lint a SQL string with a linter, returning the violations."""
+    result = linter.lint_string_wrapped(sql)
+    result_records = result.as_records()
+    # Return just the violations for this file
+    return [] if not result_records else result_records[0]["violations"]
+
+
+def _fix_string(linter: Linter, sql: str) -> str:
+    """Fix a SQL string with a linter, returning the fixed string."""
+    result = linter.lint_string_wrapped(sql, fix=True)
+    fixed_string = result.paths[0].files[0].fix_string()[0]
+    return fixed_string
+
+
+def _parse_string(linter: Linter, sql: str) -> Dict[str, Any]:
+    """Parse a SQL string with a linter, returning the parse tree as JSON."""
+    parsed = linter.parse_string(sql)
+    # If we encounter any parsing errors, raise them in a combined issue.
+    if parsed.violations:
+        raise APIParsingError(parsed.violations)
+    # Return a JSON representation of the parse tree.
+    if parsed.tree is None:  # pragma: no cover
+        return {}
+    return parsed.tree.as_record(show_raw=True)
+
+
 def lint(
     sql: str,
     dialect: str = "ansi",
@@ -83,12 +110,56 @@ def lint(
         exclude_rules=exclude_rules,
         config_path=config_path,
     )
-    linter = Linter(config=cfg)
+    return _lint_string(Linter(config=cfg), sql)
 
-    result = linter.lint_string_wrapped(sql)
-    result_records = result.as_records()
-    # Return just the violations for this file
-    return [] if not result_records else result_records[0]["violations"]
+
+def lint_batch(
+    queries: Iterable[Tuple[str, str]],
+    dialect: str = "ansi",
+    rules: Optional[List[str]] = None,
+    exclude_rules: Optional[List[str]] = None,
+    config_path: Optional[str] = None,
+    processes: int = 1,
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """Lint a batch of SQL strings.
+
+    The config and rules are only set up once for the whole batch,
+    and the queries are linted as they're read, so `queries` can be a
+    generator.
+
+    Args:
+        queries (:obj:`Iterable[Tuple[str, str]]`): The (sql, name) pairs
+            to be linted. The name identifies each query in the results.
+        dialect (:obj:`str`, optional): A reference to the dialect of the SQL
+            to be linted. Defaults to `ansi`.
+        rules (:obj:`Optional[List[str]`, optional): A list of rule
+            references to lint for. Defaults to None.
+        exclude_rules (:obj:`Optional[List[str]`, optional): A list of rule
+            references to avoid linting for. Defaults to None.
+        config_path (:obj:`Optional[str]`, optional): A path to a .sqlfluff config.
+            Defaults to None.
+        processes (:obj:`int`, optional): The number of processes to lint
+            in. Defaults to 1. With more than one, results are yielded in
+            the order they're ready rather than the order of `queries`.
+
+    Returns:
+        An iterator of (name, violations) tuples, where violations is a
+        :obj:`List[Dict[str, Any]]` for each violation found, as for
+        :func:`lint`.
+    """
+    cfg = get_simple_config(
+        dialect=dialect,
+        rules=rules,
+        exclude_rules=exclude_rules,
+        config_path=config_path,
+    )
+    linter = Linter(config=cfg)
+    for linted_file in linter.lint_strings(queries, processes=processes):
+        yield linted_file.path, sorted(
+            (v.get_info_dict() for v in linted_file.get_violations()),
+            # The tuple allows sorting by line number, then position, then code
+            key=lambda v: (v["line_no"], v["line_pos"], v["code"]),
+        )
 
 
 def fix(
@@ -120,11 +191,7 @@ def fix(
         exclude_rules=exclude_rules,
         config_path=config_path,
     )
-    linter = Linter(config=cfg)
-
-    result = linter.lint_string_wrapped(sql, fix=True)
-    fixed_string = result.paths[0].files[0].fix_string()[0]
-    return fixed_string
+    return _fix_string(Linter(config=cfg), sql)
 
 
 def parse(
@@ -148,13 +215,4 @@ def parse(
         dialect=dialect,
         config_path=config_path,
     )
-    linter = Linter(config=cfg)
-
-    parsed = linter.parse_string(sql)
-    # If we encounter any parsing errors, raise them in a combined issue.
-    if parsed.violations:
-        raise APIParsingError(parsed.violations)
-    # Return a JSON representation of the parse tree.
-    if parsed.tree is None:  # pragma: no cover
-        return {}
-    return parsed.tree.as_record(show_raw=True)
+    return _parse_string(Linter(config=cfg), sql)
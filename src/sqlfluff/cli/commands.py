@@ -1,6 +1,7 @@
 """Contains the CLI."""
 
 from itertools import chain
+import os
 import sys
 import json
 import logging
@@ -53,7 +54,8 @@ from sqlfluff.core import (
 from sqlfluff.core.config import progress_bar_configuration
 
 from sqlfluff.core.enums import FormatType, Color
-from sqlfluff.core.linter import ParsedString
+from sqlfluff.core.linter import LintingResult, ParsedString
+from sqlfluff.core.linter.server import LintClient, LintServer
 from sqlfluff.core.plugin.host import get_plugin_manager
 
 
@@ -442,6 +444,17 @@ def dialects(**kwargs) -> None:
     is_flag=True,
     help="Disables progress bars.",
 )
+@click.option(
+    "--cache-dir",
+    default=None,
+    help=(
+        "A directory in which to cache linting results between runs. Files "
+        "which are unchanged (along with their config and rules) since the "
+        "last run are not linted again. NB: Changes to files which a file "
+        "depends on (e.g. jinja macros) are not detected."
+    ),
+    type=click.Path(file_okay=False),
+)
 @click.argument("paths", nargs=-1, type=click.Path(allow_dash=True))
 def lint(
     paths: Tuple[str],
@@ -539,12 +552,7 @@ def lint(
         click.echo(json.dumps(github_result))
 
     if bench:
-        click.echo("==== overall timings ====")
-        click.echo(cli_table([("Clock time", result.total_time)]))
-        timing_summary = result.timing_summary()
-        for step in timing_summary:
-            click.echo(f"=== {step} ===")
-            click.echo(cli_table(timing_summary[step].items()))
+        _print_timings(result, as_json=format == FormatType.json.value)
 
     if not nofail:
         if not non_human_output:
@@ -748,16 +756,47 @@ def fix(
         exit_code = 1
 
     if bench:
-        click.echo("==== overall timings ====")
-        click.echo(cli_table([("Clock time", result.total_time)]))
-        timing_summary = result.timing_summary()
-        for step in timing_summary:
-            click.echo(f"=== {step} ===")
-            click.echo(cli_table(timing_summary[step].items()))
+        _print_timings(result)
 
     sys.exit(exit_code)
 
 
+def _print_timings(result: LintingResult, as_json: bool = False) -> None:
+    """Output the timings of a linting result, for `--bench`.
+
+    With `as_json`, the timings are output as a single line of JSON,
+    after the JSON of the results.
+    """
+    timing_summary = result.timing_summary()
+    if as_json:
+        click.echo(
+            json.dumps({"clock_time": result.total_time, "timings": timing_summary})
+        )
+        return
+    click.echo("==== overall timings ====")
+    click.echo(cli_table([("Clock time", result.total_time)]))
+    rule_summary = timing_summary.pop("rules", {})
+    for step in timing_summary:
+        click.echo(f"=== {step} ===")
+        click.echo(cli_table(timing_summary[step].items()))
+    if rule_summary:
+        click.echo("=== rules ===")
+        click.echo(
+            cli_table(
+                (
+                    (
+                        code,
+                        f"{timing['time']:.4f}s, {timing['calls']} calls, "
+                        f"{timing['fixes']} fixes",
+                    )
+                    for code, timing in rule_summary.items()
+                ),
+                col_width=50,
+                cols=1,
+            )
+        )
+
+
 def _completion_message(config: FluffConfig) -> None:
     click.echo(
         f"All Finished{'' if (config.get('nocolor') or not sys.stdout.isatty()) else ' 📜 🎉'}!"
@@ -978,6 +1017,91 @@ def _print_out_violations_and_timing(
     return violations_count
 
 
+@cli.command()
+@common_options
+@core_options
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    type=click.Path(),
+    help=(
+        "Listen for requests on a Unix socket at this path, rather than reading "
+        "them from stdin."
+    ),
+)
+def serve(
+    socket_path: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+    bench: bool = False,
+    extra_config_path: Optional[str] = None,
+    ignore_local_config: bool = False,
+    **kwargs,
+) -> None:
+    """Serve lint, fix and parse requests from a long lived process.
+
+    The dialect, rules and templater are only loaded once, rather than
+    on every invocation, which makes this well suited to editor
+    integrations and hooks.
+
+    Requests are JSON objects, one per line, read from stdin (or from
+    connections to the socket given with --socket). Responses are
+    written as JSON lines in the same way. For example:
+
+        {"id": 1, "command": "lint", "fname": "path/to/file.sql"}
+    """
+    config = get_config(extra_config_path, ignore_local_config, **kwargs)
+    lnt, _ = get_linter_and_formatter(config, silent=True)
+    progress_bar_configuration.disable_progress_bar = True
+    # Stdout is for responses, so log to stderr.
+    set_logging_level(
+        verbosity=config.get("verbose"), logger=logger, stderr_output=True
+    )
+    server = LintServer(lnt)
+    if socket_path:
+        try:
+            server.serve_socket(socket_path)
+        except ValueError as err:
+            click.echo(colorize(f"Error: {err}", Color.red), err=True)
+            sys.exit(1)
+    else:
+        server.serve_stream(sys.stdin, sys.stdout)
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    required=True,
+    type=click.Path(),
+    help="The path of the socket that `sqlfluff serve` is listening on.",
+)
+@click.argument("command", type=click.Choice(["lint", "fix", "parse"]))
+@click.argument("paths", nargs=-1, type=click.Path(allow_dash=True))
+def client(socket_path: str, command: str, paths: Tuple[str]) -> NoReturn:
+    """Forward lint, fix or parse requests to `sqlfluff serve`.
+
+    PATHS are files to send to the server, or a single ('-') character
+    to read from *stdin*. The responses from the server are written as
+    JSON lines. Fixes are returned, but not applied.
+    """
+    exit_code = 0
+    with LintClient(socket_path) as lint_client:
+        for path in paths:
+            if path == "-":
+                response = lint_client.request(
+                    command, sql=sys.stdin.read(), fname="stdin"
+                )
+            else:
+                response = lint_client.request(command, fname=os.path.abspath(path))
+            click.echo(json.dumps(response))
+            if response["status"] != "ok":
+                exit_code = 1
+            elif response["violations"] and not exit_code:
+                exit_code = 65
+    sys.exit(exit_code)
+
+
 # This "__main__" handler allows invoking SQLFluff using "python -m", which
 # simplifies the use of cProfile, e.g.:
 # python -m cProfile -s cumtime -m sqlfluff.cli.commands lint slow_file.sql
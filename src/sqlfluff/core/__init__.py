@@ -23,7 +23,7 @@ from sqlfluff.core.errors import (
 )
 
 # Timing objects
-from sqlfluff.core.timing import TimingSummary
+from sqlfluff.core.timing import RuleTimingSummary, TimingSummary
 
 __all__ = (
     "FluffConfig",
@@ -39,6 +39,7 @@ __all__ = (
     "SQLLintError",
     "SQLFluffUserError",
     "TimingSummary",
+    "RuleTimingSummary",
 )
 
 # This is for "sqlfluff lint" and "sqlfluff fix" multiprocessing (--processes)
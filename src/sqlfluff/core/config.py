@@ -4,6 +4,7 @@ import logging
 import os
 import os.path
 import configparser
+import copy
 
 import pluggy
 from itertools import chain
@@ -140,6 +141,7 @@ class ConfigLoader:
     def __init__(self):
         # TODO: check that this cache implementation is actually useful
         self._config_cache: dict = {}
+        self._default_config_cache: Dict[str, dict] = {}
 
     @classmethod
     def get_global(cls) -> "ConfigLoader":
@@ -254,12 +256,20 @@ class ConfigLoader:
         return ctx
 
     def load_default_config_file(self, file_dir: str, file_name: str) -> dict:
-        """Load the default config file."""
-        if file_name == "pyproject.toml":
-            elems = self._get_config_elems_from_toml(os.path.join(file_dir, file_name))
-        else:
-            elems = self._get_config_elems_from_file(os.path.join(file_dir, file_name))
-        return self._incorporate_vals({}, elems)
+        """Load the default config file.
+
+        This is called every time a `FluffConfig` is created, so we
+        cache the loaded values and return a copy of them each time.
+        """
+        fpath = os.path.join(file_dir, file_name)
+        if fpath not in self._default_config_cache:
+            if file_name == "pyproject.toml":
+                elems = self._get_config_elems_from_toml(fpath)
+            else:
+                elems = self._get_config_elems_from_file(fpath)
+            self._default_config_cache[fpath] = self._incorporate_vals({}, elems)
+        # Copy so that any mutation of the config doesn't affect the cache.
+        return copy.deepcopy(self._default_config_cache[fpath])
 
     def load_config_at_path(self, path: str) -> dict:
         """Load config from a given path."""
@@ -500,6 +510,19 @@ class FluffConfig:
         state = self.__dict__.copy()
         # Remove the unpicklable entries.
         del state["_plugin_manager"]
+        # The expanded dialect is by far the largest part of a config, and
+        # is memoized by `dialect_selector`, so rather than pickle it (e.g.
+        # with every file sent to a worker process), we select it again by
+        # name when unpickling.
+        # NB: We import here to avoid a circular references.
+        from sqlfluff.core.dialects import dialect_selector
+
+        core = self._configs["core"]
+        if core.get("dialect_obj") is dialect_selector(core.get("dialect")):
+            state["_configs"] = {
+                **self._configs,
+                "core": {k: v for k, v in core.items() if k != "dialect_obj"},
+            }
         return state
 
     def __setstate__(self, state):
@@ -510,11 +533,13 @@ class FluffConfig:
         # probably be fresh in any case.
         # NOTE: This means that registering user plugins directly will only
         # work if those plugins are used in the main process (i.e. templaters).
-        # User registered linting rules either must be "installed" and therefore
-        # available to all processes - or their use is limited to only single
-        # process invocations of sqlfluff. In the event that user registered
-        # rules are used in a multi-process invocation, they will not be applied
-        # in the child processes.
+        # User registered linting rules are passed to the child processes by
+        # the runner, when it starts them.
+        core = self._configs["core"]
+        if "dialect_obj" not in core:
+            from sqlfluff.core.dialects import dialect_selector
+
+            core["dialect_obj"] = dialect_selector(core.get("dialect"))
 
     @classmethod
     def from_root(
@@ -619,14 +644,26 @@ class FluffConfig:
             )
 
     def make_child_from_path(self, path: str) -> "FluffConfig":
-        """Make a new child config at a path but pass on overrides and extra_config_path."""
-        return self.from_path(
+        """Make a new child config at a path but pass on overrides and extra_config_path.
+
+        The child shares the plugin manager with this config, and also the
+        templater if it's unchanged and keeps no state read from its config
+        (see `RawTemplater.shared_by_child_configs`). The dialect is always shared because
+        expanded dialects are memoized by `dialect_selector`.
+        """
+        child = self.from_path(
             path,
             extra_config_path=self._extra_config_path,
             ignore_local_config=self._ignore_local_config,
             overrides=self._overrides,
             plugin_manager=self._plugin_manager,
         )
+        templater = self.get("templater_obj")
+        if child.get("templater") == self.get("templater") and getattr(
+            templater, "shared_by_child_configs", False
+        ):
+            child._configs["core"]["templater_obj"] = templater
+        return child
 
     def diff_to(self, other: "FluffConfig") -> dict:
         """Compare this config to another.
@@ -11,7 +11,7 @@ Within .dialects, each dialect is free to depend on other dialects as
 required. Any dependent dialects will be loaded as needed.
 """
 
-from typing import NamedTuple, Iterator, Any
+from typing import NamedTuple, Iterator, Any, Dict
 from importlib import import_module
 
 
@@ -35,6 +35,11 @@ _dialect_lookup = {
     "spark3": ("dialect_spark3", "spark3_dialect"),
 }
 
+# A process-wide registry of expanded dialects, keyed by label. Expansion
+# is expensive and the result is immutable, so it's only done once per
+# dialect and then shared between all the configs which use it.
+_expanded_dialects: Dict[str, Dialect] = {}
+
 _legacy_dialects = {
     "exasol_fs": (
         "As of 0.7.0 the 'exasol_fs' dialect has been combined with "
@@ -72,8 +77,15 @@ def dialect_readout() -> Iterator[DialectTuple]:
 
 
 def dialect_selector(s: str) -> Dialect:
-    """Return a dialect given its name."""
-    dialect = load_raw_dialect(s or "ansi")
-    # Expand any callable references at this point.
-    # NOTE: The result of .expand() is a new class.
-    return dialect.expand()
+    """Return a dialect given its name.
+
+    NOTE: The expanded dialect is memoized, so repeated calls
+    with the same label return the same (immutable) object.
+    """
+    label = s or "ansi"
+    if label not in _expanded_dialects:
+        dialect = load_raw_dialect(label)
+        # Expand any callable references at this point.
+        # NOTE: The result of .expand() is a new class.
+        _expanded_dialects[label] = dialect.expand()
+    return _expanded_dialects[label]
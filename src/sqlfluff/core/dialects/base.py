@@ -47,6 +47,11 @@ class Dialect:
     def __repr__(self):  # pragma: no cover
         return f"<Dialect: {self.name}>"
 
+    def _check_not_expanded(self):
+        """Expanded dialects are shared, and so must not be mutated."""
+        if self.expanded:
+            raise ValueError(f"Attempted to modify expanded dialect {self!r}.")
+
     def expand(self) -> "Dialect":
         """Expand any callable references to concrete ones.
 
@@ -139,6 +144,7 @@ class Dialect:
 
         def segment_wrap(cls):
             """Wrap a segment and register it against the dialect."""
+            self._check_not_expanded()
             n = cls.__name__
             if replace:
                 if n not in self._library:  # pragma: no cover
@@ -165,6 +171,7 @@ class Dialect:
         Note that multiple segments can be added in the same call as this method
         will iterate through the kwargs
         """
+        self._check_not_expanded()
         for n in kwargs:
             if n in self._library:  # pragma: no cover
                 raise ValueError(f"{n!r} is already registered in {self!r}")
@@ -175,6 +182,7 @@ class Dialect:
 
         Usage is very similar to add, but elements specified must already exist.
         """
+        self._check_not_expanded()
         for n in kwargs:
             if n not in self._library:  # pragma: no cover
                 raise ValueError(f"{n!r} is not already registered in {self!r}")
@@ -0,0 +1,166 @@
+"""Defines the LintCache class.
+
+This is a persistent, content-addressed store of linting results
+on disk. Results are keyed on the raw content of the file, the
+effective configuration used to lint it, the rules applied and the
+version of sqlfluff, so that unchanged files can skip templating,
+parsing and linting entirely on subsequent runs.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from typing import Iterable, List, Optional
+
+from sqlfluff.core.config import FluffConfig
+from sqlfluff.core.linter.linted_file import LintedFile
+
+# Import metadata (using importlib_metadata backport for python versions <3.8)
+if sys.version_info >= (3, 8):
+    from importlib import metadata
+else:  # pragma: no cover
+    import importlib_metadata as metadata
+
+# Instantiate the linter logger
+linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
+
+
+class LintCache:
+    """A size bounded on-disk cache of linting results.
+
+    Args:
+        cache_dir (:obj:`str`): The directory to store cached results in.
+            It will be created if it doesn't already exist.
+        max_size (:obj:`int`, optional): The maximum total size of the
+            cache in bytes. When exceeded, the least recently used entries
+            are evicted by :meth:`prune`.
+
+    NOTE: Only the content of the file being linted is part of the key,
+    not its path, so identical files share an entry. If a file
+    depends on *other* files (e.g. jinja macros loaded from a path)
+    then changes to those won't invalidate the cache.
+    """
+
+    file_ext = ".lint"
+    # Config values which don't affect the result of linting
+    # and so shouldn't invalidate the cache.
+    ignored_config = (
+        "cache_dir",
+        "cache_max_size",
+        "verbose",
+        "nocolor",
+        "color",
+        "output_line_length",
+    )
+
+    def __init__(self, cache_dir: str, max_size: int = 512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._version = metadata.version("sqlfluff")
+
+    def make_key(
+        self, raw: bytes, config: FluffConfig, rule_codes: Iterable[str]
+    ) -> str:
+        """Generate a cache key for a file.
+
+        Args:
+            raw (:obj:`bytes`): The raw content of the file. Any inline
+                config is contained within this.
+            config (:obj:`FluffConfig`): The effective config for the file.
+            rule_codes (iterable of :obj:`str`): The codes of the rules
+                which will be applied.
+        """
+        hasher = hashlib.sha256(raw)
+        hasher.update(self._version.encode())
+        hasher.update(config.get("dialect_obj").name.encode())
+        hasher.update(",".join(rule_codes).encode())
+        # The printable config excludes the dialect and templater objects,
+        # but includes everything else (including rule config).
+        config_repr = repr(
+            [
+                (idnt, key, val)
+                for idnt, key, val in config.iter_vals()
+                if key not in self.ignored_config
+            ]
+        )
+        hasher.update(config_repr.encode())
+        return hasher.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.file_ext)
+
+    def get(self, key: str) -> Optional[LintedFile]:
+        """Fetch a linted file from the cache, returning None if not present."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as cache_file:
+                linted_file = pickle.load(cache_file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as err:  # pragma: no cover
+            # A corrupt or incompatible entry, treat it as a miss.
+            linter_logger.info("Discarding unreadable cache entry %s: %s", path, err)
+            self.misses += 1
+            return None
+        # Touch the file so that eviction is least recently *used*.
+        os.utime(path)
+        self.hits += 1
+        return linted_file
+
+    def store(self, key: str, linted_file: LintedFile) -> None:
+        """Store a linted file in the cache.
+
+        We don't store the parse tree, or the timings. Only what's
+        required to report violations.
+        """
+        linted_file = linted_file._replace(tree=None, time_dict={}, rule_timings=None)
+        # Write to a temporary file first, so that concurrent runs
+        # never see a half written entry.
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            pickle.dump(linted_file, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp.name, self._path(key))
+
+    def _entries(self) -> List[os.DirEntry]:
+        return [
+            entry
+            for entry in os.scandir(self.cache_dir)
+            if entry.name.endswith(self.file_ext) and entry.is_file()
+        ]
+
+    def size(self) -> int:
+        """Return the total size of the cache in bytes."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def prune(self) -> int:
+        """Evict least recently used entries until under the size limit.
+
+        Returns:
+            :obj:`int`: The number of entries evicted.
+        """
+        entries = sorted(
+            ((entry.stat(), entry.path) for entry in self._entries()),
+            key=lambda elem: elem[0].st_mtime,
+        )
+        total = sum(stat.st_size for stat, _ in entries)
+        evicted = 0
+        for stat, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # pragma: no cover
+                pass
+            total -= stat.st_size
+            evicted += 1
+        if evicted:
+            linter_logger.info("Evicted %s entries from the lint cache.", evicted)
+        return evicted
@@ -11,6 +11,7 @@ import shutil
 import tempfile
 from typing import (
     Any,
+    Dict,
     Iterable,
     List,
     NamedTuple,
@@ -48,6 +49,8 @@ class LintedFile(NamedTuple):
     ignore_mask: List[NoQaDirective]
     templated_file: TemplatedFile
     encoding: str
+    # The time spent in each rule, and how many calls and fixes it made.
+    rule_timings: Optional[Dict[str, Dict[str, float]]] = None
 
     def check_tuples(self, raise_on_non_linting_violations=True) -> List[CheckTuple]:
         """Make a list of check_tuples.
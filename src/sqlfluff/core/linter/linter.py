@@ -1,11 +1,17 @@
 """Defines the linter class."""
 
+from collections import defaultdict, deque
 import fnmatch
+import hashlib
 import os
+import threading
 import time
 import logging
 from typing import (
     Any,
+    Callable,
+    Deque,
+    Dict,
     List,
     Sequence,
     Optional,
@@ -16,6 +22,7 @@ from typing import (
 )
 
 import pathspec
+from pathspec.pattern import RegexPattern
 import regex
 from tqdm import tqdm
 
@@ -27,16 +34,18 @@ from sqlfluff.core.errors import (
     SQLTemplaterSkipFile,
 )
 from sqlfluff.core.parser import Lexer, Parser
+from sqlfluff.core.parser.match_logging import LateBoundStringify
 from sqlfluff.core.file_helpers import get_encoding
 from sqlfluff.core.templaters import TemplatedFile
 from sqlfluff.core.rules import get_ruleset
 from sqlfluff.core.config import FluffConfig, ConfigLoader, progress_bar_configuration
+from sqlfluff.core.timing import RuleTimingSummary
 
 # Classes needed only for type checking
 from sqlfluff.core.parser.segments.base import BaseSegment
 from sqlfluff.core.parser.segments.meta import MetaSegment
 from sqlfluff.core.parser.segments.raw import RawSegment
-from sqlfluff.core.rules.base import BaseRule
+from sqlfluff.core.rules.base import BaseRule, RuleSet, crawl_rules
 
 from sqlfluff.core.linter.common import (
     RuleTuple,
@@ -44,9 +53,11 @@ from sqlfluff.core.linter.common import (
     NoQaDirective,
     RenderedFile,
 )
+from sqlfluff.core.linter.cache import LintCache
 from sqlfluff.core.linter.linted_file import LintedFile
 from sqlfluff.core.linter.linted_dir import LintedDir
 from sqlfluff.core.linter.linting_result import LintingResult
+from sqlfluff.core.linter.streaming import iter_statement_chunks
 
 
 WalkableType = Iterable[Tuple[str, Optional[List[str]], List[str]]]
@@ -60,6 +71,9 @@ class Linter:
 
     # Default to allowing process parallelism
     allow_process_parallelism = True
+    # The size (in characters) to aim for, for the chunks of large files
+    # which are linted in chunks. See `large_file_stream_size`.
+    stream_chunk_size = 8192
 
     def __init__(
         self,
@@ -84,15 +98,73 @@ class Linter:
         self.formatter = formatter
         # Store references to user rule classes
         self.user_rules = user_rules or []
+        # Set up the persistent lint cache if configured.
+        cache_dir = self.config.get("cache_dir")
+        self.lint_cache: Optional[LintCache] = (
+            LintCache(cache_dir, max_size=self.config.get("cache_max_size"))
+            if cache_dir
+            else None
+        )
+        # The rule set, with any user rules registered, once it's needed.
+        self._rule_set: Optional[RuleSet] = None
+        # The rules for the root config, once they're needed by `lint_strings`.
+        # Rules keep state on themselves while linting, so each thread (e.g.
+        # of a `MultiThreadRunner`) has rules of its own.
+        self._root_rules = threading.local()
+        # Whether to keep the worker pool of parallel runs between runs,
+        # and the pool itself (with the key it was created for).
+        self.keep_pool = False
+        self._pool: Any = None
+        self._pool_key: Any = None
+
+    def __enter__(self) -> "Linter":
+        """Keep the worker pool of parallel runs until exit.
+
+        Used as a context manager, the linter starts a worker pool the
+        first time it lints in parallel, and reuses it for every run after
+        that (e.g. each call of `lint_paths`) rather than starting a new
+        one each time. The workers keep their dialects and rules warm
+        between runs.
+        """
+        self.keep_pool = True
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.keep_pool = False
+        self.close_pool()
+
+    def get_pool(self, key: Any, create_pool: Callable[[], Any]) -> Any:
+        """Get the worker pool being kept, creating it if need be.
+
+        Args:
+            key: Identifies the kind of pool (e.g. the runner and number
+                of processes). If it doesn't match that of the pool being
+                kept, that pool is closed and a new one is created.
+            create_pool: Creates a new pool.
+        """
+        if self._pool is None or self._pool_key != key:
+            self.close_pool()
+            self._pool = create_pool()
+            self._pool_key = key
+        return self._pool
+
+    def close_pool(self) -> None:
+        """Shut down the worker pool being kept, if any."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+            self._pool_key = None
 
     def get_ruleset(self, config: Optional[FluffConfig] = None) -> List[BaseRule]:
         """Get hold of a set of rules."""
-        rs = get_ruleset()
-        # Register any user rules
-        for rule in self.user_rules:
-            rs.register(rule)
+        if self._rule_set is None:
+            rs = get_ruleset()
+            # Register any user rules
+            for rule in self.user_rules:
+                rs.register(rule)
+            self._rule_set = rs
         cfg = config or self.config
-        return rs.get_rulelist(config=cfg)
+        return self._rule_set.get_rulelist(config=cfg)
 
     def rule_tuples(self) -> List[RuleTuple]:
         """A simple pass through to access the rule tuples of the rule set."""
@@ -116,6 +188,23 @@ class Linter:
         # Return the raw file and config
         return raw_file, file_config, encoding
 
+    @staticmethod
+    def _load_config_for_streaming(
+        fname: str, root_config: FluffConfig
+    ) -> Tuple[FluffConfig, str]:
+        """Load the config for a file, without holding the whole file.
+
+        This is the equivalent of `_load_raw_file_and_config` for files
+        which are linted in chunks, so only reads a line at a time.
+        """
+        file_config = root_config.make_child_from_path(fname)
+        encoding = get_encoding(fname=fname, config=file_config)
+        with open(fname, encoding=encoding, errors="backslashreplace") as target_file:
+            for line in target_file:
+                # Scan each line for config commands.
+                file_config.process_raw_file_for_config(line)
+        return file_config, encoding
+
     @staticmethod
     def _normalise_newlines(string: str) -> str:
         """Normalise newlines to unix-style line endings."""
@@ -209,8 +298,8 @@ class Linter:
             return None, violations
 
         if parsed:
-            linter_logger.info("\n###\n#\n# {}\n#\n###".format("Parsed Tree:"))
-            linter_logger.info("\n" + parsed.stringify())
+            linter_logger.info("\n###\n#\n# Parsed Tree:\n#\n###")
+            linter_logger.info("\n%s", LateBoundStringify(parsed))
             # We may succeed parsing, but still have unparsable segments. Extract them here.
             for unparsable in parsed.iter_unparsables():
                 # No exception has been raised explicitly, but we still create one here
@@ -227,7 +316,7 @@ class Linter:
                     )
                 )
                 linter_logger.info("Found unparsable segment...")
-                linter_logger.info(unparsable.stringify())
+                linter_logger.info("%s", LateBoundStringify(unparsable))
         return parsed, violations
 
     @staticmethod
@@ -325,6 +414,11 @@ class Linter:
                 result.append(e)
         return result
 
+    @staticmethod
+    def _hash_raw(raw: str) -> bytes:
+        """Hash the raw content of a tree, for detecting fix loops."""
+        return hashlib.blake2b(raw.encode("utf8"), digest_size=16).digest()
+
     @staticmethod
     def _warn_unfixable(code: str):
         linter_logger.warning(
@@ -425,14 +519,28 @@ class Linter:
         fname: Optional[str] = None,
         templated_file: Optional[TemplatedFile] = None,
         formatter: Any = None,
+        rule_timings: Optional[Dict[str, Dict[str, float]]] = None,
     ) -> Tuple[BaseSegment, List[SQLBaseError], List[NoQaDirective]]:
-        """Lint and optionally fix a tree object."""
+        """Lint and optionally fix a tree object.
+
+        If `rule_timings` is given, the time spent in each rule (and how
+        many times it was evaluated and how many fixes it found) is
+        added to it, keyed by rule code.
+        """
         # Keep track of the linting errors
         all_linting_errors = []
         # A placeholder for the fixes we had on the previous loop
         last_fixes = None
-        # Keep a set of previous versions to catch infinite loops.
-        previous_versions = {tree.raw}
+        # Keep a set of hashes of previous versions to catch infinite loops.
+        # We only keep the hashes, so that we don't hold a copy of the whole
+        # file for each version.
+        previous_versions = {cls._hash_raw(tree.raw)}
+        # Count the versions of the tree as fixes are applied, and keep track
+        # of the version where each rule last found nothing to fix. Rules
+        # are deterministic, so if the tree hasn't changed since then, they
+        # don't need to crawl it again.
+        tree_version = 0
+        clean_versions: Dict[str, int] = {}
 
         # If we are fixing then we want to loop up to the runaway_limit, otherwise just once for linting.
         loop_limit = config.get("runaway_limit") if fix else 1
@@ -452,6 +560,21 @@ class Linter:
         for loop in range(loop_limit):
             changed = False
 
+            if not fix:
+                # If we're not fixing, the tree doesn't change between rules
+                # so we can crawl it once for all of them.
+                crawl_results = iter(
+                    crawl_rules(
+                        rule_set,
+                        tree,
+                        ignore_mask=ignore_buff,
+                        dialect=config.get("dialect_obj"),
+                        fname=fname,
+                        templated_file=templated_file,
+                        rule_timings=rule_timings,
+                    )
+                )
+
             progress_bar_crawler = tqdm(
                 rule_set,
                 desc="lint by rules",
@@ -462,22 +585,39 @@ class Linter:
             for crawler in progress_bar_crawler:
                 progress_bar_crawler.set_description(f"rule {crawler.code}")
 
+                if fix and clean_versions.get(crawler.code) == tree_version:
+                    # Nothing has changed since this rule last found
+                    # nothing to fix, so there's nothing new to find.
+                    linter_logger.debug(
+                        "Skipping %s, the tree is unchanged since it last ran.",
+                        crawler.code,
+                    )
+                    continue
+
                 # fixes should be a dict {} with keys edit, delete, create
                 # delete is just a list of segments to delete
                 # edit and create are list of tuples. The first element is the
                 # "anchor", the segment to look for either to edit or to insert BEFORE.
                 # The second is the element to insert or create.
-                linting_errors, _, fixes, _ = crawler.crawl(
-                    tree,
-                    ignore_mask=ignore_buff,
-                    dialect=config.get("dialect_obj"),
-                    fname=fname,
-                    templated_file=templated_file,
-                )
+                if fix:
+                    # Fixes from each rule are applied before the next rule
+                    # is crawled, so each rule needs its own pass of the tree.
+                    linting_errors, _, fixes, _ = crawler.crawl(
+                        tree,
+                        ignore_mask=ignore_buff,
+                        dialect=config.get("dialect_obj"),
+                        fname=fname,
+                        templated_file=templated_file,
+                        rule_timings=rule_timings,
+                    )
+                else:
+                    linting_errors, fixes = next(crawl_results)
                 all_linting_errors += linting_errors
 
-                if fix and fixes:
-                    linter_logger.info(f"Applying Fixes [{crawler.code}]: {fixes}")
+                if fix and not fixes:
+                    clean_versions[crawler.code] = tree_version
+                elif fix and fixes:
+                    linter_logger.info("Applying Fixes [%s]: %s", crawler.code, fixes)
                     # Do some sanity checks on the fixes before applying.
                     if fixes == last_fixes:  # pragma: no cover
                         cls._warn_unfixable(crawler.code)
@@ -485,10 +625,12 @@ class Linter:
                         last_fixes = fixes
                         new_tree, _ = tree.apply_fixes(fixes)
                         # Check for infinite loops
-                        if new_tree.raw not in previous_versions:
+                        new_hash = cls._hash_raw(new_tree.raw)
+                        if new_hash not in previous_versions:
                             # We've not seen this version of the file so far. Continue.
                             tree = new_tree
-                            previous_versions.add(tree.raw)
+                            tree_version += 1
+                            previous_versions.add(new_hash)
                             changed = True
                             continue
                         else:
@@ -527,6 +669,7 @@ class Linter:
         """Lint a ParsedString and return a LintedFile."""
         violations = parsed.violations
         time_dict = parsed.time_dict
+        rule_timings: Dict[str, Dict[str, float]] = {}
         tree: Optional[BaseSegment]
         if parsed.tree:
             t0 = time.monotonic()
@@ -539,6 +682,7 @@ class Linter:
                 fname=parsed.fname,
                 templated_file=parsed.templated_file,
                 formatter=formatter,
+                rule_timings=rule_timings,
             )
             # Update the timing dict
             time_dict["linting"] = time.monotonic() - t0
@@ -563,6 +707,7 @@ class Linter:
             ignore_mask=ignore_buff,
             templated_file=parsed.templated_file,
             encoding=encoding,
+            rule_timings=rule_timings,
         )
 
         # This is the main command line output from linting.
@@ -598,6 +743,105 @@ class Linter:
             encoding=rendered.encoding,
         )
 
+    @classmethod
+    def lint_streamed_file(
+        cls,
+        fname: str,
+        config: FluffConfig,
+        encoding: str,
+        rule_set: List[BaseRule],
+        formatter: Any = None,
+    ) -> LintedFile:
+        """Lint a large file in chunks of statements, and return a LintedFile.
+
+        Each chunk is templated, parsed and linted on its own, and then
+        the positions of its violations (and noqa directives) are mapped
+        back to the whole file. Only one chunk is parsed at a time, so the
+        LintedFile has no tree and can't be used for fixing.
+
+        Rules which check the start (or end) of the file are only applied
+        to the first (or last) chunk, so that each chunk boundary doesn't
+        look like the start or end of a file.
+
+        Files are only split in dialects whose files are split into
+        statements by their root segment (see `statement_delimiters`).
+        Otherwise they're linted in one chunk.
+
+        The templater renders each chunk separately, so jinja variables,
+        imports and macros defined at the top level of one chunk aren't
+        available in later chunks.
+
+        The config should come from `_load_config_for_streaming`.
+        """
+        violations: List[SQLBaseError] = []
+        ignore_mask: List[NoQaDirective] = []
+        time_dict: Dict[str, float] = {}
+        rule_timing = RuleTimingSummary()
+        templater = config.get("templater_obj")
+        dialect = config.get("dialect_obj")
+        with open(fname, encoding=encoding, errors="backslashreplace") as target_file:
+            if dialect.get_root_segment().statement_delimiters:
+                chunks = iter_statement_chunks(
+                    target_file, chunk_size=cls.stream_chunk_size, dialect=dialect.name
+                )
+            else:
+                # The file can't be split into statements in this dialect
+                # (e.g. tsql), so lint it as a whole.
+                linter_logger.info(
+                    "Dialect %s can't be linted in chunks. Linting %s as a whole.",
+                    dialect.name,
+                    fname,
+                )
+                chunks = iter([(0, target_file.read())])
+            next_chunk = next(chunks, None)
+            first = True
+            while next_chunk:
+                line_offset, chunk = next_chunk
+                # Look ahead, so that we know whether this is the last chunk.
+                next_chunk = next(chunks, None)
+                chunk_rule_set = [
+                    rule
+                    for rule in rule_set
+                    if (first or not rule.checks_file_start)
+                    and (not next_chunk or not rule.checks_file_end)
+                ]
+                first = False
+                linter_logger.info(
+                    "Linting chunk of %s from line %s", fname, line_offset + 1
+                )
+                rendered = cls._render_string_with(
+                    templater, chunk, fname, config, encoding
+                )
+                linted_chunk = cls.lint_parsed(
+                    cls.parse_rendered(rendered), chunk_rule_set, encoding=encoding
+                )
+                # Map the positions in the chunk back to the file.
+                for violation in linted_chunk.violations:
+                    if violation.line_no:
+                        violation.line_no += line_offset
+                    violations.append(violation)
+                ignore_mask += [
+                    directive._replace(line_no=directive.line_no + line_offset)
+                    for directive in linted_chunk.ignore_mask
+                ]
+                for step, step_time in linted_chunk.time_dict.items():
+                    time_dict[step] = time_dict.get(step, 0.0) + step_time
+                rule_timing.add(linted_chunk.rule_timings or {})
+
+        linted_file = LintedFile(
+            fname,
+            violations,
+            time_dict,
+            None,
+            ignore_mask=ignore_mask,
+            templated_file=TemplatedFile(source_str="", fname=fname),
+            encoding=encoding,
+            rule_timings=rule_timing.summary(),
+        )
+        if formatter:
+            formatter.dispatch_file_violations(fname, linted_file, only_fixable=False)
+        return linted_file
+
     # ### Instance Methods
     # These are tied to a specific instance and so are not necessarily
     # safe to use in parallel operations.
@@ -606,16 +850,6 @@ class Linter:
         self, in_str: str, fname: str, config: FluffConfig, encoding: str
     ) -> RenderedFile:
         """Template the file."""
-        linter_logger.info("TEMPLATING RAW [%s] (%s)", self.templater.name, fname)
-
-        # Start the templating timer
-        t0 = time.monotonic()
-
-        # Newlines are normalised to unix-style line endings (\n).
-        # The motivation is that Jinja normalises newlines during templating and
-        # we want consistent mapping between the raw and templated slices.
-        in_str = self._normalise_newlines(in_str)
-
         if not config.get("templater_obj") == self.templater:
             linter_logger.warning(
                 (
@@ -625,9 +859,34 @@ class Linter:
                     "docs for more details."
                 )
             )
+        return self._render_string_with(
+            self.templater, in_str, fname, config, encoding, formatter=self.formatter
+        )
+
+    @classmethod
+    def _render_string_with(
+        cls,
+        templater,
+        in_str: str,
+        fname: str,
+        config: FluffConfig,
+        encoding: str,
+        formatter: Any = None,
+    ) -> RenderedFile:
+        """Template the file, with a given templater."""
+        linter_logger.info("TEMPLATING RAW [%s] (%s)", templater.name, fname)
+
+        # Start the templating timer
+        t0 = time.monotonic()
+
+        # Newlines are normalised to unix-style line endings (\n).
+        # The motivation is that Jinja normalises newlines during templating and
+        # we want consistent mapping between the raw and templated slices.
+        in_str = cls._normalise_newlines(in_str)
+
         try:
-            templated_file, templater_violations = self.templater.process(
-                in_str=in_str, fname=fname, config=config, formatter=self.formatter
+            templated_file, templater_violations = templater.process(
+                in_str=in_str, fname=fname, config=config, formatter=formatter
             )
         except SQLTemplaterSkipFile as s:  # pragma: no cover
             linter_logger.warning(str(s))
@@ -755,6 +1014,62 @@ class Linter:
             encoding=encoding,
         )
 
+    def lint_string_with_root_config(
+        self,
+        in_str: str,
+        fname: str = "<string input>",
+        fix: bool = False,
+        formatter: Any = None,
+    ) -> LintedFile:
+        """Lint a string with the root config, without changing it.
+
+        Unlike `lint_string`, the rules for the root config are only set
+        up once (in each thread), and reused for every string linted this
+        way. A string with inline config gets a config (and rules) of its
+        own, so that its config doesn't carry over to other strings.
+        """
+        if any(line.startswith("-- sqlfluff") for line in in_str.splitlines()):
+            config = self.config.make_child_from_path(os.getcwd())
+            config.process_raw_file_for_config(in_str)
+            rule_set = self.get_ruleset(config=config)
+        else:
+            config = self.config
+            rule_set = getattr(self._root_rules, "rule_set", None)
+            if rule_set is None:
+                rule_set = self.get_ruleset(config=config)
+                self._root_rules.rule_set = rule_set
+        rendered = self.render_string(in_str, fname, config, "utf8")
+        return self.lint_rendered(rendered, rule_set, fix, formatter)
+
+    def lint_strings(
+        self,
+        strings: Iterable[Tuple[str, str]],
+        fix: bool = False,
+        processes: int = 1,
+    ) -> Iterator[LintedFile]:
+        """Lint an iterable of (string, name) pairs.
+
+        The config and rules are only set up once (in each process) for
+        the whole batch, and the strings are linted as they're read, so
+        `strings` can be a generator. When linting in parallel, results
+        come back in the order they're ready rather than the order of
+        `strings`, so use the `path` of each LintedFile (the name it
+        was given) to match them up.
+
+        Returns:
+            An iterator of :obj:`LintedFile`, one for each string.
+        """
+        # to avoid circular import
+        from sqlfluff.core.linter.runner import get_runner
+
+        runner = get_runner(
+            self,
+            self.config,
+            processes=processes,
+            allow_process_parallelism=self.allow_process_parallelism,
+        )
+        return runner.run_strings(strings, fix)
+
     def paths_from_path(
         self,
         path: str,
@@ -809,9 +1124,9 @@ class Linter:
             ]
             path_walk: WalkableType = [(dirpath, None, files)] + path_walk_ignore_file
         else:
-            path_walk = os.walk(path)
+            # If it's a directory then expand the path!
+            return self._paths_from_dir(path, ignore_file_name, ignore_files)
 
-        # If it's a directory then expand the path!
         buffer = []
         ignores = {}
         for dirpath, _, filenames in path_walk:
@@ -850,19 +1165,18 @@ class Linter:
                     os.path.relpath(abs_fpath, abs_ignore_base)
                 ):
                     # This file is ignored, skip it.
-                    if is_exact_file:
-                        linter_logger.warning(
-                            "Exact file path %s was given but "
-                            "it was ignored by a %s pattern in %s, "
-                            "re-run with `--disregard-sqlfluffignores` to "
-                            "skip %s"
-                            % (
-                                path,
-                                ignore_file_name,
-                                ignore_base,
-                                ignore_file_name,
-                            )
+                    linter_logger.warning(
+                        "Exact file path %s was given but "
+                        "it was ignored by a %s pattern in %s, "
+                        "re-run with `--disregard-sqlfluffignores` to "
+                        "skip %s"
+                        % (
+                            path,
+                            ignore_file_name,
+                            ignore_base,
+                            ignore_file_name,
                         )
+                    )
                     break
             else:
                 filtered_buffer.append(os.path.normpath(fpath))
@@ -870,6 +1184,74 @@ class Linter:
         # Return
         return sorted(filtered_buffer)
 
+    def _paths_from_dir(
+        self, path: str, ignore_file_name: str, ignore_files: bool
+    ) -> List[str]:
+        """Return the sql file paths in a directory, skipping those ignored.
+
+        Ignore files are applied while walking the directory, so that
+        we don't walk directories which are ignored at all. Each directory
+        gets the specs of the ignore files in it and its parents, with
+        its path relative to each of theirs, so that paths are matched
+        without having to resolve them.
+        """
+        sql_file_exts = self.config.get("sql_file_exts", default=".sql").split(",")
+        buffer = []
+        # The ignore specs which apply to each directory still to be walked,
+        # with the path of the directory relative to the ignore file, and
+        # the negated patterns of the spec (which can include files again).
+        dir_ignores: Dict[str, List[Tuple[pathspec.PathSpec, str, List[Any]]]] = {
+            path: []
+        }
+        for dirpath, dirnames, filenames in os.walk(path):
+            ignores = dir_ignores.pop(dirpath)
+            if ignore_files and ignore_file_name in filenames:
+                with open(os.path.join(dirpath, ignore_file_name)) as fh:
+                    spec = pathspec.PathSpec.from_lines("gitwildmatch", fh)
+                negations = [
+                    regex.compile(pattern.regex.pattern)
+                    for pattern in spec.patterns
+                    if isinstance(pattern, RegexPattern)
+                    and pattern.regex
+                    and pattern.include is False
+                ]
+                ignores = ignores + [(spec, "", negations)]
+
+            for fname in filenames:
+                if ignore_files and fname == ignore_file_name:
+                    continue
+                if not any(fname.endswith(ext) for ext in sql_file_exts):
+                    continue
+                if any(
+                    spec.match_file(rel_dir + fname) for spec, rel_dir, _ in ignores
+                ):
+                    continue
+                fpath = os.path.join(dirpath, fname)
+                buffer.append(os.path.normpath(fpath) if ignore_files else fpath)
+
+            # Prune ignored directories in place, so os.walk skips them. A
+            # directory which matches a spec is only skipped if none of the
+            # negated patterns of the spec could match a file in it.
+            walked_dirnames = []
+            for dirname in dirnames:
+                if any(
+                    spec.match_file(rel_dir + dirname + "/")
+                    and not any(
+                        negation.match(rel_dir + dirname + "/", partial=True)
+                        for negation in negations
+                    )
+                    for spec, rel_dir, negations in ignores
+                ):
+                    continue
+                walked_dirnames.append(dirname)
+                dir_ignores[os.path.join(dirpath, dirname)] = [
+                    (spec, rel_dir + dirname + "/", negations)
+                    for spec, rel_dir, negations in ignores
+                ]
+            dirnames[:] = walked_dirnames
+
+        return sorted(buffer)
+
     def lint_string_wrapped(
         self,
         string: str,
@@ -884,17 +1266,35 @@ class Linter:
         result.stop_timer()
         return result
 
-    def lint_path(
+    def _lint_cache_key(self, fname: str) -> str:
+        """Generate the key for a file in the lint cache."""
+        file_config = self.config.make_child_from_path(fname)
+        with open(fname, "rb") as target_file:
+            raw = target_file.read()
+        rule_codes = [rule.code for rule in self.get_ruleset(config=file_config)]
+        return cast(LintCache, self.lint_cache).make_key(raw, file_config, rule_codes)
+
+    def _find_files_to_lint(
         self,
         path: str,
         fix: bool = False,
         ignore_non_existent_files: bool = False,
         ignore_files: bool = True,
-        processes: int = 1,
-    ) -> LintedDir:
-        """Lint a path."""
+        dispatch: bool = True,
+    ) -> Tuple[LintedDir, List[str], Dict[str, str]]:
+        """Find the files in a path which need linting.
+
+        If `dispatch` is False, the path and the results from the lint
+        cache aren't dispatched to the formatter, so that they can be
+        dispatched along with the rest of the path's results later.
+
+        Returns:
+            A tuple of the LintedDir for the path (which already holds
+            any results from the lint cache), the files which still need
+            linting, and the lint cache keys of those files.
+        """
         linted_path = LintedDir(path)
-        if self.formatter:
+        if self.formatter and dispatch:
             self.formatter.dispatch_path(path)
         fnames = list(
             self.paths_from_path(
@@ -904,8 +1304,49 @@ class Linter:
             )
         )
 
+        # Check the lint cache for any files we've linted before. We
+        # never use the cache when fixing, because we need the tree.
+        cache_keys: Dict[str, str] = {}
+        if self.lint_cache and not fix:
+            uncached_fnames = []
+            for fname in fnames:
+                cache_key = self._lint_cache_key(fname)
+                cached_file = self.lint_cache.get(cache_key)
+                if cached_file:
+                    linter_logger.info("Using cached lint result for %s", fname)
+                    # The entry may have been stored by an identical file
+                    # at another path.
+                    cached_file = cached_file._replace(path=fname)
+                    if self.formatter and dispatch:
+                        self.formatter.dispatch_file_violations(
+                            fname, cached_file, only_fixable=fix
+                        )
+                    linted_path.add(cached_file)
+                else:
+                    cache_keys[fname] = cache_key
+                    uncached_fnames.append(fname)
+            fnames = uncached_fnames
+        return linted_path, fnames, cache_keys
+
+    def _lint_files(
+        self,
+        files: List[Tuple[str, LintedDir]],
+        cache_keys: Dict[str, str],
+        fix: bool = False,
+        processes: int = 1,
+        dispatch_dirs: Optional[List[LintedDir]] = None,
+    ) -> None:
+        """Lint files in one run, adding each to its LintedDir.
+
+        If `dispatch_dirs` is given, the results are dispatched to the
+        formatter by path, in the order of those LintedDirs, so the output
+        of several paths linted in parallel is still grouped by path. The
+        results of the first path with files still to lint are dispatched
+        (after its path) as they come in. Those of the paths after it are
+        held back until it's done.
+        """
         # to avoid circular import
-        from sqlfluff.core.linter.runner import get_runner
+        from sqlfluff.core.linter.runner import get_runner, ParallelRunner
 
         runner = get_runner(
             self,
@@ -913,6 +1354,25 @@ class Linter:
             processes=processes,
             allow_process_parallelism=self.allow_process_parallelism,
         )
+        # The LintedDirs still to dispatch, how many files each has left to
+        # lint, and how many files of each have been dispatched so far.
+        pending_dirs: Deque[LintedDir] = deque()
+        files_left: Dict[LintedDir, int] = {}
+        files_dispatched: Dict[LintedDir, int] = {}
+        if dispatch_dirs is not None:
+            assert isinstance(runner, ParallelRunner)
+            runner.dispatch_violations = False
+            pending_dirs.extend(dispatch_dirs)
+            files_left = {linted_dir: 0 for linted_dir in dispatch_dirs}
+            for _, linted_dir in files:
+                files_left[linted_dir] += 1
+
+        fnames = [fname for fname, _ in files]
+        # Results may come back in any order, so look up where each goes.
+        # NB: The same file can be in more than one path.
+        linted_dirs: Dict[str, Deque[LintedDir]] = defaultdict(deque)
+        for fname, linted_dir in files:
+            linted_dirs[fname].append(linted_dir)
 
         # Show files progress bar only when there is more than one.
         files_count = len(fnames)
@@ -923,8 +1383,21 @@ class Linter:
             disable=files_count <= 1 or progress_bar_configuration.disable_progress_bar,
         )
 
-        for i, linted_file in enumerate(runner.run(fnames, fix), start=1):
-            linted_path.add(linted_file)
+        self._dispatch_linted_dirs(pending_dirs, files_left, files_dispatched, fix)
+        # NB: Don't start a pool if every file came from the lint cache.
+        linted_files = runner.run(fnames, fix) if fnames else ()
+        for i, linted_file in enumerate(linted_files, start=1):
+            linted_dir = linted_dirs[linted_file.path].popleft()
+            linted_dir.add(linted_file)
+            if pending_dirs:
+                files_left[linted_dir] -= 1
+                self._dispatch_linted_dirs(
+                    pending_dirs, files_left, files_dispatched, fix
+                )
+            if linted_file.path in cache_keys:
+                cast(LintCache, self.lint_cache).store(
+                    cache_keys[linted_file.path], linted_file
+                )
             # If any fatal errors, then stop iteration.
             if any(v.fatal for v in linted_file.violations):  # pragma: no cover
                 linter_logger.error("Fatal linting error. Halting further linting.")
@@ -940,6 +1413,63 @@ class Linter:
                     f"file {os.path.basename(fnames[i])}"
                 )
 
+        # Files which failed to lint (or weren't reached after a fatal
+        # error) never come back, so dispatch whatever's left.
+        files_left.clear()
+        self._dispatch_linted_dirs(pending_dirs, files_left, files_dispatched, fix)
+
+    def _dispatch_linted_dirs(
+        self,
+        pending_dirs: Deque[LintedDir],
+        files_left: Dict[LintedDir, int],
+        files_dispatched: Dict[LintedDir, int],
+        fix: bool = False,
+    ) -> None:
+        """Dispatch what we can of the LintedDirs at the front of the queue.
+
+        The first LintedDir in the queue has its path dispatched, and then
+        any of its files which haven't been yet. Once it has no files left
+        to lint (or isn't in `files_left` at all), it's removed from the
+        queue, and the same goes for the next one.
+        """
+        while pending_dirs:
+            linted_dir = pending_dirs[0]
+            if linted_dir not in files_dispatched:
+                files_dispatched[linted_dir] = 0
+                if self.formatter:
+                    self.formatter.dispatch_path(linted_dir.path)
+            new_files = linted_dir.files[files_dispatched[linted_dir] :]
+            files_dispatched[linted_dir] += len(new_files)
+            if self.formatter:
+                for linted_file in new_files:
+                    self.formatter.dispatch_file_violations(
+                        linted_file.path, linted_file, only_fixable=fix
+                    )
+            if files_left.get(linted_dir):
+                break
+            pending_dirs.popleft()
+
+    def lint_path(
+        self,
+        path: str,
+        fix: bool = False,
+        ignore_non_existent_files: bool = False,
+        ignore_files: bool = True,
+        processes: int = 1,
+    ) -> LintedDir:
+        """Lint a path."""
+        linted_path, fnames, cache_keys = self._find_files_to_lint(
+            path,
+            fix=fix,
+            ignore_non_existent_files=ignore_non_existent_files,
+            ignore_files=ignore_files,
+        )
+        self._lint_files(
+            [(fname, linted_path) for fname in fnames],
+            cache_keys,
+            fix=fix,
+            processes=processes,
+        )
         return linted_path
 
     def lint_paths(
@@ -950,7 +1480,13 @@ class Linter:
         ignore_files: bool = True,
         processes: int = 1,
     ) -> LintingResult:
-        """Lint an iterable of paths."""
+        """Lint an iterable of paths.
+
+        When linting in parallel, the files in all the paths are linted
+        in one run, so that they share one pool and can be scheduled
+        together. Otherwise each path is linted in turn. Either way, the
+        output for each path is dispatched together, in path order.
+        """
         paths_count = len(paths)
 
         # If no paths specified - assume local
@@ -965,23 +1501,53 @@ class Linter:
             leave=False,
             disable=paths_count <= 1 or progress_bar_configuration.disable_progress_bar,
         )
+        files: List[Tuple[str, LintedDir]] = []
+        linted_paths: List[LintedDir] = []
+        cache_keys: Dict[str, str] = {}
         for path in paths:
             progress_bar_paths.set_description(f"path {path}")
 
-            # Iterate through files recursively in the specified directory (if it's a directory)
-            # or read the file directly if it's not
-            result.add(
-                self.lint_path(
+            if processes > 1:
+                # Just find the files for now, and lint them all together.
+                linted_path, fnames, path_cache_keys = self._find_files_to_lint(
                     path,
                     fix=fix,
                     ignore_non_existent_files=ignore_non_existent_files,
                     ignore_files=ignore_files,
-                    processes=processes,
+                    dispatch=False,
+                )
+                files += [(fname, linted_path) for fname in fnames]
+                cache_keys.update(path_cache_keys)
+                linted_paths.append(linted_path)
+                result.add(linted_path)
+            else:
+                # Iterate through files recursively in the specified directory (if it's a directory)
+                # or read the file directly if it's not
+                result.add(
+                    self.lint_path(
+                        path,
+                        fix=fix,
+                        ignore_non_existent_files=ignore_non_existent_files,
+                        ignore_files=ignore_files,
+                        processes=processes,
+                    )
                 )
-            )
 
             progress_bar_paths.update(1)
 
+        if linted_paths:
+            self._lint_files(
+                files,
+                cache_keys,
+                fix=fix,
+                processes=processes,
+                dispatch_dirs=linted_paths,
+            )
+
+        # Keep the lint cache within its size limit.
+        if self.lint_cache:
+            self.lint_cache.prune()
+
         result.stop_timer()
         return result
 
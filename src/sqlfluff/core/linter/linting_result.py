@@ -15,7 +15,7 @@ from sqlfluff.core.errors import (
     CheckTuple,
 )
 
-from sqlfluff.core.timing import TimingSummary
+from sqlfluff.core.timing import RuleTimingSummary, TimingSummary
 
 # Classes needed only for type checking
 from sqlfluff.core.parser.segments.base import BaseSegment
@@ -133,13 +133,25 @@ class LintingResult:
         all_stats["status"] = "FAIL" if all_stats["violations"] > 0 else "PASS"
         return all_stats
 
-    def timing_summary(self) -> Dict[str, Dict[str, float]]:
-        """Return a timing summary."""
+    def timing_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Return a timing summary.
+
+        This has an entry for each step (e.g. ``parsing``), and if any
+        rules were run, a ``rules`` entry with the total time, calls
+        and fixes for each rule, with the slowest rules first.
+        """
         timing = TimingSummary()
+        rule_timing = RuleTimingSummary()
         for dir in self.paths:
             for file in dir.files:
                 timing.add(file.time_dict)
-        return timing.summary()
+                if file.rule_timings:
+                    rule_timing.add(file.rule_timings)
+        summary: Dict[str, Dict[str, Any]] = timing.summary()
+        rule_summary = rule_timing.summary()
+        if rule_summary:
+            summary["rules"] = rule_summary
+        return summary
 
     def as_records(self) -> List[dict]:
         """Return the result as a list of dictionaries.
@@ -8,19 +8,24 @@ Implements various runner types for SQLFluff:
 """
 from abc import ABC
 import bdb
+import contextlib
 import functools
 import logging
 import multiprocessing.dummy
+import os
 import signal
 import sys
 import traceback
-from typing import Callable, List, Tuple, Iterator
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Iterator
 
 from sqlfluff.core import FluffConfig, Linter
 from sqlfluff.core.linter import LintedFile
 
 linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
 
+# The linter of each worker process, set up by `MultiProcessRunner._init_global`.
+_worker_linter: Optional[Linter] = None
+
 
 class BaseRunner(ABC):
     """Base runner class."""
@@ -35,12 +40,21 @@ class BaseRunner(ABC):
 
     pass_formatter = True
 
-    def iter_rendered(self, fnames: List[str]) -> Iterator[Tuple]:
-        """Iterate through rendered files ready for linting."""
+    def iter_rendered(self, fnames: List[str], fix: bool = False) -> Iterator[Tuple]:
+        """Iterate through rendered files ready for linting.
+
+        Files larger than `large_file_stream_size` are linted in chunks
+        rather than rendered all at once, so for those (unless fixing)
+        we yield None rather than a RenderedFile.
+        """
+        stream_size = self.config.get("large_file_stream_size")
         for fname in self.linter.templater.sequence_files(
             fnames, config=self.config, formatter=self.linter.formatter
         ):
-            yield fname, self.linter.render_file(fname, self.config)
+            if stream_size and not fix and os.path.getsize(fname) > stream_size:
+                yield fname, None
+            else:
+                yield fname, self.linter.render_file(fname, self.config)
 
     def iter_partials(
         self,
@@ -51,7 +65,23 @@ class BaseRunner(ABC):
 
         Generates filenames and objects which return LintedFiles.
         """
-        for fname, rendered in self.iter_rendered(fnames):
+        for fname, rendered in self.iter_rendered(fnames, fix=fix):
+            if rendered is None:
+                config, encoding = self.linter._load_config_for_streaming(
+                    fname, self.config
+                )
+                yield (
+                    fname,
+                    functools.partial(
+                        self.linter.lint_streamed_file,
+                        fname,
+                        config,
+                        encoding,
+                        self.linter.get_ruleset(config=config),
+                        self.linter.formatter if self.pass_formatter else None,
+                    ),
+                )
+                continue
             # Generate a fresh ruleset
             rule_set = self.linter.get_ruleset(config=rendered.config)
             yield (
@@ -67,12 +97,38 @@ class BaseRunner(ABC):
                 ),
             )
 
+    def iter_string_partials(
+        self,
+        strings: Iterable[Tuple[str, str]],
+        fix: bool = False,
+    ) -> Iterator[Tuple[str, Callable]]:
+        """Iterate through partials for linted strings.
+
+        Generates names and objects which return LintedFiles, for an
+        iterable of (string, name) pairs.
+        """
+        for in_str, fname in strings:
+            yield (
+                fname,
+                functools.partial(
+                    self.linter.lint_string_with_root_config,
+                    in_str,
+                    fname,
+                    fix,
+                    self.linter.formatter if self.pass_formatter else None,
+                ),
+            )
+
     def run(self, fnames: List[str], fix: bool):
         """Run linting on the specified list of files."""
         raise NotImplementedError  # pragma: no cover
 
+    def run_strings(self, strings: Iterable[Tuple[str, str]], fix: bool):
+        """Run linting on the specified (string, name) pairs."""
+        raise NotImplementedError  # pragma: no cover
+
     @classmethod
-    def _init_global(cls, config):
+    def _init_global(cls, config, user_rules=None):
         """Initializes any global state.
 
         May be overridden by subclasses to apply global configuration, initialize
@@ -98,7 +154,18 @@ class SequentialRunner(BaseRunner):
 
     def run(self, fnames: List[str], fix: bool) -> Iterator[LintedFile]:
         """Sequential implementation."""
-        for fname, partial in self.iter_partials(fnames, fix=fix):
+        return self._run_partials(self.iter_partials(fnames, fix=fix))
+
+    def run_strings(
+        self, strings: Iterable[Tuple[str, str]], fix: bool
+    ) -> Iterator[LintedFile]:
+        """Sequential implementation for strings."""
+        return self._run_partials(self.iter_string_partials(strings, fix=fix))
+
+    def _run_partials(
+        self, partials: Iterator[Tuple[str, Callable]]
+    ) -> Iterator[LintedFile]:
+        for fname, partial in partials:
             try:
                 yield partial()
             except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
@@ -115,29 +182,112 @@ class ParallelRunner(BaseRunner):
     # Don't pass the formatter in a parallel world, they
     # don't pickle well.
     pass_formatter = False
+    # Whether to dispatch each file's violations as it comes back from
+    # the pool. The linter turns this off when it dispatches them itself.
+    dispatch_violations = True
+    # Small files are passed to the pool in batches of up to this many
+    # files and this many bytes, so that the overhead of each task is
+    # shared between them.
+    batch_max_files = 16
+    batch_max_size = 65536
 
     def __init__(self, linter, config, processes):
         super().__init__(linter, config)
         self.processes = processes
 
+    @staticmethod
+    def _file_sizes(fnames: List[str]) -> Dict[str, int]:
+        """Get the size of each file, for scheduling."""
+        sizes = {}
+        for fname in fnames:
+            try:
+                sizes[fname] = os.path.getsize(fname)
+            except OSError:  # pragma: no cover
+                # We'll find out about this when we come to load it.
+                sizes[fname] = 0
+        return sizes
+
+    def iter_batches(
+        self, fnames: List[str], fix: bool = False
+    ) -> Iterator[List[Tuple[str, Callable]]]:
+        """Iterate through batches of partials for linted files.
+
+        Files are scheduled largest first, so that the largest files
+        don't hold up the end of the run. Large files are passed to the
+        pool one at a time, and the many small files which follow them
+        are batched together.
+        """
+        sizes = self._file_sizes(fnames)
+        fnames = sorted(fnames, key=lambda fname: sizes[fname], reverse=True)
+        return self._batch_partials(
+            (
+                (fname, partial, sizes.get(fname, 0))
+                for fname, partial in self.iter_partials(fnames, fix=fix)
+            )
+        )
+
+    def iter_string_batches(
+        self, strings: Iterable[Tuple[str, str]], fix: bool = False
+    ) -> Iterator[List[Tuple[str, Callable]]]:
+        """Iterate through batches of partials for linted strings.
+
+        Unlike files, strings are batched in the order they come, so that
+        they can be linted as they're read.
+        """
+        return self._batch_partials(
+            (fname, partial, len(in_str))
+            for in_str, fname in strings
+            for _, partial in self.iter_string_partials([(in_str, fname)], fix=fix)
+        )
+
+    def _batch_partials(
+        self, partials: Iterator[Tuple[str, Callable, int]]
+    ) -> Iterator[List[Tuple[str, Callable]]]:
+        """Group sized partials into batches, for the pool."""
+        batch: List[Tuple[str, Callable]] = []
+        batch_size = 0
+        for fname, partial, size in partials:
+            if batch and (
+                len(batch) >= self.batch_max_files
+                or batch_size + size > self.batch_max_size
+            ):
+                yield batch
+                batch = []
+                batch_size = 0
+            batch.append((fname, partial))
+            batch_size += size
+        if batch:
+            yield batch
+
     def run(self, fnames: List[str], fix: bool):
         """Parallel implementation.
 
         Note that the partials are generated one at a time then
-        passed directly into the pool as they're ready. This means
-        the main thread can do the IO work while passing the parsing
-        and linting work out to the threads.
+        passed directly into the pool (in batches) as they're ready.
+        This means the main thread can do the IO work while passing
+        the parsing and linting work out to the threads.
         """
-        with self._create_pool(
-            self.processes,
-            self._init_global,
-            (self.config,),
-        ) as pool:
+        yield from self._run_batches(self.iter_batches(fnames, fix=fix), fix)
+
+    def run_strings(
+        self, strings: Iterable[Tuple[str, str]], fix: bool
+    ) -> Iterator[LintedFile]:
+        """Parallel implementation for strings.
+
+        As with files, the strings are passed into the pool in batches
+        as they're read.
+        """
+        yield from self._run_batches(self.iter_string_batches(strings, fix=fix), fix)
+
+    def _run_batches(
+        self, batches: Iterator[List[Tuple[str, Callable]]], fix: bool
+    ) -> Iterator[LintedFile]:
+        with self._get_pool() as pool:
             try:
-                for lint_result in self._map(
-                    pool,
-                    self._apply,
-                    self.iter_partials(fnames, fix=fix),
+                for lint_result in (
+                    result
+                    for batch_results in self._map(pool, self._apply, batches)
+                    for result in batch_results
                 ):
                     if isinstance(lint_result, DelayedException):
                         try:
@@ -146,7 +296,7 @@ class ParallelRunner(BaseRunner):
                             self._handle_lint_path_exception(lint_result.fname, e)
                     else:
                         # It's a LintedDir.
-                        if self.linter.formatter:
+                        if self.linter.formatter and self.dispatch_violations:
                             self.linter.formatter.dispatch_file_violations(
                                 lint_result.path, lint_result, only_fixable=fix
                             )
@@ -157,18 +307,36 @@ class ParallelRunner(BaseRunner):
                 # in case it takes awhile.
                 print("Received keyboard interrupt. Cleaning up and shutting down...")
                 pool.terminate()
+                self.linter.close_pool()
+
+    def _get_pool(self):
+        """Get a context manager for the pool to run in.
+
+        If the linter is keeping its pool between runs, that's reused
+        (and left running on exit). Otherwise a new pool is created.
+        """
+        initargs = (self.config, self.linter.user_rules)
+        if not self.linter.keep_pool:
+            return self._create_pool(self.processes, self._init_global, initargs)
+        return contextlib.nullcontext(
+            self.linter.get_pool(
+                (type(self), self.processes),
+                lambda: self._create_pool(self.processes, self._init_global, initargs),
+            )
+        )
 
     @staticmethod
-    def _apply(partial_tuple):
-        """Shim function used in parallel mode."""
-        # Unpack the tuple and ditch the filename in this case.
-        fname, partial = partial_tuple
-        try:
-            return partial()
-        # Capture any exceptions and return as delayed exception to handle
-        # in the main thread.
-        except Exception as e:
-            return DelayedException(e, fname=fname)
+    def _apply(batch):
+        """Shim function used in parallel mode, to lint a batch of files."""
+        results = []
+        for fname, partial in batch:
+            try:
+                results.append(partial())
+            # Capture any exceptions and return as delayed exception to handle
+            # in the main thread.
+            except Exception as e:
+                results.append(DelayedException(e, fname=fname))
+        return results
 
     @classmethod
     def _create_pool(cls, *args, **kwargs):
@@ -187,8 +355,13 @@ class MultiProcessRunner(ParallelRunner):
     MAP_FUNCTION_NAME = "imap_unordered"
 
     @classmethod
-    def _init_global(cls, config):  # pragma: no cover
-        super()._init_global(config)
+    def _init_global(cls, config, user_rules=None):  # pragma: no cover
+        super()._init_global(config, user_rules)
+
+        # Keep a linter in each worker, which builds the rule set for each
+        # file from its config, so that rule sets aren't sent with every file.
+        global _worker_linter
+        _worker_linter = Linter(config=config, user_rules=user_rules)
 
         # Disable signal handling in the child processes to let the parent
         # control all KeyboardInterrupt handling (Control C). This is
@@ -197,6 +370,52 @@ class MultiProcessRunner(ParallelRunner):
         # https://stackoverflow.com/questions/11312525/catch-ctrlc-sigint-and-exit-multiprocesses-gracefully-in-python
         signal.signal(signal.SIGINT, signal.SIG_IGN)
 
+    def iter_partials(
+        self,
+        fnames: List[str],
+        fix: bool = False,
+    ) -> Iterator[Tuple[str, Callable]]:
+        """Iterate through partials for linted files.
+
+        Unlike the other runners, the partials don't include a rule set,
+        which the worker builds instead, from the config of the file.
+
+        Unless the templater opts out with `render_in_parallel`, the
+        workers also load and render the files themselves, so that the
+        partials are just the file names. Otherwise files are rendered
+        here, in the main process.
+        """
+        if self.linter.templater.render_in_parallel:
+            for fname in self.linter.templater.sequence_files(
+                fnames, config=self.config, formatter=self.linter.formatter
+            ):
+                yield fname, functools.partial(_lint_path_in_worker, fname, fix)
+            return
+
+        for fname, rendered in self.iter_rendered(fnames, fix=fix):
+            if rendered is None:
+                config, encoding = self.linter._load_config_for_streaming(
+                    fname, self.config
+                )
+                yield fname, functools.partial(
+                    _lint_streamed_file_in_worker, fname, config, encoding
+                )
+            else:
+                yield fname, functools.partial(_lint_rendered_in_worker, rendered, fix)
+
+    def iter_string_partials(
+        self,
+        strings: Iterable[Tuple[str, str]],
+        fix: bool = False,
+    ) -> Iterator[Tuple[str, Callable]]:
+        """Iterate through partials for linted strings.
+
+        The partials are just the strings, which the workers lint with
+        their own config and rules.
+        """
+        for in_str, fname in strings:
+            yield fname, functools.partial(_lint_string_in_worker, in_str, fname, fix)
+
 
 class MultiThreadRunner(ParallelRunner):
     """Runner that does parallel processing using multiple threads.
@@ -222,6 +441,43 @@ class DelayedException(Exception):
         raise self.ee.with_traceback(self.tb)
 
 
+def _lint_path_in_worker(fname: str, fix: bool) -> LintedFile:  # pragma: no cover
+    """Load, render and lint a file with the rules of a worker process."""
+    assert _worker_linter
+    stream_size = _worker_linter.config.get("large_file_stream_size")
+    if stream_size and not fix and os.path.getsize(fname) > stream_size:
+        config, encoding = _worker_linter._load_config_for_streaming(
+            fname, _worker_linter.config
+        )
+        return _lint_streamed_file_in_worker(fname, config, encoding)
+    rendered = _worker_linter.render_file(fname, _worker_linter.config)
+    return _lint_rendered_in_worker(rendered, fix)
+
+
+def _lint_rendered_in_worker(rendered, fix: bool) -> LintedFile:  # pragma: no cover
+    """Lint a RenderedFile with the rules of a worker process."""
+    assert _worker_linter
+    rule_set = _worker_linter.get_ruleset(config=rendered.config)
+    return _worker_linter.lint_rendered(rendered, rule_set, fix)
+
+
+def _lint_string_in_worker(
+    in_str: str, fname: str, fix: bool
+) -> LintedFile:  # pragma: no cover
+    """Lint a string with the config and rules of a worker process."""
+    assert _worker_linter
+    return _worker_linter.lint_string_with_root_config(in_str, fname, fix)
+
+
+def _lint_streamed_file_in_worker(
+    fname: str, config: FluffConfig, encoding: str
+) -> LintedFile:  # pragma: no cover
+    """Lint a large file in chunks with the rules of a worker process."""
+    assert _worker_linter
+    rule_set = _worker_linter.get_ruleset(config=config)
+    return _worker_linter.lint_streamed_file(fname, config, encoding, rule_set)
+
+
 def get_runner(
     linter: Linter,
     config: FluffConfig,
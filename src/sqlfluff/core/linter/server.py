@@ -0,0 +1,259 @@
+"""Defines the LintServer and LintClient classes.
+
+The server keeps a warm `Linter` (with its dialect, rules and
+templater already loaded) and handles lint, fix and parse requests
+from editor integrations or hooks, so that each request doesn't
+pay the cost of starting up sqlfluff.
+
+Requests and responses are JSON objects, one per line, either over
+stdin and stdout or over a local Unix socket. A request looks like::
+
+    {"id": 1, "command": "lint", "fname": "/path/to/file.sql"}
+
+The ``sql`` key can also be given, to lint a string rather than the
+contents of the file. In that case ``fname`` is still used to find
+the config to apply. The ``id`` is optional, and is passed back on
+the response so that clients can match them up. Commands are
+``lint``, ``fix``, ``parse``, ``ping`` and ``shutdown``.
+"""
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+from typing import Any, Dict, IO, Iterable, List, Optional
+
+from sqlfluff.core.errors import SQLBaseError
+from sqlfluff.core.linter.linted_dir import LintedDir
+from sqlfluff.core.linter.linted_file import LintedFile
+from sqlfluff.core.linter.linter import Linter
+from sqlfluff.core.linter.linting_result import LintingResult
+
+# Instantiate the linter logger
+linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
+
+
+class LintServer:
+    """Handles lint, fix and parse requests using a warm `Linter`.
+
+    Args:
+        linter (:obj:`Linter`): The linter to handle requests with. Its
+            config is the root config, from which the config for each
+            file is derived as it would be by `lint_paths`.
+    """
+
+    commands = ("lint", "fix", "parse", "ping", "shutdown")
+
+    def __init__(self, linter: Linter):
+        self.linter = linter
+        self.running = True
+        # The linter isn't thread safe, so requests from different
+        # connections to a socket are handled one at a time.
+        self._lock = threading.Lock()
+
+    def _load(self, request: Dict[str, Any]):
+        """Get the sql, fname, config and encoding for a request."""
+        fname = request.get("fname")
+        sql = request.get("sql")
+        if sql is None:
+            if not fname:
+                raise ValueError("Requests must include either `sql` or `fname`.")
+            return (fname,) + self.linter._load_raw_file_and_config(
+                fname, self.linter.config
+            )
+        # Always make a child config, because inline config
+        # directives in the sql would otherwise change the root.
+        config = self.linter.config.make_child_from_path(fname or os.getcwd())
+        return fname or "<string input>", sql, config, "utf8"
+
+    @staticmethod
+    def _violation_records(linted_file: LintedFile) -> List[dict]:
+        """Get the violations in the same form as `LintingResult.as_records()`."""
+        result = LintingResult()
+        linted_dir = LintedDir(linted_file.path)
+        linted_dir.add(linted_file)
+        result.add(linted_dir)
+        records = result.as_records()
+        return records[0]["violations"] if records else []
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single request, returning the response.
+
+        Errors are returned in the response (under ``error``) rather
+        than raised, so that one bad request doesn't stop the server.
+        """
+        response: Dict[str, Any] = {"id": request.get("id")}
+        command = request.get("command")
+        if command not in self.commands:
+            response["status"] = "error"
+            response["error"] = f"Unknown command: {command!r}"
+            return response
+        if command == "ping":
+            response["status"] = "ok"
+            return response
+        if command == "shutdown":
+            self.running = False
+            response["status"] = "ok"
+            return response
+
+        try:
+            fname, sql, config, encoding = self._load(request)
+            if command == "parse":
+                parsed = self.linter.parse_string(
+                    sql, fname=fname, config=config, encoding=encoding
+                )
+                response["tree"] = (
+                    parsed.tree.as_record(show_raw=True) if parsed.tree else None
+                )
+                response["violations"] = sorted(
+                    (v.get_info_dict() for v in parsed.violations),
+                    key=lambda v: (v["line_no"], v["line_pos"], v["code"]),
+                )
+            else:
+                linted_file = self.linter.lint_string(
+                    sql,
+                    fname=fname,
+                    fix=command == "fix",
+                    config=config,
+                    encoding=encoding,
+                )
+                response["violations"] = self._violation_records(linted_file)
+                if command == "fix":
+                    response["fixed"] = linted_file.fix_string()[0]
+        except (OSError, ValueError, SQLBaseError) as err:
+            response["error"] = str(err)
+        except Exception as err:  # pragma: no cover
+            linter_logger.exception("Unexpected error handling request.")
+            response["error"] = f"Unexpected error: {err!r}"
+        response["status"] = "error" if "error" in response else "ok"
+        return response
+
+    def handle_line(self, line: str) -> Dict[str, Any]:
+        """Handle a single line of JSON, returning the response."""
+        try:
+            request = json.loads(line)
+        except ValueError as err:
+            return {"id": None, "status": "error", "error": f"Invalid JSON: {err}"}
+        if not isinstance(request, dict):
+            return {"id": None, "status": "error", "error": "Requests must be objects."}
+        return self.handle(request)
+
+    def serve_stream(self, in_stream: Iterable[str], out_stream: IO[str]) -> None:
+        """Handle JSON lines from one stream, writing responses to another.
+
+        This returns when the input stream ends, or on a ``shutdown``.
+        """
+        for line in in_stream:
+            if not line.strip():
+                continue
+            with self._lock:
+                response = self.handle_line(line)
+            out_stream.write(json.dumps(response) + "\n")
+            out_stream.flush()
+            if not self.running:
+                break
+
+    def serve_socket(self, path: str) -> None:
+        """Listen on a Unix socket at `path`, until a ``shutdown``.
+
+        Each connection is handled in its own thread and can send any
+        number of requests, so a client holding a connection open (e.g.
+        an editor) doesn't block others. The requests themselves are
+        still handled one at a time, because the linter isn't thread
+        safe.
+
+        Raises a :exc:`ValueError` if another server is already
+        listening at `path`.
+        """
+        server = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server.serve_stream(
+                    io.TextIOWrapper(self.rfile, encoding="utf8"),
+                    io.TextIOWrapper(self.wfile, encoding="utf8"),
+                )
+                if not server.running:
+                    # Stop serving. This is safe because we're not
+                    # in the thread which is serving.
+                    unix_server.shutdown()
+
+        # Tidy up any socket left over from a server which didn't exit
+        # cleanly, but not one which a server is still listening on.
+        if os.path.exists(path):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise ValueError(f"Cannot serve on {path!r}, it isn't a socket.")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    pass
+                else:
+                    raise ValueError(
+                        f"Cannot serve on {path!r}, a server is already listening."
+                    )
+            os.unlink(path)
+        with socketserver.ThreadingUnixStreamServer(path, _Handler) as unix_server:
+            # Don't wait for connections which are still open on exit.
+            unix_server.daemon_threads = True
+            linter_logger.info("Serving on %s", path)
+            try:
+                unix_server.serve_forever()
+            finally:
+                os.unlink(path)
+
+
+class LintClient:
+    """A thin client for a `LintServer` listening on a Unix socket.
+
+    This only uses the standard library, so integrations can use it
+    (or reimplement it) without needing a warm `Linter` of their own.
+
+    Args:
+        path (:obj:`str`): The path of the socket the server is on.
+        timeout (:obj:`float`, optional): The timeout in seconds for
+            each request. Defaults to None (no timeout).
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        self.path = path
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._file: Optional[io.BufferedRWPair] = None
+        self._next_id = 0
+
+    def __enter__(self) -> "LintClient":
+        return self
+
+    def __exit__(self, type, value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection to the server, if open."""
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+    def request(self, command: str, **kwargs: Any) -> Dict[str, Any]:
+        """Send a request to the server and wait for its response."""
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(self.timeout)
+            self._sock.connect(self.path)
+            self._file = self._sock.makefile("rwb")
+        self._next_id += 1
+        request = dict(kwargs, id=self._next_id, command=command)
+        assert self._file
+        self._file.write(json.dumps(request).encode("utf8") + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Connection closed by the server.")
+        return json.loads(line)
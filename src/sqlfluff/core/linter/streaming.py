@@ -0,0 +1,243 @@
+"""Splits large files into chunks of whole statements, for streaming lint.
+
+Very large files (e.g. generated migration scripts) can be linted a
+chunk at a time rather than all at once, so that only the parse tree
+of one chunk needs to be held in memory, rather than that of the file.
+
+The split is done on the raw (untemplated) file, one line at a time,
+and only ever at the end of a line which ends a top level statement.
+That means a line in a chunk is always a whole line of the file, so
+positions in each chunk can be mapped back to the file just by
+offsetting the line numbers.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import regex
+
+# The tokens which change what state we're in. Everything between them
+# is either code or the content of a string or comment. Keywords which
+# open or close procedural blocks are also tokens, because a block (e.g.
+# a procedure body) can hold several statements.
+_state_tokens = (
+    r"--|/\*|\*/|'|\"|`|\$\$|\{%|%\}|\{\{|\}\}|\{#|#\}|[();]"
+    r"|\b(?:begin|case|end|if|then|loop|repeat|while)\b"
+)
+# For each state, the token which closes it.
+_closing_tokens = {
+    "'": "'",
+    '"': '"',
+    "`": "`",
+    "$$": "$$",
+    "/*": "*/",
+    "{#": "#}",
+    "{%": "%}",
+    "{{": "}}",
+}
+# Jinja tags which open a block, which we mustn't split inside.
+_jinja_block_tags = ("if", "for", "macro", "call", "filter", "raw", "block")
+# Keywords which open a procedural block, closed by END (or END <keyword>).
+_block_keywords = ("case", "loop", "repeat", "while")
+# What can follow BEGIN when it starts a transaction rather than a block.
+_transaction_begins = (
+    ";",
+    "transaction",
+    "work",
+    "tran",
+    "name",
+    "deferred",
+    "immediate",
+    "exclusive",
+    "isolation",
+    "read",
+)
+# Dialects in which a backslash escapes the next character in a string.
+_backslash_escape_dialects = ("bigquery", "hive", "mysql", "snowflake", "spark3")
+# Dialects in which `#` starts a comment.
+_hash_comment_dialects = ("bigquery", "mysql")
+
+
+class StatementSplitter:
+    """Tracks where a file can be split, one line at a time.
+
+    This is deliberately a lightweight scan rather than a lex. It keeps
+    track of strings, comments, brackets, procedural blocks and jinja
+    tags, so that we only split where a line ends with a top level
+    statement delimiter (`;`).
+
+    Procedural blocks are found by keyword: BEGIN (unless it starts a
+    transaction), CASE, LOOP, REPEAT and WHILE, and IF once it's
+    followed by THEN. They're all closed by END.
+    """
+
+    def __init__(self, dialect: str = "ansi"):
+        tokens = _state_tokens
+        if dialect in _backslash_escape_dialects:
+            tokens += r"|\\."
+        self.hash_comments = dialect in _hash_comment_dialects
+        if self.hash_comments:
+            tokens += "|#"
+        self.token_regex = regex.compile(tokens, regex.IGNORECASE)
+        # The string, comment or tag we're in, if any.
+        self.state: Optional[str] = None
+        # The content of the jinja tag we're in, if it spans several lines.
+        self.tag_buffer: List[str] = []
+        self.bracket_depth = 0
+        self.jinja_depth = 0
+        self.block_depth = 0
+        # BEGIN or END, if that was the last code we saw, because what
+        # follows it decides what it means.
+        self.last_keyword: Optional[str] = None
+        # The block depth at an IF which may start a block, if it's
+        # followed by THEN at the same depth before the next statement.
+        self.if_depth: Optional[int] = None
+
+    def _close_tag(self, content: str):
+        """Track the depth of jinja blocks, using the content of a tag."""
+        words = content.strip("-+ \t\n").split()
+        if not words:
+            return
+        if words[0].startswith("end"):
+            self.jinja_depth = max(self.jinja_depth - 1, 0)
+        elif words[0] in _jinja_block_tags:
+            self.jinja_depth += 1
+        elif words[0] == "set" and "=" not in "".join(words[1:]):
+            # A {% set x %}...{% endset %} block, not a {% set x = ... %}.
+            self.jinja_depth += 1
+
+    def _next_code(self, code: str) -> Optional[str]:
+        """Note the next piece of code, returning the keyword before it."""
+        last_keyword = self.last_keyword
+        self.last_keyword = None
+        if last_keyword == "begin" and code in _transaction_begins:
+            # BEGIN [TRANSACTION]; rather than a block.
+            self.block_depth -= 1
+        return last_keyword
+
+    def _keyword(self, keyword: str, rest_of_line: str):
+        """Track the depth of procedural blocks, using a keyword."""
+        after_end = self._next_code(keyword) == "end"
+        if keyword == "end":
+            if self.block_depth:
+                self.block_depth -= 1
+                self.last_keyword = keyword
+        elif after_end:
+            # END IF, END CASE etc. The END closed the block already.
+            pass
+        elif keyword == "begin":
+            self.block_depth += 1
+            self.last_keyword = keyword
+        elif keyword == "if":
+            self.if_depth = self.block_depth
+        elif keyword == "then":
+            if self.if_depth == self.block_depth:
+                self.block_depth += 1
+                self.if_depth = None
+        elif keyword == "repeat" and rest_of_line.lstrip().startswith("("):
+            # The REPEAT() function.
+            pass
+        elif keyword in _block_keywords:
+            self.block_depth += 1
+
+    def feed_line(self, line: str) -> bool:
+        """Scan a line, returning whether the file can be split after it."""
+        ends_statement = False
+        pos = 0
+        tag_start = 0
+        for match in self.token_regex.finditer(line):
+            token = match.group(0)
+            if self.state is not None:
+                if token == _closing_tokens[self.state]:
+                    if self.state == "{%":
+                        self.tag_buffer.append(line[tag_start : match.start()])
+                        self._close_tag("".join(self.tag_buffer))
+                        self.tag_buffer = []
+                    self.state = None
+                    pos = match.end()
+                continue
+            code = line[pos : match.start()].split()
+            if code:
+                # There's some code since the last token.
+                ends_statement = False
+                self._next_code(code[0].lower())
+            pos = match.end()
+            if token == "--" or (token == "#" and self.hash_comments):
+                # The rest of the line is a comment.
+                pos = len(line)
+                break
+            elif token[0].isalpha():
+                self._keyword(token.lower(), line[pos:])
+            elif token == "/*" or token == "{#":
+                self.state = token
+            else:
+                self._next_code(token)
+                if token in _closing_tokens:
+                    self.state = token
+                    tag_start = match.end()
+                elif token == "(":
+                    self.bracket_depth += 1
+                elif token == ")":
+                    self.bracket_depth = max(self.bracket_depth - 1, 0)
+                elif token == ";":
+                    self.if_depth = None
+            ends_statement = token == ";"
+        if self.state == "{%":
+            # Keep the content of the tag so far.
+            self.tag_buffer.append(line[tag_start:])
+        elif self.state is None:
+            code = line[pos:].split()
+            if code:
+                ends_statement = False
+                self._next_code(code[0].lower())
+        return (
+            ends_statement
+            and self.state is None
+            and not self.bracket_depth
+            and not self.jinja_depth
+            and not self.block_depth
+        )
+
+
+def iter_statement_chunks(
+    lines: Iterable[str], chunk_size: int, dialect: str = "ansi"
+) -> Iterator[Tuple[int, str]]:
+    """Split lines of a file into chunks of whole statements.
+
+    Args:
+        lines (:obj:`Iterable` of :obj:`str`): The lines of the file,
+            including their newlines, e.g. an open file.
+        chunk_size (:obj:`int`): The size (in characters) to aim for.
+            Chunks are split at the first place we can after they reach
+            this size, so they can be larger (if a statement is larger).
+        dialect (:obj:`str`): The name of the dialect of the file, which
+            decides how strings and comments are written.
+
+    Returns:
+        An iterator of (line_offset, chunk) tuples, where `line_offset`
+        is the number of lines in the file before the chunk.
+    """
+    splitter = StatementSplitter(dialect)
+    buffer: List[str] = []
+    buffer_size = 0
+    line_offset = 0
+    # Each chunk is held back until we know it isn't the last, so that
+    # any whitespace at the end of the file stays with the last statement.
+    pending: Optional[Tuple[int, str]] = None
+    for line_no, line in enumerate(lines):
+        buffer.append(line)
+        buffer_size += len(line)
+        if splitter.feed_line(line) and buffer_size >= chunk_size:
+            if pending:
+                yield pending
+            pending = line_offset, "".join(buffer)
+            buffer = []
+            buffer_size = 0
+            line_offset = line_no + 1
+    remainder = "".join(buffer)
+    if pending and not remainder.strip():
+        pending = pending[0], pending[1] + remainder
+        remainder = ""
+    if pending:
+        yield pending
+    if remainder:
+        yield line_offset, remainder
@@ -12,7 +12,10 @@ import logging
 import uuid
 
 # Get the parser logger
-from typing import Dict
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlfluff.core.parser.match_result import MatchResult  # pragma: no cover
 
 parser_logger = logging.getLogger("sqlfluff.parser")
 
@@ -28,7 +31,9 @@ class RootParseContext:
     which created it so that it can refer to config within it.
     """
 
-    def __init__(self, dialect, indentation_config=None, recurse=True):
+    def __init__(
+        self, dialect, indentation_config=None, recurse=True, memo_max_size=50000
+    ):
         """Store persistent config objects."""
         self.dialect = dialect
         self.recurse = recurse
@@ -36,8 +41,8 @@ class RootParseContext:
         # the intended indentation of certain features. Specifically it is
         # used in the Conditional grammar.
         self.indentation_config = indentation_config or {}
-        # Initialise the denylist
-        self.denylist = ParseDenylist()
+        # Initialise the memo table of match results.
+        self.memo = ParseMemo(max_size=memo_max_size)
         # This is the logger that child objects will latch onto.
         self.logger = parser_logger
         # A uuid for this parse context to enable cache invalidation
@@ -174,36 +179,71 @@ class ParseContext:
         return ctx
 
 
-class ParseDenylist:
-    """Acts as a cache to stop unnecessary matching."""
+class ParseMemo:
+    """A packrat style memo table of match results.
 
-    def __init__(self):
-        self._denylist_struct = {}
+    Matching is deterministic for a given matcher and a given span
+    of segments, so once we've matched a grammar against a span
+    (successfully or not) we can reuse that result rather than
+    matching it again when backtracking.
 
-    def _hashed_version(self):  # pragma: no cover TODO?
-        return {
-            k: {hash(e) for e in self._denylist_struct[k]}
-            for k in self._denylist_struct
-        }
+    Entries are keyed on the identity of the matcher and the segments
+    at the start and end of the span, along with its length. Each entry
+    holds a reference to those objects, so that their ids can't be
+    reused while the entry exists.
 
-    def check(self, seg_name, seg_tuple):
-        """Check this seg_tuple against this seg_name.
+    NOTE: Matching a pre-existing `BracketedSegment` mutates it, and so
+    invalidates any results which contain it. When that happens, the memo
+    is invalidated, which also bumps the `generation`. Results which were
+    computed across an invalidation shouldn't be stored.
 
-        Has this seg_tuple already been matched
-        unsuccessfully against this segment name.
-        """
-        if seg_name in self._denylist_struct:  # pragma: no cover TODO?
-            if seg_tuple in self._denylist_struct[seg_name]:
-                return True
-        return False
-
-    def mark(self, seg_name, seg_tuple):
-        """Mark this seg_tuple as not a match with this seg_name."""
-        if seg_name in self._denylist_struct:
-            self._denylist_struct[seg_name].add(seg_tuple)
-        else:
-            self._denylist_struct[seg_name] = {seg_tuple}
+    Args:
+        max_size (:obj:`int`, optional): The maximum number of entries
+            to hold. When exceeded, the oldest entries are evicted first.
+    """
+
+    def __init__(self, max_size: int = 50000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._memo: Dict[Tuple[int, int, int, int], Tuple[tuple, "MatchResult"]] = {}
+
+    @staticmethod
+    def _key(matcher, segments: tuple) -> Tuple[int, int, int, int]:
+        return (id(matcher), id(segments[0]), id(segments[-1]), len(segments))
+
+    def get(self, matcher, segments: tuple) -> Optional["MatchResult"]:
+        """Fetch a previous result for this matcher and span, or None."""
+        if not segments:
+            return None
+        entry = self._memo.get(self._key(matcher, segments))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def store(self, matcher, segments: tuple, result: "MatchResult") -> None:
+        """Store the result of matching this matcher against this span."""
+        if not segments or self.max_size <= 0:
+            return
+        if len(self._memo) >= self.max_size:
+            # Dicts are ordered, so this evicts the oldest entry.
+            del self._memo[next(iter(self._memo))]
+        self._memo[self._key(matcher, segments)] = (
+            (matcher, segments[0], segments[-1]),
+            result,
+        )
+
+    def __len__(self) -> int:
+        return len(self._memo)
 
     def clear(self):
-        """Clear the denylist struct."""
-        self._denylist_struct = {}
+        """Clear the memo table (but not the counters)."""
+        self._memo = {}
+
+    def invalidate(self):
+        """Clear the memo table because segments have been mutated."""
+        self.generation += 1
+        self.clear()
@@ -1,6 +1,6 @@
 """AnyNumberOf and OneOf."""
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from sqlfluff.core.parser.helpers import trim_non_code_segments
 from sqlfluff.core.parser.match_result import MatchResult
@@ -56,53 +56,53 @@ class AnyNumberOf(BaseGrammar):
                 return segment.raw_segments_upper
         return None
 
-    def _prune_options(
-        self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
-    ) -> Tuple[List[MatchableType], List[str]]:
-        """Use the simple matchers to prune which options to match on."""
-        available_options = []
-        simple_opts = []
-        prune_buff = []
-        non_simple = 0
-        pruned_simple = 0
-        matched_simple = 0
-
-        # Find the first code element to match against.
-        first_elem = self._first_non_whitespace(segments)
-
+    @cached_method_for_parse_context
+    def _option_lookup(
+        self, parse_context: ParseContext
+    ) -> Tuple[Dict[str, List[MatchableType]], List[MatchableType]]:
+        """Make a lookup of the options to try, by the first raw they match.
+
+        Options which aren't simple can match anything, so they're in
+        every list of the lookup, and on their own in the fallback list
+        (for raws which no simple option matches). Each list keeps the
+        options in order, so that the first of any equal matches wins.
+
+        Returns:
+            `tuple` of (lookup, fallback options).
+        """
+        lookup: Dict[str, List[MatchableType]] = {}
+        non_simple_options: List[MatchableType] = []
         for opt in self._elements:
             simple = opt.simple(parse_context=parse_context)
             if simple is None:
                 # This element is not simple, we have to do a
                 # full match with it...
-                available_options.append(opt)
-                non_simple += 1
+                non_simple_options.append(opt)
+                for options in lookup.values():
+                    options.append(opt)
                 continue
             # Otherwise we have a simple option, so let's use
             # it for pruning.
-            for simple_opt in simple:
+            for simple_opt in dict.fromkeys(simple):
                 # Check it's not a whitespace option
                 if not simple_opt.strip():  # pragma: no cover
                     raise NotImplementedError(
                         "_prune_options not supported for whitespace matching."
                     )
-                # We want to know if the first meaningful element of the str_buff
-                # matches the option.
-
-                # match the FIRST non-whitespace element of the list.
-                if first_elem != simple_opt:
-                    # No match, carry on.
-                    continue
-                # If we get here, it's matched the FIRST element of the string buffer.
-                available_options.append(opt)
-                simple_opts.append(simple_opt)
-                matched_simple += 1
-                break
-            else:
-                # Ditch this option, the simple match has failed
-                prune_buff.append(opt)
-                pruned_simple += 1
-                continue
+                if simple_opt not in lookup:
+                    lookup[simple_opt] = non_simple_options.copy()
+                lookup[simple_opt].append(opt)
+        return lookup, non_simple_options
+
+    def _prune_options(
+        self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
+    ) -> List[MatchableType]:
+        """Use the simple matchers to prune which options to match on."""
+        # Find the first code element to match against, and look up
+        # the options which could match it.
+        first_elem = self._first_non_whitespace(segments)
+        lookup, non_simple_options = self._option_lookup(parse_context=parse_context)
+        available_options = lookup.get(first_elem, non_simple_options)
 
         parse_match_logging(
             self.__class__.__name__,
@@ -110,14 +110,13 @@ class AnyNumberOf(BaseGrammar):
             "PRN",
             parse_context=parse_context,
             v_level=3,
-            ns=non_simple,
-            ps=pruned_simple,
-            ms=matched_simple,
-            pruned=prune_buff,
+            ns=len(non_simple_options),
+            ps=len(self._elements) - len(available_options),
+            ms=len(available_options) - len(non_simple_options),
             opts=available_options or "ALL",
         )
 
-        return available_options, simple_opts
+        return available_options
 
     def _match_once(
         self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
@@ -132,9 +131,7 @@ class AnyNumberOf(BaseGrammar):
         # to return earlier if we can.
         # `segments` may already be nested so we need to break out
         # the raw segments within it.
-        available_options, _ = self._prune_options(
-            segments, parse_context=parse_context
-        )
+        available_options = self._prune_options(segments, parse_context=parse_context)
 
         # If we've pruned all the options, return unmatched (with some logging).
         if not available_options:
@@ -168,23 +165,20 @@ class AnyNumberOf(BaseGrammar):
                     return MatchResult.from_unmatched(segments)
 
         # Match on each of the options
-        matched_segments: MatchResult = MatchResult.from_empty()
+        # NB: We add to a list as we go, so that many matches aren't quadratic.
+        matched_segments: List[BaseSegment] = []
         unmatched_segments: Tuple[BaseSegment, ...] = segments
         n_matches = 0
         while True:
             if self.max_times and n_matches >= self.max_times:
                 # We've matched as many times as we can
-                return MatchResult(
-                    matched_segments.matched_segments, unmatched_segments
-                )
+                return MatchResult(tuple(matched_segments), unmatched_segments)
 
             # Is there anything left to match?
             if len(unmatched_segments) == 0:
                 # No...
                 if n_matches >= self.min_times:
-                    return MatchResult(
-                        matched_segments.matched_segments, unmatched_segments
-                    )
+                    return MatchResult(tuple(matched_segments), unmatched_segments)
                 else:  # pragma: no cover TODO?
                     # We didn't meet the hurdle
                     return MatchResult.from_unmatched(unmatched_segments)
@@ -199,7 +193,8 @@ class AnyNumberOf(BaseGrammar):
 
             match = self._match_once(unmatched_segments, parse_context=parse_context)
             if match:
-                matched_segments += pre_seg + match.matched_segments
+                matched_segments.extend(pre_seg)
+                matched_segments.extend(match.matched_segments)
                 unmatched_segments = match.unmatched_segments
                 n_matches += 1
             else:
@@ -208,7 +203,7 @@ class AnyNumberOf(BaseGrammar):
                 # looking for.
                 if n_matches >= self.min_times:
                     return MatchResult(
-                        matched_segments.matched_segments, pre_seg + unmatched_segments
+                        tuple(matched_segments), pre_seg + unmatched_segments
                     )
                 else:
                     # We didn't meet the hurdle
@@ -2,13 +2,13 @@
 
 import copy
 from dataclasses import dataclass
-from typing import List, Optional, Union, Type, Tuple, Any
+from typing import Dict, List, Optional, Union, Type, Tuple, Any
 
 from sqlfluff.core.errors import SQLParseError
 from sqlfluff.core.string_helpers import curtail_string
 
 from sqlfluff.core.parser.segments import BaseSegment, BracketedSegment, allow_ephemeral
-from sqlfluff.core.parser.helpers import trim_non_code_segments, iter_indices
+from sqlfluff.core.parser.helpers import trim_non_code_segments
 from sqlfluff.core.parser.match_result import MatchResult
 from sqlfluff.core.parser.match_logging import (
     parse_match_logging,
@@ -298,8 +298,15 @@ class BaseGrammar(Matchable):
         best_simple_match = None
         if simple_matchers:
             # If they're all simple we can use a hash match to identify the first one.
-            # Build a buffer of all the upper case raw segments ahead of us.
-            str_buff = []
+            # Make a lookup of the matchers for each upper case raw, in order.
+            simple_lookup: Dict[str, List[MatchableType]] = {}
+            for matcher, simple in simple_matchers:
+                # Simple will be a tuple of options
+                for simple_option in simple:
+                    option_matchers = simple_lookup.setdefault(simple_option, [])
+                    if matcher not in option_matchers:
+                        option_matchers.append(matcher)
+
             # For existing compound segments, we should assume that within
             # that segment, things are internally consistent, that means
             # rather than enumerating all the individual segments of a longer
@@ -308,43 +315,20 @@ class BaseGrammar(Matchable):
             # also b) prevents some really horrible bugs with bracket matching.
             # See https://github.com/sqlfluff/sqlfluff/issues/433
 
-            def _trim_elem(seg):
-                s = seg.raw_upper.split(maxsplit=1)
-                return s[0] if s else ""
-
-            str_buff = [_trim_elem(seg) for seg in segments]
-            match_queue = []
-
-            for matcher, simple in simple_matchers:
-                # Simple will be a tuple of options
-                for simple_option in simple:
-                    # NOTE: We use iter_indices to make sure we capture
-                    # all instances of potential matches if there are many.
-                    # This is important for bracket counting.
-                    for buff_pos in iter_indices(str_buff, simple_option):
-                        match_queue.append((matcher, buff_pos, simple_option))
-
-            # Sort the match queue. First to process AT THE END.
-            # That means we pop from the end.
-            match_queue = sorted(match_queue, key=lambda x: x[1])
-
-            parse_match_logging(
-                cls.__name__,
-                "_look_ahead_match",
-                "SI",
-                parse_context=parse_context,
-                v_level=4,
-                mq=match_queue,
-                sb=str_buff,
-            )
-
-            while match_queue:
-                # We've managed to match. We can shortcut home.
-                # NB: We may still need to deal with whitespace.
-                queued_matcher, queued_buff_pos, queued_option = match_queue.pop()
-                # Here we do the actual transform to the new segment.
-                match = queued_matcher.match(segments[queued_buff_pos:], parse_context)
-                if not match:
+            # Work forward through the segments, and take the first match.
+            # NB: We only look as far as we need to, rather than at all
+            # the segments ahead of us, so that looking for (for example)
+            # each delimiter in a long file doesn't take quadratic time.
+            for buff_pos, seg in enumerate(segments):
+                trimmed = seg.raw_upper.split(maxsplit=1)
+                queued_option = trimmed[0] if trimmed else ""
+                if queued_option not in simple_lookup:
+                    continue
+                for queued_matcher in simple_lookup[queued_option]:
+                    # Here we do the actual transform to the new segment.
+                    match = queued_matcher.match(segments[buff_pos:], parse_context)
+                    if match:
+                        break
                     # We've had something match in simple matching, but then later excluded.
                     # Log but then move on to the next item on the list.
                     parse_match_logging(
@@ -355,9 +339,11 @@ class BaseGrammar(Matchable):
                         v_level=4,
                         _so=queued_option,
                     )
+                else:
                     continue
-                # Ok we have a match. Because we sorted the list, we'll take it!
-                best_simple_match = (segments[:queued_buff_pos], match, queued_matcher)
+                # Ok we have a match. It's the first, so we'll take it!
+                best_simple_match = (segments[:buff_pos], match, queued_matcher)
+                break
 
         if not non_simple_matchers:
             # There are no other matchers, we can just shortcut now.
@@ -382,16 +368,16 @@ class BaseGrammar(Matchable):
             else:
                 return ((), MatchResult.from_unmatched(segments), None)
 
-        # Make some buffers
-        seg_buff = segments
-        pre_seg_buff = ()  # NB: Tuple
+        # Keep track of how far we are through the segments, rather than
+        # building up a buffer of those we've passed.
+        buff_pos = 0
 
         # Loop
         while True:
             # Do we have anything left to match on?
-            if seg_buff:
+            if buff_pos < len(segments):
                 # Great, carry on.
-                pass
+                seg_buff = segments[buff_pos:]
             else:
                 # We've got to the end without a match, return empty
                 return ((), MatchResult.from_unmatched(segments), None)
@@ -405,11 +391,11 @@ class BaseGrammar(Matchable):
             )
 
             if mat and not best_simple_match:
-                return (pre_seg_buff, mat, m)
+                return (tuple(segments[:buff_pos]), mat, m)
             elif mat:
                 # It will be earlier than the simple one if we've even checked,
                 # but there's a chance that this might be *longer*, or just FIRST.
-                pre_lengths = (len(pre_seg_buff), len(best_simple_match[0]))
+                pre_lengths = (buff_pos, len(best_simple_match[0]))
                 mat_lengths = (len(mat), len(best_simple_match[1]))
                 mat_indexes = (matchers.index(m), matchers.index(best_simple_match[2]))
                 if (
@@ -424,7 +410,7 @@ class BaseGrammar(Matchable):
                         and mat_indexes[0] < mat_indexes[1]
                     )
                 ):
-                    return (pre_seg_buff, mat, m)
+                    return (tuple(segments[:buff_pos]), mat, m)
                 else:
                     return best_simple_match
             else:
@@ -432,11 +418,10 @@ class BaseGrammar(Matchable):
                 # Two improvements:
                 # 1) if we get as far as the first simple match, then return that.
                 # 2) be eager in consuming non-code segments if allowed
-                if best_simple_match and len(pre_seg_buff) >= len(best_simple_match[0]):
+                if best_simple_match and buff_pos >= len(best_simple_match[0]):
                     return best_simple_match
 
-                pre_seg_buff += (seg_buff[0],)
-                seg_buff = seg_buff[1:]
+                buff_pos += 1
 
     @classmethod
     def _bracket_sensitive_look_ahead_match(
@@ -493,7 +478,8 @@ class BaseGrammar(Matchable):
 
         # Make some buffers
         seg_buff: Tuple[BaseSegment, ...] = segments
-        pre_seg_buff: Tuple[BaseSegment, ...] = ()
+        # NB: A list, so that adding to it as we go isn't quadratic.
+        pre_seg_buff: List[BaseSegment] = []
         bracket_stack: List[BracketInfo] = []
 
         # Iterate
@@ -572,7 +558,7 @@ class BaseGrammar(Matchable):
                                 if bracket_stack:
                                     bracket_stack[-1].segments += new_segments
                                 else:
-                                    pre_seg_buff += new_segments
+                                    pre_seg_buff.extend(new_segments)
                                 seg_buff = match.unmatched_segments
                                 continue
                             else:
@@ -606,7 +592,7 @@ class BaseGrammar(Matchable):
                         if matcher in matchers:
                             # It's one of the things we were looking for!
                             # Return.
-                            return (pre_seg_buff + pre, match, matcher)
+                            return (tuple(pre_seg_buff) + pre, match, matcher)
                         elif matcher in start_brackets:
                             # We've found the start of a bracket segment.
                             # NB: It might not *actually* be the bracket itself,
@@ -623,7 +609,7 @@ class BaseGrammar(Matchable):
                             # The matched element has already been added to the bracket.
                             # Add anything before it to the pre segment buffer.
                             # Reset the working buffer.
-                            pre_seg_buff += pre
+                            pre_seg_buff.extend(pre)
                             seg_buff = match.unmatched_segments
                             continue
                         elif matcher in end_brackets:
@@ -663,7 +649,11 @@ class BaseGrammar(Matchable):
             # - We found an unexpected end bracket before matching something interesting.
             # We return with the mutated segments so we can
             # reuse any bracket matching.
-            return ((), MatchResult.from_unmatched(pre_seg_buff + seg_buff), None)
+            return (
+                (),
+                MatchResult.from_unmatched(tuple(pre_seg_buff) + seg_buff),
+                None,
+            )
 
     def __str__(self):  # pragma: no cover TODO?
         return repr(self)
@@ -816,37 +806,38 @@ class Ref(BaseGrammar):
         on the underlying class.
 
         The match element of Ref, also implements the caching
-        using the parse_context `denylist` methods.
+        using the parse_context `memo` table.
         """
         elem = self._get_elem(dialect=parse_context.dialect)
 
         if not elem:  # pragma: no cover
             raise ValueError(f"Null Element returned! _elements: {self._elements!r}")
 
-        # First check against the efficiency Cache.
+        # First check against the memo table.
         # We rely on segments not being mutated within a given
         # match cycle and so the ids should continue to refer to unchanged
         # objects.
-        seg_tuple = (id(seg) for seg in segments)
-        self_name = self._get_ref()
-        if parse_context.denylist.check(self_name, seg_tuple):  # pragma: no cover TODO?
+        resp = parse_context.memo.get(self, segments)
+        if resp is not None:
             # This has been tried before.
             parse_match_logging(
                 self.__class__.__name__,
                 "match",
-                "SKIP",
+                "HIT",
                 parse_context=parse_context,
                 v_level=3,
-                self_name=self_name,
+                self_name=self._get_ref(),
             )
-            return MatchResult.from_unmatched(segments)
+            return resp
 
         # Match against that. NB We're not incrementing the match_depth here.
         # References shouldn't really count as a depth of match.
+        generation = parse_context.memo.generation
         with parse_context.matching_segment(self._get_ref()) as ctx:
             resp = elem.match(segments=segments, parse_context=ctx)
-        if not resp:
-            parse_context.denylist.mark(self_name, seg_tuple)
+        # Only store the result if nothing was mutated while matching.
+        if parse_context.memo.generation == generation:
+            parse_context.memo.store(self, segments, resp)
         return resp
 
     @classmethod
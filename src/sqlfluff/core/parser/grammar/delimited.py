@@ -61,7 +61,9 @@ class Delimited(OneOf):
 
         # Make some buffers
         seg_buff = segments
-        matched_segments = MatchResult.from_empty()
+        # NB: We add to a list as we go, rather than a tuple or `MatchResult`,
+        # so that long delimited lists (e.g. of statements) aren't quadratic.
+        matched_segments: List[BaseSegment] = []
         # delimiters is a list of tuples containing delimiter segments as we find them.
         delimiters: List[BaseSegment] = []
 
@@ -89,6 +91,15 @@ class Delimited(OneOf):
 
         # In more detail, match against delimiter, if we match, put a slice
         # up to that point onto a list of slices. Carry on.
+
+        def mutated_segments() -> Tuple[BaseSegment, ...]:
+            """The segments up to and including the last delimiter found.
+
+            NB: These include the rest of the file, so they're only joined
+            up on the way out, rather than on every loop.
+            """
+            return pre_content + delimiter_match.all_segments()
+
         while True:
             progressbar_matching.update(n=1)
 
@@ -98,14 +109,14 @@ class Delimited(OneOf):
             # the content, so we must be in a trailing case.
             if len(seg_buff) == 0:
                 # Append the remaining buffer in case we're in the not is_code case.
-                matched_segments += seg_buff
+                matched_segments.extend(seg_buff)
                 # Nothing left, this is potentially a trailing case?
                 if self.allow_trailing and (
                     self.min_delimiters is None
                     or len(delimiters) >= self.min_delimiters
                 ):  # pragma: no cover TODO?
                     # It is! (nothing left so no unmatched segments to append)
-                    return MatchResult.from_matched(matched_segments.matched_segments)
+                    return MatchResult.from_matched(tuple(matched_segments))
                 else:  # pragma: no cover TODO?
                     return MatchResult.from_unmatched(segments)
 
@@ -130,9 +141,6 @@ class Delimited(OneOf):
                     bracket_pairs_set=self.bracket_pairs_set,
                 )
 
-            # Store the mutated segments to reuse.
-            mutated_segments = pre_content + delimiter_match.all_segments()
-
             # Have we found a delimiter or terminator looking forward?
             if delimiter_match:
                 if delimiter_matcher is self.delimiter:
@@ -143,7 +151,7 @@ class Delimited(OneOf):
                 # of the things we're looking for. NB: If it's of zero length then
                 # we return without trying it.
                 if len(pre_content) > 0:
-                    pre_non_code, pre_content, post_non_code = trim_non_code_segments(
+                    pre_non_code, content, post_non_code = trim_non_code_segments(
                         pre_content
                     )
                     # Check for whitespace gaps.
@@ -154,12 +162,12 @@ class Delimited(OneOf):
                         seg.is_whitespace for seg in pre_non_code + post_non_code
                     ):
                         return MatchResult.from_unmatched(
-                            mutated_segments
+                            mutated_segments()
                         )  # pragma: no cover TODO?
 
                     with parse_context.deeper_match() as ctx:
                         match, _ = self._longest_trimmed_match(
-                            segments=pre_content,
+                            segments=content,
                             matchers=self._elements,
                             parse_context=ctx,
                             # We've already trimmed
@@ -172,21 +180,21 @@ class Delimited(OneOf):
                             # beyond the scope of this Delimited section. Trailing delimiters are allowed,
                             # so return matched up to this section.
                             return MatchResult(
-                                matched_segments.matched_segments,
+                                tuple(matched_segments),
                                 pre_non_code
                                 + match.unmatched_segments
                                 + post_non_code
                                 + delimiter_match.all_segments(),
                             )
                         else:
-                            return MatchResult.from_unmatched(mutated_segments)
+                            return MatchResult.from_unmatched(mutated_segments())
 
                     if not match.is_complete():
                         # If we reach this point, the lookahead match has hit a delimiter
                         # beyond the scope of this Delimited section. We should return a
                         # partial match, and the delimiter as unmatched.
                         return MatchResult(
-                            matched_segments.matched_segments
+                            tuple(matched_segments)
                             + pre_non_code
                             + match.matched_segments,
                             match.unmatched_segments
@@ -197,14 +205,14 @@ class Delimited(OneOf):
                     # We have a complete match!
 
                     # First add the segment up to the delimiter to the matched segments
-                    matched_segments += (
-                        pre_non_code + match.matched_segments + post_non_code
-                    )
+                    matched_segments.extend(pre_non_code)
+                    matched_segments.extend(match.matched_segments)
+                    matched_segments.extend(post_non_code)
                     # Then it depends what we matched.
                     # Delimiter
                     if delimiter_matcher is self.delimiter:
                         # Then add the delimiter to the matched segments
-                        matched_segments += delimiter_match.matched_segments
+                        matched_segments.extend(delimiter_match.matched_segments)
                         # Break this for loop and move on, looking for the next delimiter
                         seg_buff = delimiter_match.unmatched_segments
                         # Still got some buffer left. Carry on.
@@ -221,10 +229,10 @@ class Delimited(OneOf):
                             self.min_delimiters
                             and len(delimiters) < self.min_delimiters
                         ):
-                            return MatchResult.from_unmatched(mutated_segments)
+                            return MatchResult.from_unmatched(mutated_segments())
                         else:
                             return MatchResult(
-                                matched_segments.matched_segments,
+                                tuple(matched_segments),
                                 delimiter_match.all_segments(),
                             )
                     else:  # pragma: no cover
@@ -237,7 +245,7 @@ class Delimited(OneOf):
                 else:
                     # Zero length section between delimiters, or zero code
                     # elements if appropriate. Return unmatched.
-                    return MatchResult.from_unmatched(mutated_segments)
+                    return MatchResult.from_unmatched(mutated_segments())
             else:
                 # No match for a delimiter looking forward, this means we're
                 # at the end. In this case we look for a potential partial match
@@ -247,11 +255,11 @@ class Delimited(OneOf):
                 # First check we're had enough delimiters, because if we haven't then
                 # there's no sense to try matching
                 if self.min_delimiters and len(delimiters) < self.min_delimiters:
-                    return MatchResult.from_unmatched(mutated_segments)
+                    return MatchResult.from_unmatched(mutated_segments())
                 # We use the whitespace padded match to hoover up whitespace if enabled,
                 # and default to the longest matcher. We don't care which one matches.
                 pre_non_code, trimmed_segments, post_non_code = trim_non_code_segments(
-                    mutated_segments
+                    mutated_segments()
                 )
                 # Check for whitespace gaps.
                 # We do this explicitly here rather than relying on an
@@ -261,7 +269,7 @@ class Delimited(OneOf):
                     seg.is_whitespace for seg in pre_non_code + post_non_code
                 ):
                     return MatchResult.from_unmatched(
-                        mutated_segments
+                        mutated_segments()
                     )  # pragma: no cover TODO?
 
                 with parse_context.deeper_match() as ctx:
@@ -278,7 +286,7 @@ class Delimited(OneOf):
                     if mat.unmatched_segments:
                         # We have something unmatched and so we should let it also have the trailing elements
                         return MatchResult(
-                            matched_segments.matched_segments
+                            tuple(matched_segments)
                             + pre_non_code
                             + mat.matched_segments,
                             mat.unmatched_segments + post_non_code,
@@ -287,7 +295,7 @@ class Delimited(OneOf):
                         # If there's nothing unmatched in the most recent match, then we can consume the trailing
                         # non code segments
                         return MatchResult.from_matched(
-                            matched_segments.matched_segments
+                            tuple(matched_segments)
                             + pre_non_code
                             + mat.matched_segments
                             + post_non_code,
@@ -296,6 +304,6 @@ class Delimited(OneOf):
                     # No match at the end, are we allowed to trail? If we are then return,
                     # otherwise we fail because we can't match the last element.
                     if self.allow_trailing:
-                        return MatchResult(matched_segments.matched_segments, seg_buff)
+                        return MatchResult(tuple(matched_segments), seg_buff)
                     else:
-                        return MatchResult.from_unmatched(mutated_segments)
+                        return MatchResult.from_unmatched(mutated_segments())
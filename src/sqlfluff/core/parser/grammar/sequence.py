@@ -56,7 +56,9 @@ class Sequence(BaseGrammar):
         if isinstance(segments, BaseSegment):
             segments = tuple(segments)  # pragma: no cover TODO?
 
-        matched_segments = MatchResult.from_empty()
+        # NB: We add to a list as we go, rather than a tuple or `MatchResult`,
+        # so that long sequences aren't quadratic.
+        matched_segments: List[BaseSegment] = []
         unmatched_segments = segments
 
         # Buffers of uninstantiated meta segments.
@@ -135,12 +137,10 @@ class Sequence(BaseGrammar):
                     if elem_match.has_match():
                         # We're expecting mostly partial matches here, but complete
                         # matches are possible. Don't be greedy with whitespace!
-                        matched_segments += (
-                            meta_pre_nc
-                            + pre_nc
-                            + meta_post_nc
-                            + elem_match.matched_segments
-                        )
+                        matched_segments.extend(meta_pre_nc)
+                        matched_segments.extend(pre_nc)
+                        matched_segments.extend(meta_post_nc)
+                        matched_segments.extend(elem_match.matched_segments)
                         meta_pre_nc = ()
                         meta_post_nc = ()
                         unmatched_segments = elem_match.unmatched_segments + post_nc
@@ -149,7 +149,7 @@ class Sequence(BaseGrammar):
                         if self.test_env:
                             check_still_complete(
                                 segments,
-                                matched_segments.matched_segments,
+                                tuple(matched_segments),
                                 unmatched_segments,
                             )
                         # Break out of the while loop and move to the next element.
@@ -173,7 +173,7 @@ class Sequence(BaseGrammar):
 
         return MatchResult(
             BaseSegment._position_segments(
-                matched_segments.matched_segments + meta_pre_nc + meta_post_nc,
+                tuple(matched_segments) + meta_pre_nc + meta_post_nc,
             ),
             unmatched_segments,
         )
@@ -336,6 +336,10 @@ class Bracketed(Sequence):
 
         # We require a complete match for the content (hopefully for obvious reasons)
         if content_match.is_complete():
+            # If we're about to mutate a pre-existing bracket, then any
+            # memoized results which contain it are no longer valid.
+            if bracket_segment is seg_buff[0]:
+                parse_context.memo.invalidate()
             # Reconstruct the bracket segment post match.
             # We need to realign the meta segments so the pos markers are correct.
             # Have we already got indents?
@@ -1,7 +1,7 @@
 """The code for the Lexer."""
 
 import logging
-from typing import Optional, List, Tuple, Union, NamedTuple
+from typing import Dict, Optional, List, Tuple, Union, NamedTuple
 import regex
 
 from sqlfluff.core.parser.segments import (
@@ -47,6 +47,11 @@ class TemplateElement(NamedTuple):
         return self.matcher.construct_segment(self.raw, pos_marker=pos_marker)
 
 
+# Patterns which can't be tested in isolation from the surrounding string,
+# i.e. anchors, word boundaries and lookbehinds.
+_context_dependent_regex = regex.compile(r"\\[bBAGZ]|\(\?<[=!]|(?<!\[)\^")
+
+
 class LexMatch(NamedTuple):
     """A class to hold matches from the Lexer."""
 
@@ -88,11 +93,24 @@ class StringLexer:
 
     def _match(self, forward_string: str) -> Optional[LexedElement]:
         """The private match function. Just look for a literal string."""
-        if forward_string.startswith(self.template):
+        return self._match_at(forward_string, 0)
+
+    def _match_at(self, buff: str, pos: int) -> Optional[LexedElement]:
+        """Look for a literal string at a given offset into the buffer."""
+        if buff.startswith(self.template, pos):
             return LexedElement(self.template, self)
         else:
             return None
 
+    def could_start_with(self, char: str) -> bool:
+        """Could a match of this matcher start with the given character?
+
+        This is used to narrow down the matchers worth trying at each
+        position in the buffer. It should never return False for a
+        character which *could* start a match.
+        """
+        return self.template.startswith(char)
+
     def search(self, forward_string: str) -> Optional[Tuple[int, int]]:
         """Use string methods to find a substring."""
         loc = forward_string.find(self.template)
@@ -194,18 +212,24 @@ class StringLexer:
         """
         if len(forward_string) == 0:  # pragma: no cover
             raise ValueError("Unexpected empty string!")
-        matched = self._match(forward_string)
+        end_pos, new_elements = self.match_at(forward_string, 0)
+        return LexMatch(forward_string[end_pos:], new_elements)
 
+    def match_at(self, buff: str, pos: int) -> Tuple[int, List[LexedElement]]:
+        """Match at a given offset into the buffer, without copying it.
+
+        Returns:
+            :obj:`tuple` of the offset of the end of the match and the
+            list of matched elements. If nothing matched, the offset
+            is unchanged and the list is empty.
+
+        """
+        matched = self._match_at(buff, pos)
         if matched:
             # Handle potential subdivision elsewhere.
-            new_elements = self._subdivide(matched)
-
-            return LexMatch(
-                forward_string[len(matched.raw) :],
-                new_elements,
-            )
+            return pos + len(matched.raw), self._subdivide(matched)
         else:
-            return LexMatch(forward_string, [])
+            return pos, []
 
     def construct_segment(self, raw, pos_marker):
         """Construct a segment using the given class a properties."""
@@ -223,10 +247,11 @@ class RegexLexer(StringLexer):
         # do get matched by .
         flags = regex.DOTALL
         self._compiled_regex = regex.compile(self.template, flags)
+        self._context_dependent = bool(_context_dependent_regex.search(self.template))
 
-    def _match(self, forward_string: str) -> Optional[LexedElement]:
-        """Use regexes to match chunks."""
-        match = self._compiled_regex.match(forward_string)
+    def _match_at(self, buff: str, pos: int) -> Optional[LexedElement]:
+        """Use regexes to match chunks at a given offset into the buffer."""
+        match = self._compiled_regex.match(buff, pos)
         if match:
             # We can only match strings with length
             match_str = match.group(0)
@@ -238,6 +263,18 @@ class RegexLexer(StringLexer):
                 )
         return None
 
+    def could_start_with(self, char: str) -> bool:
+        """Could a match of this matcher start with the given character?
+
+        We use partial matching to find out whether the character could
+        be the start of a match. Patterns which depend on the context
+        around the match position (e.g. lookbehinds or word boundaries)
+        can't be tested like that, so they're always worth trying.
+        """
+        if self._context_dependent:
+            return True
+        return bool(self._compiled_regex.match(char, partial=True))
+
     def search(self, forward_string: str) -> Optional[Tuple[int, int]]:
         """Use regex to find a substring."""
         match = self._compiled_regex.search(forward_string)
@@ -252,6 +289,63 @@ class RegexLexer(StringLexer):
         return None
 
 
+class CombinedLexer:
+    """Matches an ordered list of lexers against a buffer using offsets.
+
+    Rather than trying every matcher in turn at each position, we
+    look up the matchers which could start with the character at that
+    position, and only try those (in their original order). That list
+    is worked out lazily for each character we come across.
+
+    Matching works on offsets into one buffer rather than on slices of
+    it, so we don't copy the remainder of the string for every token.
+    The elements produced are identical to trying each matcher in order.
+    """
+
+    def __init__(self, lexer_matchers: List[StringLexer]):
+        self.lexer_matchers = lexer_matchers
+        self._candidates: Dict[str, List[StringLexer]] = {}
+
+    def candidates(self, char: str) -> List[StringLexer]:
+        """Get the matchers worth trying for a given first character."""
+        try:
+            return self._candidates[char]
+        except KeyError:
+            candidates = [
+                matcher
+                for matcher in self.lexer_matchers
+                if matcher.could_start_with(char)
+            ]
+            self._candidates[char] = candidates
+            return candidates
+
+    def match(self, buff: str, pos: int = 0) -> Tuple[int, List[LexedElement]]:
+        """Iteratively match from an offset until we can't match any more.
+
+        Returns:
+            :obj:`tuple` of the offset we got to and the list of matched
+            elements. If we got to the end of the buffer, the offset will
+            be its length.
+
+        """
+        elem_buff: List[LexedElement] = []
+        buff_len = len(buff)
+        while pos < buff_len:
+            for matcher in self.candidates(buff[pos]):
+                end_pos, elements = matcher.match_at(buff, pos)
+                if elements:
+                    # If we have new segments then whoop!
+                    elem_buff += elements
+                    pos = end_pos
+                    # Cycle back around again and start with the top
+                    # matcher again.
+                    break
+            else:
+                # We've got so far, but now can't match. Return
+                break
+        return pos, elem_buff
+
+
 class Lexer:
     """The Lexer class actually does the lexing step."""
 
@@ -265,6 +359,7 @@ class Lexer:
         self.config = FluffConfig.from_kwargs(config=config, dialect=dialect)
         # Store the matchers
         self.lexer_matchers = self.config.get("dialect_obj").get_lexer_matchers()
+        self.combined_lexer = CombinedLexer(self.lexer_matchers)
 
         self.last_resort_lexer = last_resort_lexer or RegexLexer(
             "<unlexable>",
@@ -292,22 +387,23 @@ class Lexer:
 
         # Lex the string to get a tuple of LexedElement
         element_buffer: List[LexedElement] = []
+        pos = 0
         while True:
-            res = self.lex_match(str_buff, self.lexer_matchers)
-            element_buffer += res.elements
-            if res.forward_string:
-                resort_res = self.last_resort_lexer.match(res.forward_string)
-                if not resort_res:
+            pos, elements = self.combined_lexer.match(str_buff, pos)
+            element_buffer += elements
+            if pos < len(str_buff):
+                pos, resort_elements = self.last_resort_lexer.match_at(str_buff, pos)
+                if not resort_elements:
                     # If we STILL can't match, then just panic out.
+                    forward_string = str_buff[pos:]
                     raise SQLLexError(
                         f"Fatal. Unable to lex characters: {0!r}".format(
-                            res.forward_string[:10] + "..."
-                            if len(res.forward_string) > 9
-                            else res.forward_string
+                            forward_string[:10] + "..."
+                            if len(forward_string) > 9
+                            else forward_string
                         )
                     )
-                str_buff = resort_res.forward_string
-                element_buffer += resort_res.elements
+                element_buffer += resort_elements
             else:  # pragma: no cover TODO?
                 break
 
@@ -555,22 +651,8 @@ class Lexer:
     @staticmethod
     def lex_match(forward_string: str, lexer_matchers: List[StringLexer]) -> LexMatch:
         """Iteratively match strings using the selection of submatchers."""
-        elem_buff: List[LexedElement] = []
-        while True:
-            if len(forward_string) == 0:
-                return LexMatch(forward_string, elem_buff)
-            for matcher in lexer_matchers:
-                res = matcher.match(forward_string)
-                if res.elements:
-                    # If we have new segments then whoop!
-                    elem_buff += res.elements
-                    forward_string = res.forward_string
-                    # Cycle back around again and start with the top
-                    # matcher again.
-                    break
-            else:
-                # We've got so far, but now can't match. Return
-                return LexMatch(forward_string, elem_buff)
+        pos, elem_buff = CombinedLexer(lexer_matchers).match(forward_string)
+        return LexMatch(forward_string[pos:], elem_buff)
 
     @staticmethod
     def map_template_slices(
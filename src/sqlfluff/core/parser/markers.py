@@ -3,14 +3,12 @@
 This class is a construct to keep track of positions within a file.
 """
 
-from dataclasses import dataclass
 from typing import Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from sqlfluff.core.templaters import TemplatedFile  # pragma: no cover
 
 
-@dataclass(frozen=True)
 class PositionMarker:
     """A reference to a position in a file.
 
@@ -25,25 +23,100 @@ class PositionMarker:
         - Positions within the fixed file are identified with a line number and line
           position, which identify a point.
         - Arithmetic comparisons are on the location in the fixed file.
-    """
 
-    source_slice: slice
-    templated_slice: slice
-    templated_file: "TemplatedFile"
-    # If not set, these will be initialised in the post init.
-    working_line_no: int = -1
-    working_line_pos: int = -1
+    There's one of these for every segment in a parse tree, so it's kept
+    compact. The slices are stored as their offsets, and made when they're
+    asked for. Markers are immutable, so they can be (and are) shared
+    between segments, rather than copied.
+    """
 
-    def __post_init__(self):
+    __slots__ = (
+        "_source_start",
+        "_source_stop",
+        "_templated_start",
+        "_templated_stop",
+        "templated_file",
+        "working_line_no",
+        "working_line_pos",
+    )
+
+    def __init__(
+        self,
+        source_slice: slice,
+        templated_slice: slice,
+        templated_file: "TemplatedFile",
+        # If not set, these will be inferred from the templated file.
+        working_line_no: int = -1,
+        working_line_pos: int = -1,
+    ):
+        self._source_start: int = source_slice.start
+        self._source_stop: int = source_slice.stop
+        self._templated_start: int = templated_slice.start
+        self._templated_stop: int = templated_slice.stop
+        self.templated_file = templated_file
         # If the working position has not been explicitly set
         # then infer it from the position in the templated file.
         # This is accurate up until the point that any fixes have
         # been applied.
-        if self.working_line_no == -1 or self.working_line_pos == -1:
-            line_no, line_pos = self.templated_position()
-            # Use the base method because we're working with a frozen class
-            object.__setattr__(self, "working_line_no", line_no)
-            object.__setattr__(self, "working_line_pos", line_pos)
+        if working_line_no == -1 or working_line_pos == -1:
+            working_line_no, working_line_pos = self.templated_position()
+        self.working_line_no = working_line_no
+        self.working_line_pos = working_line_pos
+
+    def _key(self) -> Tuple[int, int, int, int, int, int]:
+        return (
+            self._source_start,
+            self._source_stop,
+            self._templated_start,
+            self._templated_stop,
+            self.working_line_no,
+            self.working_line_pos,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, PositionMarker):
+            return NotImplemented
+        return (
+            self._key() == other._key() and self.templated_file == other.templated_file
+        )
+
+    def __hash__(self):
+        return hash((self._key(), self.templated_file))
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(source_slice={self.source_slice!r}, "
+            f"templated_slice={self.templated_slice!r}, "
+            f"templated_file={self.templated_file!r}, "
+            f"working_line_no={self.working_line_no!r}, "
+            f"working_line_pos={self.working_line_pos!r})"
+        )
+
+    def __getstate__(self):
+        return (self._key(), self.templated_file)
+
+    def __setstate__(self, state):
+        (
+            (
+                self._source_start,
+                self._source_stop,
+                self._templated_start,
+                self._templated_stop,
+                self.working_line_no,
+                self.working_line_pos,
+            ),
+            self.templated_file,
+        ) = state
+
+    @property
+    def source_slice(self) -> slice:
+        """The slice of the source file at this position."""
+        return slice(self._source_start, self._source_stop)
+
+    @property
+    def templated_slice(self) -> slice:
+        """The slice of the templated file at this position."""
+        return slice(self._templated_start, self._templated_stop)
 
     def __str__(self):
         return self.to_source_string()
@@ -91,31 +164,42 @@ class PositionMarker:
 
     @classmethod
     def from_child_markers(cls, *markers):
-        """Create a parent marker from it's children."""
-        source_slice = slice(
-            min(m.source_slice.start for m in markers),
-            max(m.source_slice.stop for m in markers),
-        )
-        templated_slice = slice(
-            min(m.templated_slice.start for m in markers),
-            max(m.templated_slice.stop for m in markers),
-        )
-        templated_files = {m.templated_file for m in markers}
-        if len(templated_files) != 1:  # pragma: no cover
+        """Create a parent marker from it's children.
+
+        A parent with just one child shares its marker, if it would
+        be the same anyway.
+        """
+        templated_file = markers[0].templated_file
+        if any(
+            m.templated_file is not templated_file for m in markers
+        ):  # pragma: no cover
             raise ValueError("Attempted to make a parent marker from multiple files.")
-        templated_file = templated_files.pop()
-        return cls(source_slice, templated_slice, templated_file)
+        if len(markers) == 1:
+            marker = markers[0]
+            if marker.working_loc == marker.templated_position():
+                return marker
+        return cls(
+            slice(
+                min(m._source_start for m in markers),
+                max(m._source_stop for m in markers),
+            ),
+            slice(
+                min(m._templated_start for m in markers),
+                max(m._templated_stop for m in markers),
+            ),
+            templated_file,
+        )
 
     def source_position(self) -> Tuple[int, int]:
         """Return the line and position of this marker in the source."""
         return self.templated_file.get_line_pos_of_char_pos(
-            self.source_slice.start, source=True
+            self._source_start, source=True
         )
 
     def templated_position(self) -> Tuple[int, int]:
         """Return the line and position of this marker in the source."""
         return self.templated_file.get_line_pos_of_char_pos(
-            self.templated_slice.start, source=False
+            self._templated_start, source=False
         )
 
     @property
@@ -135,9 +219,11 @@ class PositionMarker:
 
     def start_point_marker(self) -> "PositionMarker":
         """Get a point marker from the start."""
+        if self.is_point():
+            return self
         return self.__class__.from_point(
-            self.source_slice.start,
-            self.templated_slice.start,
+            self._source_start,
+            self._templated_start,
             templated_file=self.templated_file,
             # Start points also pass on the working position.
             working_line_no=self.working_line_no,
@@ -147,8 +233,8 @@ class PositionMarker:
     def end_point_marker(self) -> "PositionMarker":
         """Get a point marker from the end."""
         return self.__class__.from_point(
-            self.source_slice.stop,
-            self.templated_slice.stop,
+            self._source_stop,
+            self._templated_stop,
             templated_file=self.templated_file,
         )
 
@@ -159,8 +245,9 @@ class PositionMarker:
 
     def is_point(self) -> bool:
         """A marker is a point if it has zero length in templated and source file."""
-        return self.slice_is_point(self.source_slice) and self.slice_is_point(
-            self.templated_slice
+        return (
+            self._source_start == self._source_stop
+            and self._templated_start == self._templated_stop
         )
 
     @staticmethod
@@ -180,6 +267,9 @@ class PositionMarker:
 
     def with_working_position(self, line_no: int, line_pos: int):
         """Copy this position and replace the working position."""
+        if line_no == self.working_line_no and line_pos == self.working_line_pos:
+            # There's nothing to replace, so there's no need for a copy.
+            return self
         return self.__class__(
             source_slice=self.source_slice,
             templated_slice=self.templated_slice,
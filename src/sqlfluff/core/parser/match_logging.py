@@ -1,7 +1,12 @@
 """Classes to help with match logging."""
 
+import logging
+
 from sqlfluff.core.parser.helpers import join_segments_raw_curtailed
 
+# The log levels used for each verbosity level in `LateLoggingObject.log()`.
+_log_levels = {3: logging.INFO, 4: logging.DEBUG}
+
 
 class LateLoggingObject:
     """A basic late binding log object for parse_match_logging.
@@ -73,6 +78,10 @@ class ParseMatchLogObject(LateLoggingObject):
 
 def parse_match_logging(grammar, func, msg, parse_context, v_level=3, **kwargs):
     """Log in a particular consistent format for use while matching."""
+    # If the logger wouldn't use it, then don't even build the log object.
+    log_level = _log_levels.get(v_level)
+    if log_level is None or not parse_context.logger.isEnabledFor(log_level):
+        return
     # Make a late bound log object so we only do the string manipulation when we need to.
     ParseMatchLogObject(
         parse_context, grammar, func, msg, v_level=v_level, **kwargs
@@ -86,8 +95,27 @@ class LateBoundJoinSegmentsCurtailed:
     until actually required by the logger.
     """
 
-    def __init__(self, segments):
+    __slots__ = "segments", "length"
+
+    def __init__(self, segments, length=20):
         self.segments = segments
+        self.length = length
+
+    def __str__(self):
+        return repr(join_segments_raw_curtailed(self.segments, length=self.length))
+
+
+class LateBoundStringify:
+    """Object to delay `segment.stringify()` until later.
+
+    Stringifying a segment walks its whole subtree, so we only
+    want to do it if the logger actually needs the string.
+    """
+
+    __slots__ = ("segment",)
+
+    def __init__(self, segment):
+        self.segment = segment
 
     def __str__(self):
-        return repr(join_segments_raw_curtailed(self.segments))
+        return self.segment.stringify()
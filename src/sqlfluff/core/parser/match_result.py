@@ -85,6 +85,11 @@ class MatchResult(
     @staticmethod
     def seg_to_tuple(segs) -> Tuple["BaseSegment", ...]:
         """Munge types to a tuple."""
+        # Tuples are immutable, so there's no need to copy them. This is
+        # called with the rest of the file as the unmatched segments, so
+        # copying them would make matching quadratic.
+        if isinstance(segs, tuple):
+            return segs
         # Is other iterable?
         try:
             iterator = iter(segs)
@@ -113,16 +118,3 @@ class MatchResult(
     def from_empty(cls) -> "MatchResult":
         """Construct an empty `MatchResult`."""
         return cls(unmatched_segments=(), matched_segments=())
-
-    def __add__(self, other) -> "MatchResult":
-        """Override add for concatenating things onto this match."""
-        if isinstance(other, MatchResult):
-            return self.__class__(
-                matched_segments=self.matched_segments + other.matched_segments,
-                unmatched_segments=self.unmatched_segments,
-            )  # pragma: no cover TODO?
-        else:
-            return self.__class__(
-                matched_segments=self.matched_segments + self.seg_to_tuple(other),
-                unmatched_segments=self.unmatched_segments,
-            )
@@ -1,6 +1,11 @@
 """Defines the Parser class."""
 
-from typing import Optional, Sequence, TYPE_CHECKING
+import io
+import logging
+import multiprocessing
+import pickle
+import signal
+from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from sqlfluff.core.parser.context import RootParseContext
 from sqlfluff.core.config import FluffConfig
@@ -8,10 +13,109 @@ from sqlfluff.core.config import FluffConfig
 if TYPE_CHECKING:
     from sqlfluff.core.parser.segments import BaseSegment  # pragma: no cover
 
+# Instantiate the parser logger
+parser_logger = logging.getLogger("sqlfluff.parser")
+
+# The parser and tokens of a parallel parse, in each worker process.
+_worker_parser: Optional["Parser"] = None
+_worker_segments: Sequence["BaseSegment"] = ()
+
+
+def split_top_level_statements(
+    segments: Sequence["BaseSegment"], delimiters: Sequence[str]
+) -> List[int]:
+    """Find where a series of lexed tokens can be split into statements.
+
+    We split after a delimiter (or run of delimiters) which isn't in
+    brackets or in a templated block, and is followed by more code.
+
+    Returns:
+        :obj:`list` of :obj:`int`: The indices at which to split,
+        i.e. the index of the first token of each statement after the
+        first.
+    """
+    splits = []
+    bracket_depth = 0
+    indent_balance = 0
+    pending = None
+    for idx, seg in enumerate(segments):
+        if seg.is_meta:
+            indent_balance += seg.indent_val  # type: ignore
+            continue
+        if not seg.is_code:
+            continue
+        if seg.raw in delimiters:
+            if not bracket_depth and not indent_balance:
+                pending = idx + 1
+            continue
+        if pending is not None:
+            splits.append(pending)
+            pending = None
+        if seg.raw == "(":
+            bracket_depth += 1
+        elif seg.raw == ")":
+            bracket_depth = max(bracket_depth - 1, 0)
+    return splits
+
+
+def _init_parse_worker(parser, segments):  # pragma: no cover
+    """Set up a worker process for a parallel parse."""
+    global _worker_parser, _worker_segments
+    _worker_parser = parser
+    _worker_segments = segments
+    # Leave handling keyboard interrupts to the parent process.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class _TemplatedFilePickler(pickle.Pickler):
+    """Pickles segments without their `TemplatedFile`.
+
+    Every position marker references the templated file, so this
+    saves sending a copy of the whole file back with every batch.
+    """
+
+    def __init__(self, file, templated_file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.templated_file = templated_file
+
+    def persistent_id(self, obj):
+        if obj is self.templated_file:
+            return "templated_file"
+        return None
+
+
+class _TemplatedFileUnpickler(pickle.Unpickler):
+    """Unpickles segments, pointing them back at the `TemplatedFile`."""
+
+    def __init__(self, file, templated_file):
+        super().__init__(file)
+        self.templated_file = templated_file
+
+    def persistent_load(self, pid):
+        return self.templated_file
+
+
+def _parse_batch(args: Tuple[int, int, bool, Optional[str]]) -> bytes:
+    """Parse one batch of statements, in a worker process."""
+    start, stop, recurse, fname = args
+    assert _worker_parser
+    segments = _worker_segments[start:stop]
+    parsed = _worker_parser._parse_root(segments, recurse, fname)
+    buffer = io.BytesIO()
+    _TemplatedFilePickler(buffer, segments[0].pos_marker.templated_file).dump(
+        parsed.segments
+    )
+    return buffer.getvalue()
+
 
 class Parser:
     """Instantiates parsed queries from a sequence of lexed raw segments."""
 
+    # The fewest statements it's worth parsing in batches, and the
+    # number of batches to split them into for each process.
+    parallel_min_statements = 20
+    parallel_batches_per_process = 4
+
     def __init__(
         self, config: Optional[FluffConfig] = None, dialect: Optional[str] = None
     ):
@@ -19,20 +123,176 @@ class Parser:
         self.config = FluffConfig.from_kwargs(config=config, dialect=dialect)
         self.RootSegment = self.config.get("dialect_obj").get_root_segment()
 
-    def parse(
+    def _parse_root(
         self,
         segments: Sequence["BaseSegment"],
         recurse=True,
-        fname: str = None,
-    ) -> Optional["BaseSegment"]:
-        """Parse a series of lexed tokens using the current dialect."""
-        if not segments:
-            return None
+        fname: Optional[str] = None,
+    ) -> "BaseSegment":
+        """Parse a series of lexed tokens as a root segment."""
         # Instantiate the root segment
         root_segment = self.RootSegment(segments=segments, fname=fname)
         # Call .parse() on that segment
 
         with RootParseContext.from_config(config=self.config, recurse=recurse) as ctx:
             parsed = root_segment.parse(parse_context=ctx)
+            ctx.logger.info(
+                "Parse memo: %s hits, %s misses.", ctx.memo.hits, ctx.memo.misses
+            )
 
         return parsed
+
+    def _batch_statements(
+        self,
+        segments: Sequence["BaseSegment"],
+        target_size: float,
+        recurse=True,
+        fname: Optional[str] = None,
+    ) -> Optional[List[Tuple[int, int, bool, Optional[str]]]]:
+        """Group a series of lexed tokens into batches of whole statements.
+
+        Returns:
+            :obj:`list` of the arguments to parse each batch with (its
+            bounds, `recurse` and `fname`), or None if the tokens can't
+            be split or there are too few statements to be worth it.
+        """
+        delimiters = getattr(self.RootSegment, "statement_delimiters", ())
+        if not delimiters:
+            return None
+        splits = split_top_level_statements(segments, delimiters)
+        if len(splits) + 1 < self.parallel_min_statements:
+            return None
+
+        batches = []
+        start = 0
+        for split in splits:
+            if split - start >= target_size:
+                batches.append((start, split, recurse, fname))
+                start = split
+        batches.append((start, len(segments), recurse, fname))
+        parser_logger.info(
+            "Parsing %s statements in %s batches.", len(splits) + 1, len(batches)
+        )
+        return batches
+
+    @staticmethod
+    def _has_unparsable(batch: Sequence["BaseSegment"]) -> bool:
+        """Check a parsed batch for unparsable sections."""
+        return any(True for seg in batch for _ in seg.iter_unparsables())
+
+    def _parse_in_batches(
+        self,
+        segments: Sequence["BaseSegment"],
+        batch_size: int,
+        recurse=True,
+        fname: Optional[str] = None,
+    ) -> Optional["BaseSegment"]:
+        """Parse the statements in a series of lexed tokens, a batch at a time.
+
+        This is like `_parse_in_parallel`, but in this process and with
+        batches of a fixed size, so that the time to parse a long file
+        grows in proportion to its number of statements.
+
+        A batch with an unparsable section may have been split in the
+        middle of a statement, so it's parsed again along with the next
+        batch. If that still doesn't parse, the result is kept as it is
+        (along with the batches either side of it), rather than parsing
+        the file as a whole.
+
+        Returns:
+            The parsed root segment, or None if the tokens can't be split.
+        """
+        batches = self._batch_statements(segments, batch_size, recurse, fname)
+        if not batches or len(batches) < 2:
+            return None
+        children: List["BaseSegment"] = []
+        idx = 0
+        while idx < len(batches):
+            start, stop, _, _ = batches[idx]
+            batch = self._parse_root(segments[start:stop], recurse, fname).segments
+            idx += 1
+            if self._has_unparsable(batch) and idx < len(batches):
+                parser_logger.info(
+                    "Unparsable section in a batch. Parsing it with the next one."
+                )
+                stop = batches[idx][1]
+                batch = self._parse_root(segments[start:stop], recurse, fname).segments
+                idx += 1
+            children += batch
+        return self.RootSegment(segments=children, fname=fname)
+
+    def _parse_in_parallel(
+        self,
+        segments: Sequence["BaseSegment"],
+        processes: int,
+        recurse=True,
+        fname: Optional[str] = None,
+    ) -> Optional["BaseSegment"]:
+        """Parse the statements in a series of lexed tokens in a process pool.
+
+        The tokens are split into batches of whole statements, each
+        of which is parsed as a root segment of its own. The children
+        of those are then stitched back together into one root segment.
+        The tokens aren't changed by parsing, so all the position
+        markers are still those of the whole file.
+
+        Returns:
+            The parsed root segment, or None if the tokens can't be
+            split, or if any batch doesn't parse cleanly, in which case
+            the file should be parsed as a whole instead.
+        """
+        # Group the statements into batches of roughly equal numbers of tokens.
+        n_batches = processes * self.parallel_batches_per_process
+        batches = self._batch_statements(
+            segments, len(segments) / n_batches, recurse, fname
+        )
+        if not batches:
+            return None
+
+        parser_logger.info("Parsing batches with %s processes.", processes)
+        templated_file = segments[0].pos_marker.templated_file
+        children: List["BaseSegment"] = []
+        with multiprocessing.Pool(
+            processes, _init_parse_worker, (self, segments)
+        ) as pool:
+            for result in pool.imap(_parse_batch, batches):
+                batch = _TemplatedFileUnpickler(
+                    io.BytesIO(result), templated_file
+                ).load()
+                if self._has_unparsable(batch):
+                    parser_logger.info(
+                        "Unparsable section in a batch. "
+                        "Parsing the file as a whole instead."
+                    )
+                    pool.terminate()
+                    return None
+                children += batch
+        return self.RootSegment(segments=children, fname=fname)
+
+    def parse(
+        self,
+        segments: Sequence["BaseSegment"],
+        recurse=True,
+        fname: str = None,
+    ) -> Optional["BaseSegment"]:
+        """Parse a series of lexed tokens using the current dialect.
+
+        If the `parse_processes` config value is more than one, the
+        statements are parsed in a process pool where possible. Otherwise,
+        if `parse_batch_size` is set, files with more tokens than that are
+        parsed a batch of statements at a time.
+        """
+        if not segments:
+            return None
+        processes = self.config.get("parse_processes") or 1
+        batch_size = self.config.get("parse_batch_size") or 0
+        parsed = None
+        # Daemonic processes (e.g. those linting files in parallel)
+        # can't start processes of their own.
+        if processes > 1 and not multiprocessing.current_process().daemon:
+            parsed = self._parse_in_parallel(segments, processes, recurse, fname)
+        elif batch_size and len(segments) > batch_size:
+            parsed = self._parse_in_batches(segments, batch_size, recurse, fname)
+        if parsed:
+            return parsed
+        return self._parse_root(segments, recurse, fname)
@@ -9,20 +9,30 @@ Here we define:
 """
 
 from io import StringIO
-from typing import Any, Callable, Optional, List, Tuple, NamedTuple, Iterator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Optional,
+    List,
+    Tuple,
+    NamedTuple,
+    Iterator,
+)
 import logging
 
 from tqdm import tqdm
 
-from sqlfluff.core.cached_property import cached_property
 from sqlfluff.core.config import progress_bar_configuration
-from sqlfluff.core.string_helpers import (
-    frame_msg,
-    curtail_string,
-)
+from sqlfluff.core.string_helpers import frame_msg
 
 from sqlfluff.core.parser.match_result import MatchResult
-from sqlfluff.core.parser.match_logging import parse_match_logging
+from sqlfluff.core.parser.match_logging import (
+    parse_match_logging,
+    LateBoundJoinSegmentsCurtailed,
+    LateBoundStringify,
+)
 from sqlfluff.core.parser.match_wrapper import match_wrapper
 from sqlfluff.core.parser.helpers import (
     check_still_complete,
@@ -47,7 +57,69 @@ class FixPatch(NamedTuple):
     patch_category: str
 
 
-class BaseSegment:
+# The bit for each segment type, in masks of segment types. Bits are
+# given out as types are first seen, so differ between processes.
+_type_bits: Dict[str, int] = {}
+
+
+def type_mask(*seg_type: str) -> int:
+    """Get a bitmask of some segment types.
+
+    The masks of two sets of types only have a bit in common if
+    the sets have a type in common.
+    """
+    mask = 0
+    for t in seg_type:
+        try:
+            mask |= _type_bits[t]
+        except KeyError:
+            mask |= _type_bits.setdefault(t, 1 << len(_type_bits))
+    return mask
+
+
+class SegmentMetaclass(type):
+    """The metaclass of segments, which keeps their instances compact.
+
+    Segments are by far the most numerous objects while linting, so their
+    instances don't have a `__dict__`. Segment classes which don't declare
+    `__slots__` are given empty ones, unless they define an `__init__`
+    (which might set attributes of their own).
+
+    Each class also gets the set of types it is, as `_class_types`, so
+    that checking the type of a segment is just a set lookup, and the
+    mask of them, as `_class_type_mask`. It also gets the `__slots__` of
+    it and its parents to pickle, as `_pickled_slots`.
+    """
+
+    def __new__(mcs, name, bases, class_dict):
+        """Give the new class empty `__slots__` if it needs them."""
+        if "__slots__" not in class_dict and "__init__" not in class_dict:
+            class_dict["__slots__"] = ()
+        new_class = super().__new__(mcs, name, bases, class_dict)
+        # A class is its own type, and that of each of its parents, up to
+        # the first with the "base" type.
+        class_types = {new_class.type}
+        for base_class in bases:
+            if base_class is object:
+                break
+            class_types.add(base_class.type)
+            if base_class.type == "base":
+                break
+        new_class._class_types = frozenset(class_types)
+        new_class._class_type_mask = type_mask(*class_types)
+        # The cached properties aren't pickled, because the type masks
+        # wouldn't be right in another process.
+        cache_slots = getattr(new_class, "_cache_slots", ())
+        new_class._pickled_slots = tuple(
+            slot
+            for cls in new_class.__mro__
+            for slot in cls.__dict__.get("__slots__", ())
+            if slot not in cache_slots
+        )
+        return new_class
+
+
+class BaseSegment(metaclass=SegmentMetaclass):
     """The base segment element.
 
     This defines the base element which drives both Lexing, Parsing and Linting.
@@ -81,6 +153,31 @@ class BaseSegment:
     allow_empty = False
     # What other kwargs need to be copied when applying fixes.
     additional_kwargs: List[str] = []
+    # The types this class is, and the slots to pickle. Set by the metaclass.
+    _class_types: FrozenSet[str]
+    _class_type_mask: int
+    _pickled_slots: Tuple[str, ...]
+    _cached_descendant_type_mask: int
+
+    # The cached properties are stored in slots, and cleared whenever the
+    # child segments change.
+    _cache_slots = (
+        "_cached_is_code",
+        "_cached_is_comment",
+        "_cached_is_whitespace",
+        "_cached_raw",
+        "_cached_raw_upper",
+        "_cached_matched_length",
+        "_cached_raw_segments",
+        "_cached_raw_segments_upper",
+        "_cached_descendant_type_mask",
+    )
+    __slots__ = (
+        "_is_expandable",
+        "_surrogate_name",
+        "_segments",
+        "pos_marker",
+    ) + _cache_slots
 
     def __init__(
         self,
@@ -100,13 +197,14 @@ class BaseSegment:
                 )
             )
 
+        # NB: There's nothing cached yet, so we set the private attribute.
         if hasattr(segments, "matched_segments"):  # pragma: no cover TODO?
             # Safely extract segments from a match
-            self.segments = segments.matched_segments
+            self._segments = segments.matched_segments
         elif isinstance(segments, tuple):
-            self.segments = segments
+            self._segments = segments
         elif isinstance(segments, list):
-            self.segments = tuple(segments)
+            self._segments = tuple(segments)
         else:  # pragma: no cover
             raise TypeError(f"Unexpected type passed to BaseSegment: {type(segments)}")
 
@@ -122,19 +220,6 @@ class BaseSegment:
                 )
         self.pos_marker: PositionMarker = pos_marker
 
-        self._recalculate_caches()
-
-    def __setattr__(self, key, value):
-
-        try:
-            if key == "segments":
-                self._recalculate_caches()
-
-        except (AttributeError, KeyError):  # pragma: no cover
-            pass
-
-        super().__setattr__(key, value)
-
     def __eq__(self, other):
         # NB: this should also work for RawSegment
         return (
@@ -165,6 +250,20 @@ class BaseSegment:
     def __repr__(self):
         return f"<{self.__class__.__name__}: ({self.pos_marker})>"
 
+    def __getstate__(self):
+        """Get the state to pickle, without the cached properties.
+
+        This is in the `(dict, slots)` form which `pickle` restores by
+        default.
+        """
+        slots = {}
+        for slot in self._pickled_slots:
+            try:
+                slots[slot] = getattr(self, slot)
+            except AttributeError:
+                pass
+        return getattr(self, "__dict__", None), slots
+
     # ################ PRIVATE PROPERTIES
 
     @property
@@ -179,6 +278,16 @@ class BaseSegment:
 
     # ################ PUBLIC PROPERTIES
 
+    @property
+    def segments(self):
+        """The child segments of this segment."""
+        return self._segments
+
+    @segments.setter
+    def segments(self, segments):
+        self._segments = segments
+        self._recalculate_caches()
+
     @property
     def name(self):
         """The name of this segment.
@@ -216,49 +325,103 @@ class BaseSegment:
             self._is_expandable = False
             return False
 
-    @cached_property
+    @property
     def is_code(self):
         """Return True if this segment contains any code."""
-        return any(seg.is_code for seg in self.segments)
+        try:
+            return self._cached_is_code
+        except AttributeError:
+            self._cached_is_code = any(seg.is_code for seg in self.segments)
+            return self._cached_is_code
 
-    @cached_property
+    @property
     def is_comment(self):  # pragma: no cover TODO?
         """Return True if this is entirely made of comments."""
-        return all(seg.is_comment for seg in self.segments)
+        try:
+            return self._cached_is_comment
+        except AttributeError:
+            self._cached_is_comment = all(seg.is_comment for seg in self.segments)
+            return self._cached_is_comment
 
-    @cached_property
+    @property
     def is_whitespace(self):
         """Return True if this segment is entirely whitespace."""
-        return all(seg.is_whitespace for seg in self.segments)
+        try:
+            return self._cached_is_whitespace
+        except AttributeError:
+            self._cached_is_whitespace = all(seg.is_whitespace for seg in self.segments)
+            return self._cached_is_whitespace
 
-    @cached_property
+    @property
     def raw(self):
         """Make a string from the segments of this segment."""
-        return "".join(seg.raw for seg in self.segments)
+        try:
+            return self._cached_raw
+        except AttributeError:
+            self._cached_raw = "".join(seg.raw for seg in self.segments)
+            return self._cached_raw
 
-    @cached_property
+    @property
     def raw_upper(self):
         """Make an uppercase string from the segments of this segment."""
-        return self.raw.upper()
+        try:
+            return self._cached_raw_upper
+        except AttributeError:
+            self._cached_raw_upper = self.raw.upper()
+            return self._cached_raw_upper
 
-    @cached_property
+    @property
     def matched_length(self):
         """Return the length of the segment in characters."""
-        return sum(seg.matched_length for seg in self.segments)
+        try:
+            return self._cached_matched_length
+        except AttributeError:
+            self._cached_matched_length = sum(
+                seg.matched_length for seg in self.segments
+            )
+            return self._cached_matched_length
 
-    @cached_property
+    @property
     def raw_segments(self):
         """Returns a list of raw segments in this segment."""
-        return self.get_raw_segments()
+        try:
+            return self._cached_raw_segments
+        except AttributeError:
+            self._cached_raw_segments = self.get_raw_segments()
+            return self._cached_raw_segments
 
-    @cached_property
+    @property
+    def class_type_mask(self) -> int:
+        """The mask of the types of this segment (see `type_mask`)."""
+        return self._class_type_mask
+
+    @property
+    def descendant_type_mask(self) -> int:
+        """The mask of the types of all the segments within this one.
+
+        This allows searches (e.g. `recursive_crawl`) to skip any
+        segments which can't contain what they're looking for.
+        """
+        try:
+            return self._cached_descendant_type_mask
+        except AttributeError:
+            mask = 0
+            for seg in self.segments:
+                mask |= seg.class_type_mask | seg.descendant_type_mask
+            self._cached_descendant_type_mask = mask
+            return mask
+
+    @property
     def raw_segments_upper(self):
         """Returns the first non-whitespace subsegment of this segment."""
-        for seg in self.raw_segments:
-            if seg.raw_upper.strip():
-                return seg.raw_upper
-        return None
-        # return [seg.raw_upper for seg in self.raw_segments]
+        try:
+            return self._cached_raw_segments_upper
+        except AttributeError:
+            self._cached_raw_segments_upper = next(
+                (seg.raw_upper for seg in self.raw_segments if seg.raw_upper.strip()),
+                None,
+            )
+            return self._cached_raw_segments_upper
 
     # ################ STATIC METHODS
 
@@ -278,7 +441,9 @@ class BaseSegment:
     @classmethod
     def expand(cls, segments, parse_context):
         """Expand the list of child segments using their `parse` methods."""
-        segs = ()
+        # NB: Build a list and make a tuple of it at the end, because
+        # adding to a tuple each time is quadratic in the number of segments.
+        segs: List[BaseSegment] = []
 
         # Renders progress bar only for `BaseFileSegments`.
         disable_progress_bar = (
@@ -302,7 +467,7 @@ class BaseSegment:
                         parse_context.parse_depth,
                         stmt,
                     )
-                    segs += (stmt,)
+                    segs.append(stmt)
                     continue
             except Exception as err:  # pragma: no cover
                 parse_context.logger.error(
@@ -316,22 +481,23 @@ class BaseSegment:
                         stmt
                     )
                 )
-            parse_depth_msg = "Parse Depth {}. Expanding: {}: {!r}".format(
+            parse_context.logger.info(
+                frame_msg("Parse Depth %s. Expanding: %s: %s"),
                 parse_context.parse_depth,
                 stmt.__class__.__name__,
-                curtail_string(stmt.raw, length=40),
+                LateBoundJoinSegmentsCurtailed((stmt,), length=40),
             )
-            parse_context.logger.info(frame_msg(parse_depth_msg))
             res = stmt.parse(parse_context=parse_context)
             if isinstance(res, BaseSegment):
-                segs += (res,)
+                segs.append(res)
             else:
                 # We might get back an iterable of segments
-                segs += tuple(res)
+                segs.extend(res)
 
         # Basic Validation
-        check_still_complete(segments, segs, ())
-        return segs
+        expanded = tuple(segs)
+        check_still_complete(segments, expanded, ())
+        return expanded
 
     @classmethod
     def _position_segments(cls, segments, parent_pos=None):
@@ -434,18 +600,7 @@ class BaseSegment:
     @classmethod
     def class_is_type(cls, *seg_type):
         """Is this segment class (or its parent) of the given type."""
-        # Do we match on the type of _this_ class.
-        if cls.type in seg_type:
-            return True
-        # If not, check types of parents.
-        for base_class in cls.__bases__:
-            if base_class is object:
-                break
-            elif base_class.type in seg_type:
-                return True
-            elif base_class.type == "base":
-                break
-        return False
+        return not cls._class_types.isdisjoint(seg_type)
 
     @classmethod
     def structural_simplify(cls, elem):
@@ -541,17 +696,9 @@ class BaseSegment:
 
     def _recalculate_caches(self):
 
-        for key in [
-            "is_code",
-            "is_comment",
-            "is_whitespace",
-            "raw",
-            "raw_upper",
-            "matched_length",
-            "raw_segments",
-            "raw_segments_upper",
-        ]:
-            self.__dict__.pop(key, None)
+        for key in self._cache_slots:
+            if hasattr(self, key):
+                delattr(self, key)
 
     def _preface(self, ident, tabsize):
         """Returns the preamble to any logging."""
@@ -576,7 +723,7 @@ class BaseSegment:
 
     def is_type(self, *seg_type):
         """Is this segment (or its parent) of the given type."""
-        return self.class_is_type(*seg_type)
+        return not self._class_types.isdisjoint(seg_type)
 
     def get_name(self):
         """Returns the name of this segment as a string."""
@@ -779,6 +926,10 @@ class BaseSegment:
             recurse_into: :obj:`bool`: When an element of type "seg_type" is
                 found, whether to recurse into it.
         """
+        return self._recursive_crawl(seg_type, type_mask(*seg_type), recurse_into)
+
+    def _recursive_crawl(self, seg_type, mask, recurse_into):
+        """Recursively crawl for segments of the given types and their mask."""
         # Check this segment
         if self.is_type(*seg_type):
             match = True
@@ -786,9 +937,10 @@ class BaseSegment:
         else:
             match = False
         if recurse_into or not match:
-            # Recurse
+            # Recurse, but only into segments with anything to find.
             for seg in self.segments:
-                yield from seg.recursive_crawl(*seg_type, recurse_into=recurse_into)
+                if (seg.class_type_mask | seg.descendant_type_mask) & mask:
+                    yield from seg._recursive_crawl(seg_type, mask, recurse_into)
 
     def path_to(self, other):
         """Given a segment which is assumed within self, get the intermediate segments.
@@ -834,9 +986,11 @@ class BaseSegment:
         provided which will override any existing parse grammar
         on the segment.
         """
-        # Clear the denylist cache so avoid missteps
+        # Clear the memo table so avoid missteps. Segments are
+        # mutated by parsing, so results can't be reused between
+        # different parse calls.
         if parse_context:
-            parse_context.denylist.clear()
+            parse_context.memo.clear()
 
         # the parse_depth and recurse kwargs control how deep we will recurse for testing.
         if not self.segments:  # pragma: no cover TODO?
@@ -848,9 +1002,8 @@ class BaseSegment:
         if parse_grammar is None:
             # No parse grammar, go straight to expansion
             parse_context.logger.debug(
-                "{}.parse: no grammar. Going straight to expansion".format(
-                    self.__class__.__name__
-                )
+                "%s.parse: no grammar. Going straight to expansion",
+                self.__class__.__name__,
             )
         else:
             # For debugging purposes. Ensure that we don't have non-code elements
@@ -930,15 +1083,17 @@ class BaseSegment:
                 )
         # Recurse if allowed (using the expand method to deal with the expansion)
         parse_context.logger.debug(
-            "{}.parse: Done Parse. Plotting Recursion. Recurse={!r}".format(
-                self.__class__.__name__, parse_context.recurse
-            )
-        )
-        parse_depth_msg = "###\n#\n# Beginning Parse Depth {}: {}\n#\n###\nInitial Structure:\n{}".format(
-            parse_context.parse_depth + 1, self.__class__.__name__, self.stringify()
+            "%s.parse: Done Parse. Plotting Recursion. Recurse=%r",
+            self.__class__.__name__,
+            parse_context.recurse,
         )
         if parse_context.may_recurse():
-            parse_context.logger.debug(parse_depth_msg)
+            parse_context.logger.debug(
+                "###\n#\n# Beginning Parse Depth %s: %s\n#\n###\nInitial Structure:\n%s",
+                parse_context.parse_depth + 1,
+                self.__class__.__name__,
+                LateBoundStringify(self),
+            )
             with parse_context.deeper_parse() as ctx:
                 self.segments = self.expand(
                     self.segments,
@@ -963,6 +1118,11 @@ class BaseSegment:
             # become a working copy.
             r = self
 
+            # Invalidate any caches (e.g. the type masks used by
+            # recursive_crawl), in case any segments have been mutated.
+            # The segments we build below start with empty caches.
+            self.invalidate_caches()
+
             # Make a working copy
             seg_buffer = []
             todo_buffer = list(self.segments)
@@ -1021,8 +1181,6 @@ class BaseSegment:
                         seg_buffer.append(seg)
                 # Switch over the the unused list
                 fixes = unused_fixes + fix_buff
-                # Invalidate any caches
-                self.invalidate_caches()
 
             # Then recurse (i.e. deal with the children) (Requeueing)
             seg_queue = seg_buffer
@@ -1151,6 +1309,7 @@ class BracketedSegment(BaseSegment):
 
     type = "bracketed"
     additional_kwargs = ["start_bracket", "end_bracket"]
+    __slots__ = ("start_bracket", "end_bracket")
 
     def __init__(
         self,
@@ -1203,7 +1362,7 @@ class UnparsableSegment(BaseSegment):
     type = "unparsable"
     # From here down, comments are printed separately.
     comment_separate = True
-    _expected = ""
+    __slots__ = ("_expected",)
 
     def __init__(self, *args, expected="", **kwargs):
         self._expected = expected
@@ -1237,6 +1396,11 @@ class BaseFileSegment(BaseSegment):
     can_start_end_non_code = True
     # A file can be empty!
     allow_empty = True
+    # The raw delimiters at which the file can be split into statements
+    # which parse independently, so that they can be parsed in parallel.
+    # Empty if the file can't be split.
+    statement_delimiters: Tuple[str, ...] = ()
+    __slots__ = ("_file_path",)
 
     def __init__(
         self,
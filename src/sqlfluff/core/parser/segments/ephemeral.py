@@ -17,6 +17,7 @@ class EphemeralSegment(BaseSegment):
     """
 
     type = "ephemeral"
+    __slots__ = ("_parse_grammar",)
 
     def __init__(self, segments, pos_marker, parse_grammar, name: Optional[str] = None):
         # Stash the parse grammar for now.
@@ -14,6 +14,7 @@ class MetaSegment(RawSegment):
     _template = "<unset>"
     indent_val = 0
     is_meta = True
+    __slots__ = ("is_template",)
 
     def __init__(self, is_template=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -92,6 +93,7 @@ class TemplateSegment(MetaSegment):
     """
 
     type = "placeholder"
+    __slots__ = ("source_str", "block_type")
 
     def __init__(self, pos_marker=None, source_str="", block_type=""):
         """Initialise a placeholder with the source code embedded."""
@@ -6,7 +6,7 @@ any children, and the output of the lexer.
 
 from typing import Optional, Tuple
 
-from sqlfluff.core.parser.segments.base import BaseSegment
+from sqlfluff.core.parser.segments.base import BaseSegment, type_mask
 from sqlfluff.core.parser.markers import PositionMarker
 
 
@@ -20,6 +20,7 @@ class RawSegment(BaseSegment):
     # Classes inheriting from RawSegment may provide a _default_raw
     # to enable simple initialisation.
     _default_raw = ""
+    __slots__ = ("_raw", "_raw_upper", "_surrogate_type", "trim_start", "trim_chars")
 
     def __init__(
         self,
@@ -51,18 +52,12 @@ class RawSegment(BaseSegment):
         # What should we trim off the ends to get to content
         self.trim_start = trim_start
         self.trim_chars = trim_chars
-        # A cache variable for expandable
-        self._is_expandable = None
 
     def __repr__(self):
         return "<{}: ({}) {!r}>".format(
             self.__class__.__name__, self.pos_marker, self.raw
         )
 
-    def __setattr__(self, key, value):
-        """Overwrite BaseSegment's __setattr__ with BaseSegment's superclass."""
-        super(BaseSegment, self).__setattr__(key, value)
-
     # ################ PUBLIC PROPERTIES
 
     @property
@@ -106,6 +101,23 @@ class RawSegment(BaseSegment):
         return [self]
 
     @property
+    def class_type_mask(self):
+        """The mask of the types of this segment, and any surrogate type."""
+        if self._surrogate_type:
+            return self._class_type_mask | type_mask(self._surrogate_type)
+        return self._class_type_mask
+
+    @property
+    def descendant_type_mask(self):
+        """Raw segments have no segments within them."""
+        return 0
+
+    @property
+    def raw_segments_upper(self):
+        """Returns the raw segment in uppercase, if it's not whitespace."""
+        return self._raw_upper if self._raw_upper.strip() else None
+
+    @property  # type: ignore
     def segments(self):
         """Return an empty list of child segments.
 
@@ -127,7 +139,7 @@ class RawSegment(BaseSegment):
         """Extend the parent class method with the surrogate types."""
         if self._surrogate_type and self._surrogate_type in seg_type:
             return True
-        return self.class_is_type(*seg_type)
+        return not self._class_types.isdisjoint(seg_type)
 
     def get_raw_segments(self):
         """Iterate raw segments, mostly for searching."""
@@ -253,6 +265,7 @@ class KeywordSegment(CodeSegment):
     """
 
     type = "keyword"
+    __slots__ = ()
 
     def __init__(
         self,
@@ -1,13 +1,25 @@
 """Defines the plugin manager getter."""
+from typing import Optional
+
 import pluggy
 
 from sqlfluff.core.plugin.hookspecs import PluginSpec
 from sqlfluff.core.plugin import plugin_base_name, project_name
 
+# The plugin manager, once it's been initialised.
+_plugin_manager: Optional[pluggy.PluginManager] = None
+
 
 def get_plugin_manager() -> pluggy.PluginManager:
-    """Initializes the PluginManager."""
-    pm = pluggy.PluginManager(plugin_base_name)
-    pm.add_hookspecs(PluginSpec)
-    pm.load_setuptools_entrypoints(project_name)
-    return pm
+    """Initializes the PluginManager.
+
+    Loading plugins scans all the installed entry points, which is
+    slow, so we only do it once and then reuse the same manager.
+    """
+    global _plugin_manager
+    if _plugin_manager is None:
+        pm = pluggy.PluginManager(plugin_base_name)
+        pm.add_hookspecs(PluginSpec)
+        pm.load_setuptools_entrypoints(project_name)
+        _plugin_manager = pm
+    return _plugin_manager
@@ -20,7 +20,8 @@ import fnmatch
 import logging
 import pathlib
 import regex
-from typing import Iterable, Optional, List, Set, Tuple, Union, Any
+import time
+from typing import Any, Dict, Iterable, Optional, List, Set, Tuple, Union, cast
 from collections import namedtuple
 from dataclasses import dataclass
 
@@ -410,6 +411,15 @@ class BaseRule:
     _check_docstring = True
     _works_on_unparsable = True
     targets_templated = False
+    # If set, `_eval` is only called on segments of these types (although
+    # their children are still crawled). Rules which need to see every
+    # segment (e.g. to keep track of things in `memory`) shouldn't set it.
+    target_types: Optional[Tuple[str, ...]] = None
+    # Set on rules which only check the start or the end of a file. When
+    # large files are linted in chunks, they're only applied to the first
+    # or last chunk respectively, rather than at every chunk boundary.
+    checks_file_start = False
+    checks_file_end = False
 
     def __init__(self, code, description, **kwargs):
         self.description = description
@@ -473,47 +483,52 @@ class BaseRule:
         memory=None,
         fname=None,
         templated_file: Optional["TemplatedFile"] = None,
+        rule_timings: Optional[Dict[str, Dict[str, float]]] = None,
     ):
         """Recursively perform the crawl operation on a given segment.
 
+        To crawl with several rules at once, use :func:`crawl_rules`.
+        If `rule_timings` is given, the timing of this rule is added to
+        it, as for :func:`crawl_rules`.
+
         Returns:
             A tuple of (vs, raw_stack, fixes, memory)
 
         """
-        # parent stack should be a tuple if it exists
+        state = _RuleCrawlState(self, memory=memory, raw_stack=raw_stack or ())
+        _MultiRuleCrawler(
+            ignore_mask=ignore_mask,
+            dialect=dialect,
+            fname=fname,
+            templated_file=templated_file,
+        ).crawl(
+            segment,
+            [state],
+            parent_stack=parent_stack or (),
+            siblings_pre=siblings_pre or (),
+            siblings_post=siblings_post or (),
+        )
+        if rule_timings is not None:
+            state.record_timing(rule_timings)
+        return state.vs, tuple(state.raw_stack or ()), state.fixes, state.memory
 
-        # Rules should evaluate on segments FIRST, before evaluating on their
-        # children. They should also return a list of violations.
-
-        parent_stack = parent_stack or ()
-        raw_stack = raw_stack or ()
-        siblings_post = siblings_post or ()
-        siblings_pre = siblings_pre or ()
-        memory = memory or {}
-        vs: List[SQLLintError] = []
-        fixes: List[LintFix] = []
-
-        # First, check whether we're looking at an unparsable and whether
-        # this rule will still operate on that.
-        if not self._works_on_unparsable and segment.is_type("unparsable"):
-            # Abort here if it doesn't. Otherwise we'll get odd results.
-            return vs, raw_stack, [], memory
+    def _eval_context(
+        self,
+        context: RuleContext,
+        ignore_mask,
+        templated_file: Optional["TemplatedFile"] = None,
+    ) -> Tuple[List[SQLLintError], List["LintFix"], Any, bool]:
+        """Evaluate this rule against a single context.
 
+        Returns:
+            A tuple of (vs, fixes, memory, ok). If `ok` is False, then the
+            rule threw an exception and shouldn't crawl any deeper.
+
+        """
+        memory = context.memory
         # TODO: Document what options are available to the evaluation function.
         try:
-            res = self._eval(
-                context=RuleContext(
-                    segment=segment,
-                    parent_stack=parent_stack,
-                    siblings_pre=siblings_pre,
-                    siblings_post=siblings_post,
-                    raw_stack=raw_stack,
-                    memory=memory,
-                    dialect=dialect,
-                    path=pathlib.Path(fname) if fname else None,
-                    templated_file=templated_file,
-                )
-            )
+            res = self._eval(context=context)
         except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
             raise
         # Any exception at this point would halt the linter and
@@ -522,11 +537,11 @@ class BaseRule:
             self.logger.critical(
                 f"Applying rule {self.code} threw an Exception: {e}", exc_info=True
             )
-            exception_line, _ = segment.pos_marker.source_position()
-            vs.append(
+            exception_line, _ = context.segment.pos_marker.source_position()
+            vs = [
                 SQLLintError(
                     rule=self,
-                    segment=segment,
+                    segment=context.segment,
                     fixes=[],
                     description=(
                         f"""Unexpected exception: {str(e)};
@@ -536,8 +551,8 @@ class BaseRule:
                         """
                     ),
                 )
-            )
-            return vs, raw_stack, fixes, memory
+            ]
+            return vs, [], memory, False
 
         new_lerrs = []
         new_fixes = []
@@ -584,32 +599,7 @@ class BaseRule:
         for fix in new_fixes:
             self.logger.debug("!! Fix Proposed: %r", fix)
 
-        # Consume the new results
-        vs += new_lerrs
-        fixes += new_fixes
-
-        # The raw stack only keeps track of the previous raw segments
-        if len(segment.segments) == 0:
-            raw_stack += (segment,)
-        # Parent stack keeps track of all the parent segments
-        parent_stack += (segment,)
-
-        for idx, child in enumerate(segment.segments):
-            dvs, raw_stack, child_fixes, memory = self.crawl(
-                segment=child,
-                ignore_mask=ignore_mask,
-                parent_stack=parent_stack,
-                siblings_pre=segment.segments[:idx],
-                siblings_post=segment.segments[idx + 1 :],
-                raw_stack=raw_stack,
-                memory=memory,
-                dialect=dialect,
-                fname=fname,
-                templated_file=templated_file,
-            )
-            vs += dvs
-            fixes += child_fixes
-        return vs, raw_stack, fixes, memory
+        return new_lerrs, new_fixes, memory, True
 
     # HELPER METHODS --------
 
@@ -757,6 +747,195 @@ class BaseRule:
                 return
 
 
+class _RuleCrawlState:
+    """The state of a single rule as it crawls a tree.
+
+    If `raw_stack` is None, then the rule sees the raw stack shared
+    by all the rules in the crawl. Otherwise it has a private one.
+    """
+
+    __slots__ = ["rule", "memory", "vs", "fixes", "raw_stack", "time", "calls"]
+
+    def __init__(
+        self,
+        rule: BaseRule,
+        memory: Any = None,
+        raw_stack: Optional[Iterable[RawSegment]] = None,
+    ):
+        self.rule = rule
+        self.memory = memory or {}
+        self.vs: List[SQLLintError] = []
+        self.fixes: List[LintFix] = []
+        self.raw_stack: Optional[List[RawSegment]] = (
+            None if raw_stack is None else list(raw_stack)
+        )
+        # The time spent evaluating the rule, and how many times it was.
+        self.time = 0.0
+        self.calls = 0
+
+    def record_timing(self, rule_timings: Dict[str, Dict[str, float]]):
+        """Add the timing of this crawl to a dict of rule timings."""
+        timing = rule_timings.setdefault(
+            self.rule.code, {"time": 0.0, "calls": 0, "fixes": 0}
+        )
+        timing["time"] += self.time
+        timing["calls"] += self.calls
+        timing["fixes"] += len(self.fixes)
+
+
+class _MultiRuleCrawler:
+    """Crawls a tree once, evaluating several rules on each segment.
+
+    This is equivalent to calling :meth:`BaseRule.crawl` for each
+    rule in turn, but the tree is only walked once, and the context
+    for each segment is only built once. Each rule still has its own
+    `memory`.
+
+    Rules which don't work on unparsable sections skip them (and their
+    children) entirely, so they don't see those raw segments in the
+    raw stack. To allow for that we keep two shared raw stacks.
+    """
+
+    def __init__(self, ignore_mask, dialect, fname=None, templated_file=None):
+        self.ignore_mask = ignore_mask
+        self.dialect = dialect
+        self.path = pathlib.Path(fname) if fname else None
+        self.templated_file = templated_file
+        self.raw_stack: List[RawSegment] = []
+        self.parsable_raw_stack: List[RawSegment] = []
+
+    def crawl(
+        self,
+        segment: BaseSegment,
+        states: List[_RuleCrawlState],
+        parent_stack: Tuple[BaseSegment, ...] = (),
+        siblings_pre: Tuple[BaseSegment, ...] = (),
+        siblings_post: Tuple[BaseSegment, ...] = (),
+        in_unparsable: bool = False,
+    ):
+        """Recursively crawl a segment, updating the states of the rules."""
+        # Rules should evaluate on segments FIRST, before evaluating on their
+        # children.
+        is_unparsable = segment.is_type("unparsable")
+        in_unparsable = in_unparsable or is_unparsable
+        # Tuples of the shared raw stacks are only made once per segment.
+        raw_stack_tuple = None
+        parsable_raw_stack_tuple = None
+        child_states = []
+        for state in states:
+            rule = state.rule
+            # First, check whether we're looking at an unparsable and whether
+            # this rule will still operate on that.
+            if is_unparsable and not rule._works_on_unparsable:
+                # Skip it (and its children) if it doesn't. Otherwise we'll
+                # get odd results.
+                continue
+            if rule.target_types and not segment.is_type(*rule.target_types):
+                # Not interested in this segment, but maybe in its children.
+                child_states.append(state)
+                continue
+
+            if state.raw_stack is not None:
+                raw_stack = tuple(state.raw_stack)
+            elif rule._works_on_unparsable:
+                if raw_stack_tuple is None:
+                    raw_stack_tuple = tuple(self.raw_stack)
+                raw_stack = raw_stack_tuple
+            else:
+                if parsable_raw_stack_tuple is None:
+                    parsable_raw_stack_tuple = tuple(self.parsable_raw_stack)
+                raw_stack = parsable_raw_stack_tuple
+
+            t0 = time.perf_counter()
+            vs, fixes, state.memory, ok = rule._eval_context(
+                RuleContext(
+                    segment=segment,
+                    parent_stack=parent_stack,
+                    siblings_pre=siblings_pre,
+                    siblings_post=siblings_post,
+                    raw_stack=raw_stack,
+                    memory=state.memory or {},
+                    dialect=self.dialect,
+                    path=self.path,
+                    templated_file=self.templated_file,
+                ),
+                ignore_mask=self.ignore_mask,
+                templated_file=self.templated_file,
+            )
+            state.time += time.perf_counter() - t0
+            state.calls += 1
+            state.vs += vs
+            state.fixes += fixes
+            if ok:
+                child_states.append(state)
+            elif state.raw_stack is None:
+                # This rule won't see this segment or its children, so from
+                # here on it needs its own raw stack.
+                state.raw_stack = list(raw_stack)
+
+        # The raw stack only keeps track of the previous raw segments
+        if len(segment.segments) == 0:
+            raw_segment = cast(RawSegment, segment)
+            self.raw_stack.append(raw_segment)
+            if not in_unparsable:
+                self.parsable_raw_stack.append(raw_segment)
+            for state in child_states:
+                if state.raw_stack is not None:
+                    state.raw_stack.append(raw_segment)
+            return
+
+        # Parent stack keeps track of all the parent segments
+        parent_stack += (segment,)
+
+        for idx, child in enumerate(segment.segments):
+            self.crawl(
+                segment=child,
+                states=child_states,
+                parent_stack=parent_stack,
+                siblings_pre=segment.segments[:idx],
+                siblings_post=segment.segments[idx + 1 :],
+                in_unparsable=in_unparsable,
+            )
+
+
+def crawl_rules(
+    rules: List[BaseRule],
+    segment: BaseSegment,
+    ignore_mask,
+    dialect: Dialect,
+    fname: Optional[str] = None,
+    templated_file: Optional[TemplatedFile] = None,
+    rule_timings: Optional[Dict[str, Dict[str, float]]] = None,
+) -> List[Tuple[List[SQLLintError], List[LintFix]]]:
+    """Crawl a tree with several rules in a single pass.
+
+    The results are the same as calling :meth:`BaseRule.crawl` for each
+    rule, on the same tree, but the tree is only walked once.
+
+    NOTE: Because all the rules see the same tree, fixes from one rule
+    aren't applied before the next rule is evaluated.
+
+    If `rule_timings` is given, the time spent in each rule, the number
+    of times it was evaluated and the number of fixes it found are added
+    to it, keyed by rule code.
+
+    Returns:
+        A list of (vs, fixes) tuples, one for each rule, in order.
+
+    """
+    states = [_RuleCrawlState(rule) for rule in rules]
+    _MultiRuleCrawler(
+        ignore_mask=ignore_mask,
+        dialect=dialect,
+        fname=fname,
+        templated_file=templated_file,
+    ).crawl(segment, states)
+    if rule_timings is not None:
+        for state in states:
+            state.record_timing(rule_timings)
+    return [(state.vs, state.fixes) for state in states]
+
+
 class RuleSet:
     """Class to define a ruleset.
 
@@ -1,5 +1,6 @@
 """Defines the templaters."""
 
+from array import array
 import logging
 from bisect import bisect_left
 from collections import defaultdict
@@ -103,9 +104,15 @@ class TemplatedFile:
         self.raw_sliced: List[RawFileSlice] = raw_sliced or [
             RawFileSlice(source_str, "literal", 0)
         ]
-        # Precalculate newlines, character positions.
-        self._source_newlines = list(iter_indices_of_newlines(self.source_str))
-        self._templated_newlines = list(iter_indices_of_newlines(self.templated_str))
+        # Precalculate newlines, character positions. These are kept as
+        # arrays of offsets rather than lists of ints, to keep them compact.
+        self._source_newlines = array("q", iter_indices_of_newlines(self.source_str))
+        if self.templated_str == self.source_str:
+            self._templated_newlines = self._source_newlines
+        else:
+            self._templated_newlines = array(
+                "q", iter_indices_of_newlines(self.templated_str)
+            )
 
     @classmethod
     def from_string(cls, raw):
@@ -396,6 +403,16 @@ class RawTemplater:
 
     name = "raw"
     templater_selector = "templater"
+    # Whether files can be rendered in the worker processes of a parallel
+    # run. Templaters which need to see every file in turn, in the order
+    # given by `sequence_files`, should set this to False so that files
+    # are rendered one at a time in the main process instead.
+    render_in_parallel = True
+    # Whether one instance can be shared by a config and the configs made
+    # from it for subdirectories. Templaters which keep state read from
+    # their config (e.g. a project or profile) should set this to False,
+    # so that each config gets an instance of its own.
+    shared_by_child_configs = True
 
     def __init__(self, **kwargs):
         """Placeholder init function.
@@ -3,7 +3,8 @@ import logging
 import os.path
 import pkgutil
 from functools import reduce
-from typing import Callable, Dict, List, Optional, Tuple
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import jinja2.nodes
 from jinja2 import (
@@ -29,6 +30,19 @@ from sqlfluff.core.templaters.slicers.tracer import JinjaTracer
 # Instantiate the templater logger
 templater_logger = logging.getLogger("sqlfluff.templater")
 
+# Compiled macro files and loaded libraries are shared by all the files
+# templated in this process, so that each is only compiled (or imported)
+# once. Each entry is stored with a fingerprint of the file(s) it came
+# from, so that changes to them are still picked up.
+_macro_code_cache: Dict[str, Tuple[Tuple[int, int], CodeType]] = {}
+_library_cache: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+
+
+def _file_fingerprint(path: str) -> Tuple[int, int]:
+    """Get the modification time and size of a file, to detect changes."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
 
 class JinjaTemplater(PythonTemplater):
     """A templater using the jinja2 library.
@@ -43,9 +57,17 @@ class JinjaTemplater(PythonTemplater):
 
         pass
 
+    @classmethod
+    def _extract_macros_from_template(cls, template, env, ctx):
+        """Take a template string and extract any macros from it."""
+        return cls._extract_macros_from_code(env.compile(template), env=env, ctx=ctx)
+
     @staticmethod
-    def _extract_macros_from_template(template, env, ctx):
-        """Take a template string and extract any macros from it.
+    def _extract_macros_from_code(code, env, ctx):
+        """Take a compiled template and extract any macros from it.
+
+        The macros are bound to `ctx`, so although the compiled code can
+        be reused, the macros need extracting again for each context.
 
         Lovingly inspired by http://codyaray.com/2015/05/auto-load-jinja2-macros
         """
@@ -53,7 +75,9 @@ class JinjaTemplater(PythonTemplater):
 
         # Iterate through keys exported from the loaded template string
         context = {}
-        macro_template = env.from_string(template, globals=ctx)
+        macro_template = env.template_class.from_code(
+            env, code, env.make_globals(ctx), None
+        )
         # This is kind of low level and hacky but it works
         for k in macro_template.module.__dict__:
             attr = getattr(macro_template.module, k)
@@ -72,13 +96,20 @@ class JinjaTemplater(PythonTemplater):
 
         macro_ctx = {}
         if os.path.isfile(path):
-            # It's a file. Extract macros from it.
-            with open(path) as opened_file:
-                template = opened_file.read()
+            # It's a file. Extract macros from it, compiling
+            # it only if it's changed since we last did.
+            cache_key = os.path.abspath(path)
+            fingerprint = _file_fingerprint(path)
+            cached = _macro_code_cache.get(cache_key)
+            if cached and cached[0] == fingerprint:
+                code = cached[1]
+            else:
+                with open(path) as opened_file:
+                    template = opened_file.read()
+                code = env.compile(template)
+                _macro_code_cache[cache_key] = (fingerprint, code)
             # Update the context with macros from the file.
-            macro_ctx.update(
-                cls._extract_macros_from_template(template, env=env, ctx=ctx)
-            )
+            macro_ctx.update(cls._extract_macros_from_code(code, env=env, ctx=ctx))
         else:
             # It's a directory. Iterate through files in it and extract from them.
             for dirpath, _, files in os.walk(path):
@@ -116,6 +147,26 @@ class JinjaTemplater(PythonTemplater):
         if not library_path:
             return {}
 
+        # Importing the libraries is slow, so reuse them if
+        # none of their files have changed since we last did.
+        cache_key = os.path.abspath(library_path)
+        module_paths = [
+            os.path.join(dirpath, fname)
+            for dirpath, _, files in sorted(os.walk(library_path))
+            for fname in sorted(files)
+            if fname.endswith(".py")
+        ]
+        fingerprint = tuple((p, _file_fingerprint(p)) for p in module_paths)
+        cached = _library_cache.get(cache_key)
+        if cached and cached[0] == fingerprint:
+            return dict(cached[1])
+        library_ctx = self._load_libraries(library_path)
+        _library_cache[cache_key] = (fingerprint, library_ctx)
+        return dict(library_ctx)
+
+    @staticmethod
+    def _load_libraries(library_path):
+        """Import the modules under a library path."""
         libraries = JinjaTemplater.Libraries()
 
         # If library_path hash __init__.py we parse it as a one module, else we parse it a set of modules
@@ -258,7 +309,9 @@ class JinjaTemplater(PythonTemplater):
 
     def template_builder(
         self, fname=None, config=None
-    ) -> Tuple[Environment, dict, Callable[[str], Template]]:
+    ) -> Tuple[
+        Environment, dict, Callable[[Union[str, jinja2.nodes.Template]], Template]
+    ]:
         """Builds and returns objects needed to create and run templates."""
         # Load the context
         live_context = self.get_context(fname=fname, config=config)
@@ -272,6 +325,9 @@ class JinjaTemplater(PythonTemplater):
             _this_ function but not to JinjaTracer.
 
             https://www.programiz.com/python-programming/closure
+
+            `in_str` can also be a template which has already been parsed
+            (using `env.parse()`), to avoid parsing it again.
             """
             return env.from_string(in_str, globals=live_context)
 
@@ -308,9 +364,11 @@ class JinjaTemplater(PythonTemplater):
             fname=fname, config=config
         )
 
-        # Load the template, passing the global context.
+        # Parse the template once, and then use the syntax tree both to
+        # compile it (passing the global context) and to check variables.
         try:
-            template = make_template(in_str)
+            syntax_tree = env.parse(in_str)
+            template = make_template(syntax_tree)
         except TemplateSyntaxError as err:
             # Something in the template didn't parse, return the original
             # and a violation around what happened.
@@ -330,7 +388,6 @@ class JinjaTemplater(PythonTemplater):
         # will be found during the _crawl_tree step rather than this
         # first Exception which serves only to catch catastrophic errors.
         try:
-            syntax_tree = env.parse(in_str)
             undefined_variables = meta.find_undeclared_variables(syntax_tree)
         except Exception as err:  # pragma: no cover
             # TODO: Add a url here so people can get more help.
@@ -386,7 +443,8 @@ class JinjaTemplater(PythonTemplater):
         # The JinjaTracer slicing algorithm is more robust, but it requires
         # us to create and render a second template (not raw_str) and is only
         # enabled if the caller passes a make_template() function. (For now,
-        # the dbt templater does not.)
+        # the dbt templater does not.) The raw_str has already been rendered
+        # to get templated_str, so the tracer doesn't render it again.
         make_template = kwargs.pop("make_template", None)
         if make_template is None:
             # make_template() was not provided. Use the base class
@@ -397,5 +455,5 @@ class JinjaTemplater(PythonTemplater):
         templater_logger.debug("    Raw String: %r", raw_str)
         templater_logger.debug("    Templated String: %r", templated_str)
         tracer = JinjaTracer(raw_str, cls._get_jinja_env(), make_template)
-        trace = tracer.trace()
+        trace = tracer.trace(templated_str)
         return trace.raw_sliced, trace.sliced_file, trace.templated_str
@@ -59,8 +59,14 @@ class JinjaTracer:
         self.sliced_file: List[TemplatedFileSlice] = []
         self.source_idx: int = 0
 
-    def trace(self) -> JinjaTrace:
-        """Executes raw_str. Returns template output and trace."""
+    def trace(self, templated_str: Optional[str] = None) -> JinjaTrace:
+        """Executes raw_str. Returns template output and trace.
+
+        Args:
+            templated_str (:obj:`str`, optional): The output of rendering
+                raw_str, if the caller has already rendered it. If not
+                given, raw_str is rendered to get it.
+        """
         trace_template_str = "".join(
             cast(str, self.raw_slice_info[rs].alternate_code)
             if self.raw_slice_info[rs].alternate_code is not None
@@ -104,9 +110,9 @@ class JinjaTracer:
                 # If we find output from a {% set %} directive, record a trace
                 # without reading or updating the program counter.
                 self.record_trace(slice_length, target_slice_idx)
-        return JinjaTrace(
-            self.make_template(self.raw_str).render(), self.raw_sliced, self.sliced_file
-        )
+        if templated_str is None:
+            templated_str = self.make_template(self.raw_str).render()
+        return JinjaTrace(templated_str, self.raw_sliced, self.sliced_file)
 
     def find_slice_index(self, slice_identifier) -> int:
         """Given a slice identifier, return its index.
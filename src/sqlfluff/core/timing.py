@@ -38,3 +38,32 @@ class TimingSummary:
                     "avg": sum(vals[step]) / len(vals[step]),
                 }
         return summary
+
+
+class RuleTimingSummary:
+    """An object for tracking the timing of rules across many files.
+
+    For each rule we track the total time spent evaluating it, the
+    number of times it was evaluated and the number of fixes it found.
+    """
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, float]] = {}
+
+    def add(self, rule_timings: Dict[str, Dict[str, float]]):
+        """Add a dictionary of rule timings (for one file) to the summary."""
+        for code, timing in rule_timings.items():
+            totals = self._totals.setdefault(
+                code, {"time": 0.0, "calls": 0, "fixes": 0}
+            )
+            for key in totals:
+                totals[key] += timing.get(key, 0)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Generate a summary for display, with the slowest rules first."""
+        return {
+            code: dict(totals)
+            for code, totals in sorted(
+                self._totals.items(), key=lambda item: item[1]["time"], reverse=True
+            )
+        }
@@ -505,6 +505,7 @@ class FileSegment(BaseFileSegment):
         allow_gaps=True,
         allow_trailing=True,
     )
+    statement_delimiters = (";",)
 
 
 @ansi_dialect.segment()
@@ -28,6 +28,8 @@ class Rule_L001(BaseRule):
         FROM foo
     """
 
+    target_types = ("newline",)
+
     def _eval(self, context: RuleContext) -> LintResult:
         """Unnecessary trailing whitespace.
 
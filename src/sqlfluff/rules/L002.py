@@ -39,6 +39,7 @@ class Rule_L002(BaseRule):
 
     """
 
+    target_types = ("whitespace",)
     config_keywords = ["tab_space_size"]
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
@@ -35,6 +35,8 @@ class Rule_L005(BaseRule):
         FROM foo
     """
 
+    target_types = ("comma",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Commas should not have whitespace directly before them.
 
@@ -1,7 +1,7 @@
 """Implementation of Rule L010."""
 
 import regex
-from typing import Tuple, List
+from typing import Optional, Tuple, List
 from sqlfluff.core.rules.base import BaseRule, LintResult, LintFix, RuleContext
 from sqlfluff.core.rules.config_info import get_config_info
 from sqlfluff.core.rules.doc_decorators import (
@@ -40,6 +40,12 @@ class Rule_L010(BaseRule):
         from foo
     """
 
+    target_types: Optional[Tuple[str, ...]] = (
+        "keyword",
+        "binary_operator",
+        "date_part",
+        "data_type_identifier",
+    )
     # Binary operators behave like keywords too.
     _target_elems: List[Tuple[str, str]] = [
         ("type", "keyword"),
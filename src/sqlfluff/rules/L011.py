@@ -37,6 +37,7 @@ class Rule_L011(BaseRule):
 
     """
 
+    target_types = ("alias_expression",)
     config_keywords = ["aliasing"]
 
     _target_elems = ("from_expression_element",)
@@ -32,6 +32,7 @@ class Rule_L013(BaseRule):
 
     """
 
+    target_types = ("select_clause_element",)
     config_keywords = ["allow_scalar"]
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
@@ -67,6 +67,8 @@ class Rule_L014(Rule_L010):
 
     """
 
+    # Targets are matched by name, so we need to see every segment.
+    target_types = None
     _target_elems: List[Tuple[str, str]] = [("name", "naked_identifier")]
     config_keywords = ["extended_capitalisation_policy", "unquoted_identifiers_policy"]
     _description_elem = "Unquoted identifiers"
@@ -31,6 +31,8 @@ class Rule_L015(BaseRule):
 
     """
 
+    target_types = ("select_clause",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Looking for DISTINCT before a bracket.
 
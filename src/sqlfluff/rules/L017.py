@@ -29,6 +29,8 @@ class Rule_L017(BaseRule):
 
     """
 
+    target_types = ("function",)
+
     def _eval(self, context: RuleContext) -> LintResult:
         """Function name not immediately followed by bracket.
 
@@ -36,6 +36,7 @@ class Rule_L018(BaseRule):
 
     """
 
+    target_types = ("with_compound_statement",)
     _works_on_unparsable = False
     config_keywords = ["tab_space_size"]
 
@@ -52,6 +52,8 @@ class Rule_L020(BaseRule):
 
     """
 
+    target_types = ("select_statement",)
+
     def _lint_references_and_aliases(
         self,
         table_aliases: List[AliasInfo],
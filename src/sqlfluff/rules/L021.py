@@ -28,6 +28,8 @@ class Rule_L021(BaseRule):
         FROM foo
     """
 
+    target_types = ("select_statement",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Ambiguous use of DISTINCT in select statement with GROUP BY."""
         segment = context.functional.segment
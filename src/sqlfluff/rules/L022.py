@@ -35,6 +35,7 @@ class Rule_L022(BaseRule):
 
     """
 
+    target_types = ("with_compound_statement",)
     config_keywords = ["comma_style"]
 
     def _eval(self, context: RuleContext) -> Optional[List[LintResult]]:
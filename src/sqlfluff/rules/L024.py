@@ -31,6 +31,7 @@ class Rule_L024(Rule_L023):
 
     """
 
+    target_types = ("join_clause",)
     expected_mother_segment_type = "join_clause"
     pre_segment_identifier = ("name", "using")
     post_segment_identifier = ("type", "bracketed")
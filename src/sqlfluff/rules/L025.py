@@ -59,6 +59,8 @@ class Rule_L025(BaseRule):
 
     """
 
+    target_types = ("select_statement",)
+
     def _eval(self, context: RuleContext) -> EvalResultType:
         violations: List[LintResult] = []
         if context.segment.is_type("select_statement"):
@@ -38,6 +38,7 @@ class Rule_L030(Rule_L010):
 
     """
 
+    target_types = ("function_name_identifier", "bare_function")
     _target_elems: List[Tuple[str, str]] = [
         ("type", "function_name_identifier"),
         ("type", "bare_function"),
@@ -56,6 +56,8 @@ class Rule_L031(BaseRule):
 
     """
 
+    target_types = ("select_statement",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Identify aliases in from clause and join conditions.
 
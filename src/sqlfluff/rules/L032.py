@@ -33,6 +33,8 @@ class Rule_L032(BaseRule):
 
     """
 
+    target_types = ("join_clause",)
+
     def _eval(self, context: RuleContext) -> Optional[List[LintResult]]:
         """Look for USING in a join clause."""
         if context.segment.is_type("join_clause"):
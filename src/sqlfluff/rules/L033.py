@@ -31,6 +31,8 @@ class Rule_L033(BaseRule):
 
     """
 
+    target_types = ("set_operator",)
+
     def _eval(self, context: RuleContext) -> LintResult:
         """Look for UNION keyword not immediately followed by DISTINCT or ALL.
 
@@ -35,6 +35,8 @@ class Rule_L035(BaseRule):
         from x
     """
 
+    target_types = ("case_expression",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Find rule violations and provide fixes.
 
@@ -61,6 +61,8 @@ class Rule_L036(BaseRule):
 
     """
 
+    target_types = ("select_clause",)
+
     def _eval(self, context: RuleContext):
         if context.segment.is_type("select_clause"):
             select_targets_info = self._get_indexes(context)
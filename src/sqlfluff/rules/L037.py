@@ -41,6 +41,8 @@ class Rule_L037(BaseRule):
         ORDER BY a ASC, b DESC
     """
 
+    target_types = ("orderby_clause",)
+
     @staticmethod
     def _get_orderby_info(segment: BaseSegment) -> List[OrderByColumnInfo]:
         assert segment.is_type("orderby_clause")
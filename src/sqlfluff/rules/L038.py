@@ -39,6 +39,7 @@ class Rule_L038(BaseRule):
         FROM foo
     """
 
+    target_types = ("select_clause",)
     config_keywords = ["select_clause_trailing_comma"]
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
@@ -51,6 +51,8 @@ class Rule_L040(Rule_L010):
 
     """
 
+    # Targets are matched by name, so we need to see every segment.
+    target_types = None
     _target_elems: List[Tuple[str, str]] = [
         ("name", "null_literal"),
         ("name", "boolean_literal"),
@@ -32,6 +32,8 @@ class Rule_L041(BaseRule):
 
     """
 
+    target_types = ("select_clause",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Select clause modifiers must appear on same line as SELECT."""
         if context.segment.is_type("select_clause"):
@@ -67,6 +67,8 @@ class Rule_L043(BaseRule):
 
     """
 
+    target_types = ("case_expression",)
+
     @staticmethod
     def _coalesce_fix_list(
         context: RuleContext,
@@ -59,6 +59,7 @@ class Rule_L044(BaseRule):
 
     """
 
+    target_types = ("statement",)
     _works_on_unparsable = False
 
     def _handle_alias(self, selectable, alias_info, query):
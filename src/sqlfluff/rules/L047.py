@@ -56,6 +56,7 @@ class Rule_L047(BaseRule):
 
     """
 
+    target_types = ("function",)
     config_keywords = ["prefer_count_1", "prefer_count_0"]
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
@@ -64,6 +64,7 @@ class Rule_L050(BaseRule):
     """
 
     targets_templated = True
+    checks_file_start = True
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Files must not begin with newlines or whitespace."""
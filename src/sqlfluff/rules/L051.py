@@ -33,6 +33,8 @@ class Rule_L051(BaseRule):
         INNER JOIN baz;
     """
 
+    target_types = ("join_clause",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """INNER JOIN must be fully qualified."""
         # We are only interested in JOIN clauses.
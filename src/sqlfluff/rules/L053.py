@@ -42,6 +42,8 @@ class Rule_L053(BaseRule):
         FROM (SELECT * FROM bar)
     """
 
+    target_types = ("bracketed",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Top-level statements should not be wrapped in brackets."""
         # We only care about bracketed segements that are direct
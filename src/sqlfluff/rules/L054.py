@@ -76,6 +76,7 @@ class Rule_L054(BaseRule):
             1, 2;
     """
 
+    target_types = ("groupby_clause", "orderby_clause")
     config_keywords = ["group_by_and_order_by_style"]
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
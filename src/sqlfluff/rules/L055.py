@@ -34,6 +34,8 @@ class Rule_L055(BaseRule):
             ON foo.bar_id = bar.id;
     """
 
+    target_types = ("join_clause",)
+
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Use LEFT JOIN instead of RIGHT JOIN."""
         # We are only interested in JOIN clauses.
@@ -39,6 +39,8 @@ class Rule_L058(BaseRule):
 
     """
 
+    target_types = ("case_expression",)
+
     def _eval(self, context: RuleContext) -> LintResult:
         """Nested CASE statement in ELSE clause could be flattened."""
         segment = context.functional.segment
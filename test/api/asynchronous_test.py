@@ -0,0 +1,126 @@
+"""Tests for the asyncio api."""
+
+import asyncio
+
+import pytest
+
+import sqlfluff
+from sqlfluff.api import APIParsingError, AsyncLinter
+from sqlfluff.api import asynchronous
+
+my_bad_query = "SeLEct  *, 1, blah as  fOO  from myTable"
+
+
+def test__api__async_lint_fix_parse():
+    """Test that the async api gives the same results as the simple api."""
+
+    async def run():
+        async with AsyncLinter(processes=2) as linter:
+            return await asyncio.gather(
+                linter.lint(my_bad_query),
+                linter.lint(my_bad_query, rules=["L010"]),
+                linter.fix(my_bad_query),
+                linter.parse("SELECT 1"),
+            )
+
+    lint_result, rule_result, fix_result, parse_result = asyncio.run(run())
+    assert lint_result == sqlfluff.lint(my_bad_query)
+    assert rule_result == sqlfluff.lint(my_bad_query, rules=["L010"])
+    assert fix_result == sqlfluff.fix(my_bad_query)
+    assert parse_result == sqlfluff.parse("SELECT 1")
+
+
+def test__api__async_parse_error():
+    """Test that errors in the workers are raised, and the worker kept."""
+
+    async def run():
+        async with AsyncLinter(processes=1) as linter:
+            with pytest.raises(APIParsingError) as excinfo:
+                await linter.parse("SELECT ;")
+            worker = linter._idle[0]
+            await linter.parse("SELECT 1")
+            assert linter._idle == [worker]
+            return excinfo.value
+
+    err = asyncio.run(run())
+    assert len(err.violations) == 1
+    assert "Found unparsable section" in err.msg
+
+
+def test__api__async_timeout_and_cancellation():
+    """Test that timed out and cancelled requests kill their worker."""
+    big_query = "SELECT a FROM b;\n" * 200
+
+    async def run():
+        async with AsyncLinter(processes=1) as linter:
+            with pytest.raises(asyncio.TimeoutError):
+                await linter.lint(big_query, timeout=0.1)
+            assert not linter._idle
+
+            task = asyncio.ensure_future(linter.lint(big_query))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert not linter._idle
+
+            # The worker is replaced for the next request.
+            return await linter.lint("SELECT 1\n")
+
+    assert asyncio.run(run()) == []
+
+
+def test__api__async_max_concurrency(monkeypatch):
+    """Test that requests beyond the concurrency limit wait their turn."""
+    busy = []
+    most_busy = []
+    request = asynchronous._Worker.request
+
+    def spy_request(self, *args):
+        busy.append(self)
+        most_busy.append(len(busy))
+        try:
+            return request(self, *args)
+        finally:
+            busy.remove(self)
+
+    monkeypatch.setattr(asynchronous._Worker, "request", spy_request)
+
+    async def run():
+        async with AsyncLinter(processes=2, max_concurrency=1) as linter:
+            return await asyncio.gather(*(linter.lint("SELECT 1\n") for _ in range(4)))
+
+    assert asyncio.run(run()) == [[]] * 4
+    assert max(most_busy) == 1
+
+
+def test__api__async_close_while_busy(monkeypatch):
+    """Test that workers busy when closed are stopped once they finish."""
+    big_query = "SELECT a FROM b;\n" * 50
+
+    async def run():
+        linter = AsyncLinter(processes=1)
+        task = asyncio.ensure_future(linter.lint(big_query))
+        # Wait for the request to reach its worker.
+        while not linter._busy:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        linter.close()
+        await task
+        # The worker isn't kept, and no more requests are taken.
+        assert not linter._idle
+        with pytest.raises(RuntimeError, match="closed"):
+            await linter.lint("SELECT 1\n")
+
+    processes = []
+    start = asynchronous._Worker.__init__
+
+    def spy_init(self):
+        start(self)
+        processes.append(self.process)
+
+    monkeypatch.setattr(asynchronous._Worker, "__init__", spy_init)
+    asyncio.run(run())
+    assert len(processes) == 1
+    processes[0].join(timeout=10)
+    assert not processes[0].is_alive()
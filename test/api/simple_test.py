@@ -145,6 +145,27 @@ def test__api__lint_string_specific_exclude_all_failed_rules():
     assert result == []
 
 
+@pytest.mark.parametrize("processes", [1, 2])
+def test__api__lint_batch(processes):
+    """Test that linting a batch gives the same results as linting each query."""
+    inline_query = "-- sqlfluff:rules:L010:capitalisation_policy:lower\n" + my_bad_query
+    queries = [
+        (my_bad_query, "bad"),
+        # Inline config applies only to its own query.
+        (inline_query, "inline"),
+        (my_bad_query, "bad_again"),
+        ("select column from table\n", "good"),
+    ]
+    result = dict(sqlfluff.lint_batch(iter(queries), processes=processes))
+    assert result == {
+        "bad": lint_result,
+        "inline": sqlfluff.lint(inline_query),
+        "bad_again": lint_result,
+        "good": [],
+    }
+    assert result["inline"] != lint_result
+
+
 def test__api__fix_string():
     """Basic checking of lint functionality."""
     result = sqlfluff.fix(my_bad_query)
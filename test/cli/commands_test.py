@@ -8,9 +8,12 @@ import json
 from unittest.mock import MagicMock, patch
 
 import yaml
+import socket
 import subprocess
 import chardet
 import sys
+import threading
+import time
 
 # Testing libraries
 import pytest
@@ -18,7 +21,18 @@ from click.testing import CliRunner
 
 # We import the library directly here to get the version
 import sqlfluff
-from sqlfluff.cli.commands import lint, version, rules, fix, parse, dialects
+from sqlfluff.cli.commands import (
+    lint,
+    version,
+    rules,
+    fix,
+    parse,
+    dialects,
+    serve,
+    client,
+)
+from sqlfluff.core import Linter, FluffConfig
+from sqlfluff.core.linter.server import LintClient, LintServer
 
 
 def invoke_assert_code(
@@ -345,6 +359,42 @@ def test__cli__command_lint_parse_with_retcode(command, ret_code):
     invoke_assert_code(ret_code=ret_code, args=command)
 
 
+@pytest.mark.parametrize("processes", [1, 2])
+def test__cli__command_lint_multiple_paths_grouped(processes):
+    """Check the output for each path is together and in order, even in parallel."""
+    paths = {
+        "test/fixtures/linter/indentation_errors.sql": [
+            "test/fixtures/linter/indentation_errors.sql"
+        ],
+        "test/fixtures/cli": [
+            "test/fixtures/cli/fail_many.sql",
+            "test/fixtures/cli/passing_a.sql",
+            "test/fixtures/cli/passing_b.sql",
+        ],
+        "test/fixtures/linter/whitespace_errors.sql": [
+            "test/fixtures/linter/whitespace_errors.sql"
+        ],
+    }
+    result = invoke_assert_code(
+        ret_code=65,
+        args=[
+            lint,
+            ["-v", "--processes", str(processes), "--dialect", "ansi", *paths],
+        ],
+    )
+    lines = result.output.splitlines()
+    headers = [
+        idx for idx, line in enumerate(lines) if line.startswith("=== [ path: ")
+    ]
+    assert len(headers) == len(paths)
+    bounds = headers + [len(lines)]
+    for (path, fnames), start, stop in zip(paths.items(), bounds, bounds[1:]):
+        assert path in lines[start]
+        path_output = "\n".join(lines[start:stop])
+        for fname in fnames:
+            assert f"== [{fname}]" in path_output
+
+
 def test__cli__command_lint_warning_explicit_file_ignored():
     """Check ignoring file works when passed explicitly and ignore file is in the same directory."""
     runner = CliRunner()
@@ -731,6 +781,95 @@ def test__cli__command_lint_serialize_multiple_files(serialize):
         raise Exception
 
 
+def test__cli__command_lint_bench_json():
+    """Check that --bench with JSON output gives the timings as JSON."""
+    fpath = "test/fixtures/linter/indentation_errors.sql"
+    result = invoke_assert_code(
+        args=[lint, (fpath, "--format", "json", "--bench", "--disable_progress_bar")],
+        ret_code=65,
+    )
+    records, timings = [json.loads(line) for line in result.output.splitlines()]
+    assert len(records) == 1
+    assert timings["clock_time"] > 0
+    assert {"parsing", "linting", "rules"} <= set(timings["timings"])
+    assert timings["timings"]["rules"]["L003"]["calls"] > 0
+
+
+def test__cli__command_lint_cache_dir(tmp_path):
+    """Check that linting with a cache gives the same results twice."""
+    fpath = "test/fixtures/linter/indentation_errors.sql"
+    args = [
+        lint,
+        (
+            fpath,
+            "--format",
+            "json",
+            "--cache-dir",
+            str(tmp_path / "cache"),
+            "--disable_progress_bar",
+        ),
+    ]
+    first = invoke_assert_code(args=args, ret_code=65)
+    assert list((tmp_path / "cache").iterdir())
+    second = invoke_assert_code(args=args, ret_code=65)
+    assert json.loads(first.output) == json.loads(second.output)
+
+
+def test__cli__command_serve_stdin():
+    """Check serving requests from stdin."""
+    requests = [
+        {"id": 1, "command": "lint", "sql": "SELECT a FROM tbl\n"},
+        {"id": 2, "command": "fix", "sql": "SELECT a  FROM tbl\n"},
+        {"id": 3, "command": "shutdown"},
+    ]
+    result = invoke_assert_code(
+        args=[serve, ("--dialect", "ansi")],
+        cli_input="".join(json.dumps(r) + "\n" for r in requests),
+        mix_stderr=False,
+    )
+    responses = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["id"] for r in responses] == [1, 2, 3]
+    assert responses[0]["violations"] == []
+    assert responses[1]["fixed"] == "SELECT a FROM tbl\n"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix sockets.")
+def test__cli__command_client(tmp_path):
+    """Check forwarding requests to a server with the client."""
+    path = str(tmp_path / "sqlfluff.sock")
+    server = LintServer(Linter(config=FluffConfig(overrides=dict(dialect="ansi"))))
+    thread = threading.Thread(target=server.serve_socket, args=(path,), daemon=True)
+    thread.start()
+    try:
+        while not os.path.exists(path):
+            time.sleep(0.01)
+        result = invoke_assert_code(
+            args=[
+                client,
+                (
+                    "--socket",
+                    path,
+                    "lint",
+                    "test/fixtures/linter/indentation_errors.sql",
+                    "-",
+                ),
+            ],
+            cli_input="SELECT a FROM tbl\n",
+            ret_code=65,
+        )
+        responses = [json.loads(line) for line in result.output.splitlines()]
+        assert responses[0]["violations"][0]["code"] == "L003"
+        assert responses[1]["violations"] == []
+        invoke_assert_code(
+            args=[client, ("--socket", path, "lint", "not/a/file.sql")],
+            ret_code=1,
+        )
+    finally:
+        with LintClient(path) as lint_client:
+            lint_client.request("shutdown")
+        thread.join(timeout=60)
+
+
 def test__cli__command_lint_serialize_github_annotation():
     """Test format of github-annotation output."""
     fpath = "test/fixtures/linter/identifier_capitalisation.sql"
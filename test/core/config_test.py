@@ -1,6 +1,7 @@
 """Tests for the configuration routines."""
 
 import os
+import pickle
 import sys
 
 from sqlfluff.core.config import ConfigLoader, nested_combine, dict_diff
@@ -294,3 +295,47 @@ def test__config__from_kwargs():
     assert cfg.get("dialect") == "snowflake"
     assert cfg.get("rules") == "L001,L002"
     assert cfg.get("exclude_rules") == "L010,L011"
+
+
+def test__config__child_shares_dialect_and_templater():
+    """Test that child configs reuse the expanded dialect and templater."""
+    cfg = FluffConfig(overrides=dict(dialect="ansi"))
+    child = cfg.make_child_from_path("test/fixtures/config/inheritance_a")
+    assert child.get("dialect_obj") is cfg.get("dialect_obj")
+    assert child.get("templater_obj") is cfg.get("templater_obj")
+    # Mutating a config shouldn't leak into the cached defaults.
+    child.set_value(["core", "max_line_length"], 1)
+    assert FluffConfig().get("max_line_length") != 1
+
+
+def test__config__child_templater_with_config_state():
+    """Test that templaters holding per-config state aren't shared."""
+
+    class StatefulTemplater(JinjaTemplater):
+        shared_by_child_configs = False
+
+    cfg = FluffConfig(overrides=dict(dialect="ansi"))
+    cfg._configs["core"]["templater_obj"] = StatefulTemplater()
+    child = cfg.make_child_from_path("test/fixtures/config/inheritance_a")
+    assert child.get("templater_obj") is not cfg.get("templater_obj")
+    assert isinstance(child.get("templater_obj"), JinjaTemplater)
+
+
+def test__config__expanded_dialect_immutable():
+    """Test that the memoized expanded dialect can't be modified."""
+    dialect = FluffConfig(overrides=dict(dialect="ansi")).get("dialect_obj")
+    with pytest.raises(ValueError):
+        dialect.replace(SelectStatementSegment=None)
+
+
+def test__config__pickle_reselects_dialect():
+    """Test that pickled configs select their dialect again rather than copy it."""
+    cfg = FluffConfig(overrides=dict(dialect="postgres"))
+    pickled = pickle.dumps(cfg)
+    # The expanded dialect would be a large part of the pickle.
+    assert len(pickled) < 20000
+    unpickled = pickle.loads(pickled)
+    assert unpickled.get("dialect_obj") is cfg.get("dialect_obj")
+    assert unpickled.get("dialect") == "postgres"
+    # The original isn't changed by pickling.
+    assert cfg.get("dialect_obj") is not None
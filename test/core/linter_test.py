@@ -1,17 +1,34 @@
 """The Test file for the linter class."""
 
+import io
+import json
+import os
 import pytest
 import logging
+import socket
+import threading
+import time
 from typing import List
 from unittest.mock import patch
 
 from sqlfluff.core import Linter, FluffConfig
 from sqlfluff.core.linter import runner
-from sqlfluff.core.errors import SQLLexError, SQLBaseError, SQLLintError, SQLParseError
+from sqlfluff.core.errors import (
+    SQLLexError,
+    SQLBaseError,
+    SQLLintError,
+    SQLParseError,
+    SQLTemplaterError,
+)
 from sqlfluff.cli.formatters import CallbackFormatter
 from sqlfluff.core.linter import LintingResult, NoQaDirective
+from sqlfluff.core.linter.linted_dir import LintedDir
+from sqlfluff.core.linter.server import LintClient, LintServer
+from sqlfluff.core.linter.streaming import iter_statement_chunks
 import sqlfluff.core.linter as linter
 from sqlfluff.core.templaters import TemplatedFile
+from sqlfluff.core.rules.base import BaseRule, LintResult
+from sqlfluff.rules.L039 import Rule_L039
 
 
 class DummyLintError(SQLBaseError):
@@ -121,6 +138,39 @@ def test__linter__path_from_paths__ignore(path):
     }
 
 
+def test__linter__path_from_paths__ignore_prunes_dirs(tmp_path, monkeypatch):
+    """Test that ignored directories aren't walked at all."""
+    (tmp_path / ".sqlfluffignore").write_text(
+        "node_modules/\ntarget/*\n!target/keep.sql\n"
+    )
+    for subdir in ("node_modules/pkg", "target", "models"):
+        (tmp_path / subdir).mkdir(parents=True)
+    for fpath in (
+        "node_modules/pkg/a.sql",
+        "target/b.sql",
+        "target/keep.sql",
+        "models/c.sql",
+    ):
+        (tmp_path / fpath).write_text("SELECT 1\n")
+
+    walked = []
+    walk = os.walk
+
+    def spy_walk(*args, **kwargs):
+        for dirpath, dirnames, filenames in walk(*args, **kwargs):
+            walked.append(os.path.relpath(dirpath, tmp_path))
+            yield dirpath, dirnames, filenames
+
+    monkeypatch.setattr(os, "walk", spy_walk)
+    paths = Linter().paths_from_path(str(tmp_path))
+    assert [os.path.relpath(path, tmp_path) for path in paths] == [
+        os.path.join("models", "c.sql"),
+        os.path.join("target", "keep.sql"),
+    ]
+    # The negated pattern means target/ has to be walked.
+    assert sorted(walked) == [".", "models", "target"]
+
+
 @pytest.mark.parametrize(
     "path",
     [
@@ -201,6 +251,27 @@ def test__linter__linting_result_get_violations(processes):
     all([type(v) == SQLLintError for v in result.get_violations()])
 
 
+@pytest.mark.parametrize("processes", [1, 2])
+def test__linter__linting_result_timing_summary(processes):
+    """Test that the timing summary includes the time spent in each rule."""
+    lntr = Linter(config=FluffConfig(overrides=dict(rules="L001,L039")))
+    result = lntr.lint_paths(
+        (
+            "test/fixtures/linter/comma_errors.sql",
+            "test/fixtures/linter/whitespace_errors.sql",
+        ),
+        processes=processes,
+    )
+    summary = result.timing_summary()
+    assert summary["linting"]["cnt"] == 2
+    assert list(summary["rules"]) == sorted(
+        ["L001", "L039"], key=lambda code: -summary["rules"][code]["time"]
+    )
+    for code, timing in summary["rules"].items():
+        assert timing["calls"] > 0
+        assert timing["fixes"] == len(result.get_violations(rules=code, fixable=True))
+
+
 @pytest.mark.parametrize("force_error", [False, True])
 def test__linter__linting_parallel_thread(force_error, monkeypatch):
     """Run linter in parallel mode using threads.
@@ -225,7 +296,7 @@ def test__linter__linting_parallel_thread(force_error, monkeypatch):
                     pass
 
                 def imap_unordered(self, *args, **kwargs):
-                    yield runner.DelayedException(ValueError())
+                    yield [runner.DelayedException(ValueError())]
 
             return ErrorPool()
 
@@ -240,6 +311,165 @@ def test__linter__linting_parallel_thread(force_error, monkeypatch):
     all([type(v) == SQLLintError for v in result.get_violations()])
 
 
+def test__linter__parallel_runner_batches(tmp_path, monkeypatch):
+    """Test that files are scheduled largest first, with small files batched."""
+    monkeypatch.setattr(runner.ParallelRunner, "batch_max_files", 2)
+    monkeypatch.setattr(runner.ParallelRunner, "batch_max_size", 100)
+    sizes = {"a.sql": 10, "b.sql": 200, "c.sql": 30, "d.sql": 50, "e.sql": 20}
+    fnames = []
+    for fname, size in sizes.items():
+        fpath = tmp_path / fname
+        fpath.write_text("SELECT 1\n".ljust(size - 1) + "\n")
+        fnames.append(str(fpath))
+    parallel_runner = runner.MultiThreadRunner(Linter(), FluffConfig(), processes=2)
+    batches = [
+        [os.path.basename(fname) for fname, _ in batch]
+        for batch in parallel_runner.iter_batches(fnames)
+    ]
+    assert batches == [["b.sql"], ["d.sql", "c.sql"], ["e.sql", "a.sql"]]
+
+
+def test__linter__root_rules_per_thread():
+    """Test that strings linted in different threads don't share rules.
+
+    Rules keep state on themselves while linting, so threads linting
+    with the root config each need their own.
+    """
+    lntr = Linter(config=FluffConfig(overrides=dict(dialect="ansi")))
+    lntr.lint_string_with_root_config("SELECT 1\n")
+    rule_set = lntr._root_rules.rule_set
+    # They're reused within a thread.
+    lntr.lint_string_with_root_config("SELECT 2\n")
+    assert lntr._root_rules.rule_set is rule_set
+
+    thread_rule_sets = []
+
+    def lint_in_thread():
+        lntr.lint_string_with_root_config("SELECT 3\n")
+        thread_rule_sets.append(lntr._root_rules.rule_set)
+
+    thread = threading.Thread(target=lint_in_thread)
+    thread.start()
+    thread.join()
+    assert not set(map(id, thread_rule_sets[0])) & set(map(id, rule_set))
+
+
+@pytest.mark.parametrize("render_in_parallel", [True, False])
+def test__linter__multiprocess_runner_renders_in_workers(
+    render_in_parallel, monkeypatch
+):
+    """Test that files are rendered in the workers, unless the templater opts out."""
+    lntr = Linter()
+    monkeypatch.setattr(lntr.templater, "render_in_parallel", render_in_parallel)
+    fname = "test/fixtures/linter/passing.sql"
+    ((_, partial),) = runner.MultiProcessRunner(
+        lntr, lntr.config, processes=2
+    ).iter_partials([fname])
+    if render_in_parallel:
+        assert partial.func is runner._lint_path_in_worker
+        assert partial.args == (fname, False)
+    else:
+        assert partial.func is runner._lint_rendered_in_worker
+        assert partial.args[0].fname == fname
+
+
+def test__linter__lint_paths_parallel_one_run(monkeypatch):
+    """Test that linting several paths in parallel lints them in one run."""
+    runs = []
+    run = runner.ParallelRunner.run
+
+    def spy_run(self, fnames, fix):
+        runs.append(fnames)
+        return run(self, fnames, fix)
+
+    monkeypatch.setattr(runner.ParallelRunner, "run", spy_run)
+    paths = (
+        "test/fixtures/linter/indentation_errors.sql",
+        "test/fixtures/linter/whitespace_errors.sql",
+        "test/fixtures/linter/indentation_errors.sql",
+    )
+    sequential = Linter().lint_paths(paths)
+    parallel = Linter().lint_paths(paths, processes=2)
+    assert len(runs) == 1
+    assert [len(linted_dir.files) for linted_dir in parallel.paths] == [1, 1, 1]
+    assert parallel.check_tuples(by_path=True) == sequential.check_tuples(by_path=True)
+
+
+def test__linter__lint_paths_dispatch_first_path(monkeypatch):
+    """Test that the first path is dispatched as its files come back.
+
+    This is when linting several paths in parallel, where the paths after
+    it are held back until it's done.
+    """
+    events = []
+    add = LintedDir.add
+
+    def spy_add(self, file):
+        events.append(("add", file.path))
+        return add(self, file)
+
+    monkeypatch.setattr(LintedDir, "add", spy_add)
+    monkeypatch.setattr(Linter, "allow_process_parallelism", False)
+    lntr = Linter(formatter=CallbackFormatter(callback=lambda m: None, verbosity=0))
+    monkeypatch.setattr(
+        lntr.formatter, "dispatch_path", lambda path: events.append(("path", path))
+    )
+    monkeypatch.setattr(
+        lntr.formatter,
+        "dispatch_file_violations",
+        lambda fname, *args, **kwargs: events.append(("file", fname)),
+    )
+    first = "test/fixtures/linter/autofix/ansi/001_long_line"
+    second = "test/fixtures/linter/indentation_errors.sql"
+    lntr.lint_paths((first, second), processes=2)
+    # The first path's header goes out before anything is linted, and each
+    # of its files straight after it comes back.
+    assert events[0] == ("path", first)
+    for idx, (kind, fname) in enumerate(events):
+        if kind == "add" and fname.startswith(first):
+            assert events[idx + 1] == ("file", fname)
+    # The second path is held back until the first is done.
+    path_events = [event for event in events if event[0] != "add"]
+    assert path_events.index(("path", second)) == len(path_events) - 2
+
+    """Test that a linter used as a context manager keeps its pool."""
+    path = "test/fixtures/linter/indentation_errors.sql"
+    with Linter() as lntr:
+        first = lntr.lint_paths((path,), processes=2)
+        pool = lntr._pool
+        assert pool is not None
+        second = lntr.lint_paths((path,), processes=2)
+        assert lntr._pool is pool
+        assert first.check_tuples() == second.check_tuples()
+        # A different number of processes needs a different pool.
+        lntr.lint_paths((path,), processes=3)
+        assert lntr._pool is not pool
+    assert lntr._pool is None
+    # Outside of the context manager, pools aren't kept.
+    lntr.lint_paths((path,), processes=2)
+    assert lntr._pool is None
+
+
+class Rule_T042(BaseRule):
+    """Star found."""
+
+    def _eval(self, context):
+        if context.segment.is_type("star"):
+            return LintResult(anchor=context.segment)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test__linter__parallel_user_rules(tmp_path, processes):
+    """Test that user rules are applied when linting in parallel."""
+    (tmp_path / "a.sql").write_text("SELECT b FROM c\n")
+    (tmp_path / "b.sql").write_text("SELECT\n    *\nFROM c\n")
+    lntr = Linter(
+        config=FluffConfig(overrides=dict(rules="T042")), user_rules=[Rule_T042]
+    )
+    result = lntr.lint_paths((str(tmp_path),), processes=processes)
+    assert result.check_tuples() == [("T042", 2, 5)]
+
+
 @patch("sqlfluff.core.linter.Linter.lint_rendered")
 def test_lint_path_parallel_wrapper_exception(patched_lint):
     """Tests the error catching behavior of _lint_path_parallel_wrapper().
@@ -283,6 +513,203 @@ def test__linter__raises_malformed_noqa():
         result.check_tuples()
 
 
+@pytest.mark.parametrize(
+    "sql,chunks",
+    [
+        ("SELECT 1;\nSELECT 2;\n", [(0, "SELECT 1;\n"), (1, "SELECT 2;\n")]),
+        # Trailing comments and statements without a delimiter.
+        ("SELECT 1; -- a\nSELECT 2\n", [(0, "SELECT 1; -- a\n"), (1, "SELECT 2\n")]),
+        # Delimiters in strings, comments and brackets don't split.
+        ("SELECT 'a;\nb';\n", [(0, "SELECT 'a;\nb';\n")]),
+        ("SELECT 1 /* a;\n*/;\n", [(0, "SELECT 1 /* a;\n*/;\n")]),
+        ("SELECT 1 -- a;\n;\n", [(0, "SELECT 1 -- a;\n;\n")]),
+        ("SELECT (1;\n);\n", [(0, "SELECT (1;\n);\n")]),
+        # Nor inside procedural blocks.
+        (
+            "BEGIN\nSELECT 1;\nEND;\nSELECT 2;\n",
+            [(0, "BEGIN\nSELECT 1;\nEND;\n"), (3, "SELECT 2;\n")],
+        ),
+        (
+            "begin\nif a then\nselect 1;\nend if;\ncase a\nwhen 1 then select 1;\n"
+            "end case;\nend;\n",
+            [
+                (
+                    0,
+                    "begin\nif a then\nselect 1;\nend if;\ncase a\n"
+                    "when 1 then select 1;\nend case;\nend;\n",
+                )
+            ],
+        ),
+        (
+            "SELECT IF(a, 1, 2), CASE WHEN b THEN 1\nEND;\nSELECT REPEAT('a', 2);\n",
+            [
+                (0, "SELECT IF(a, 1, 2), CASE WHEN b THEN 1\nEND;\n"),
+                (2, "SELECT REPEAT('a', 2);\n"),
+            ],
+        ),
+        # BEGIN can also start a transaction.
+        (
+            "BEGIN;\nSELECT 1;\nBEGIN TRANSACTION;\nCOMMIT;\n",
+            [
+                (0, "BEGIN;\n"),
+                (1, "SELECT 1;\n"),
+                (2, "BEGIN TRANSACTION;\n"),
+                (3, "COMMIT;\n"),
+            ],
+        ),
+        # Nor do they inside jinja blocks.
+        (
+            "{% if x %}\nSELECT 1;\n{% endif %}\nSELECT 2;\n",
+            [(0, "{% if x %}\nSELECT 1;\n{% endif %}\nSELECT 2;\n")],
+        ),
+        (
+            "{% set x = 1 %}\nSELECT 1;\n{% set y %}\n1;\n{% endset %}\n",
+            [
+                (0, "{% set x = 1 %}\nSELECT 1;\n"),
+                (2, "{% set y %}\n1;\n{% endset %}\n"),
+            ],
+        ),
+    ],
+)
+def test__linter__streaming_iter_statement_chunks(sql, chunks):
+    """Test splitting files into chunks of statements."""
+    assert list(iter_statement_chunks(sql.splitlines(True), chunk_size=0)) == chunks
+
+
+@pytest.mark.parametrize(
+    "dialect,sql,chunks",
+    [
+        # Backslashes only escape quotes in some dialects.
+        (
+            "ansi",
+            "SELECT 'C:\\';\nSELECT 1;\n",
+            [(0, "SELECT 'C:\\';\n"), (1, "SELECT 1;\n")],
+        ),
+        ("mysql", "SELECT 'it\\'s;\n';\n", [(0, "SELECT 'it\\'s;\n';\n")]),
+        # And MySQL has hash comments.
+        ("mysql", "SELECT 1 # a;\n;\n", [(0, "SELECT 1 # a;\n;\n")]),
+    ],
+)
+def test__linter__streaming_dialect_strings_and_comments(dialect, sql, chunks):
+    """Test that strings and comments are scanned as the dialect writes them."""
+    assert (
+        list(iter_statement_chunks(sql.splitlines(True), chunk_size=0, dialect=dialect))
+        == chunks
+    )
+
+
+def test__linter__streaming_chunk_size():
+    """Test that chunks are only split once they reach the chunk size."""
+    lines = ["SELECT 1;\n"] * 5
+    assert list(iter_statement_chunks(lines, chunk_size=15)) == [
+        (0, "SELECT 1;\nSELECT 1;\n"),
+        (2, "SELECT 1;\nSELECT 1;\n"),
+        (4, "SELECT 1;\n"),
+    ]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test__linter__lint_streamed_file(tmp_path, monkeypatch, processes):
+    """Test that linting large files in chunks gives the same violations."""
+    fpath = str(tmp_path / "large.sql")
+    with open(fpath, "w") as f:
+        for i in range(20):
+            f.write(f"SELECT a,b FROM tbl_{i} WHERE x=1;\n")
+            f.write("-- noqa: disable=L039\n" if i == 5 else "")
+            f.write("-- noqa: enable=L039\n" if i == 15 else "")
+            f.write(f"SELECT a , b\nFROM tbl_{i}  -- noqa: L039\n;\n")
+    monkeypatch.setattr(Linter, "stream_chunk_size", 200)
+    config = dict(dialect="ansi", exclude_rules="L010")
+    lntr = Linter(config=FluffConfig(overrides=config))
+    expected = lntr.lint_paths((fpath,))
+    streamed_lntr = Linter(
+        config=FluffConfig(overrides=dict(config, large_file_stream_size=1000))
+    )
+    streamed = streamed_lntr.lint_paths((fpath,), processes=processes)
+    assert sorted(streamed.check_tuples()) == sorted(expected.check_tuples())
+    # The streamed file doesn't keep a tree.
+    assert streamed.paths[0].files[0].tree is None
+    assert expected.paths[0].files[0].tree is not None
+    # Files aren't chunked when fixing.
+    fixed = streamed_lntr.lint_paths((fpath,), fix=True, processes=processes)
+    assert fixed.paths[0].files[0].tree is not None
+
+
+@pytest.mark.parametrize(
+    "dialect,sql,chunk_size,codes",
+    [
+        (
+            "ansi",
+            "".join(
+                f"insert into tbl (a, b) values ({i}, 'x');\n\n" for i in range(30)
+            ),
+            100,
+            ["L009"],
+        ),
+        # Procedural blocks aren't split.
+        (
+            "mysql",
+            "CREATE PROCEDURE p()\nBEGIN\n    SELECT 1;\n    IF a = 1 THEN\n"
+            "        SELECT 2;\n    END IF;\nEND;\nSELECT 3;\n",
+            1,
+            ["L003", "L003", "L003", "L003", "L014"],
+        ),
+        # Nor are files in dialects which aren't split into statements.
+        (
+            "tsql",
+            "CREATE PROCEDURE dbo.p\nAS\nBEGIN\n    SELECT 1;\n    SELECT 2;\nEND;\n",
+            1,
+            [],
+        ),
+    ],
+)
+def test__linter__lint_streamed_file_boundaries(
+    tmp_path, monkeypatch, dialect, sql, chunk_size, codes
+):
+    """Test that chunk boundaries are only between whole statements.
+
+    Nor are the boundaries linted as the start or end of a file.
+    """
+    fpath = str(tmp_path / "large.sql")
+    with open(fpath, "w") as f:
+        f.write(sql)
+    monkeypatch.setattr(Linter, "stream_chunk_size", chunk_size)
+    config = dict(dialect=dialect)
+    expected = Linter(config=FluffConfig(overrides=config)).lint_paths((fpath,))
+    streamed = Linter(
+        config=FluffConfig(overrides=dict(config, large_file_stream_size=1))
+    ).lint_paths((fpath,))
+    assert streamed.check_tuples() == expected.check_tuples()
+    assert [code for code, _, _ in streamed.check_tuples()] == codes
+
+
+def test__linter__lint_streamed_file_jinja_limitation(tmp_path, monkeypatch):
+    """Test that top level jinja variables don't carry over between chunks.
+
+    This is a known limitation of linting files in chunks, which is
+    documented. The variable is undefined in the second chunk.
+    """
+    fpath = str(tmp_path / "large.sql")
+    with open(fpath, "w") as f:
+        f.write("{% set tbl = 'foo' %}\n")
+        f.write("SELECT a FROM {{ tbl }};\n" * 10)
+    monkeypatch.setattr(Linter, "stream_chunk_size", 100)
+    config = dict(dialect="ansi", rules="L010")
+    expected = Linter(config=FluffConfig(overrides=config)).lint_paths((fpath,))
+    assert expected.check_tuples() == []
+    streamed = Linter(
+        config=FluffConfig(overrides=dict(config, large_file_stream_size=100))
+    ).lint_paths((fpath,))
+    templater_errors = (
+        streamed.paths[0].files[0].get_violations(types=SQLTemplaterError)
+    )
+    assert templater_errors
+    assert all(
+        v.desc() == "Undefined jinja template variable: 'tbl'" and v.line_no > 2
+        for v in templater_errors
+    )
+
+
 def test__linter__empty_file():
     """Test linter behaves nicely with an empty string."""
     lntr = Linter()
@@ -892,3 +1319,205 @@ def test_normalise_newlines():
     in_str = "SELECT\r\n foo\n FROM \r \n\r bar;"
     out_str = "SELECT\n foo\n FROM \n \n\n bar;"
     assert out_str == Linter._normalise_newlines(in_str)
+
+
+def test__linter__lint_cache(tmp_path):
+    """Test that unchanged files are served from the lint cache."""
+    sql_path = tmp_path / "query.sql"
+    sql_path.write_text("SELECT a, b   FROM tbl\n")
+    cfg = FluffConfig(overrides={"cache_dir": str(tmp_path / "cache")})
+
+    # First run populates the cache.
+    lntr = Linter(config=cfg)
+    first = lntr.lint_paths((str(sql_path),))
+    assert lntr.lint_cache.hits == 0
+    assert lntr.lint_cache.misses == 1
+
+    # Second run (with a fresh linter) should be served from the cache
+    # without templating, parsing or linting.
+    lntr = Linter(config=cfg)
+    with patch("sqlfluff.core.linter.Linter.render_file") as patched_render:
+        second = lntr.lint_paths((str(sql_path),))
+    patched_render.assert_not_called()
+    assert lntr.lint_cache.hits == 1
+    assert second.check_tuples() == first.check_tuples()
+    # The tree isn't cached.
+    assert second.paths[0].files[0].tree is None
+
+    # Changing the content invalidates the entry.
+    sql_path.write_text("SELECT a FROM tbl\n")
+    lntr = Linter(config=cfg)
+    third = lntr.lint_paths((str(sql_path),))
+    assert lntr.lint_cache.misses == 1
+    assert third.check_tuples() == []
+
+    # Changing the rules also invalidates the entry.
+    lntr = Linter(
+        config=FluffConfig(
+            overrides={"cache_dir": str(tmp_path / "cache"), "rules": "L010"}
+        )
+    )
+    lntr.lint_paths((str(sql_path),))
+    assert lntr.lint_cache.misses == 1
+
+
+def test__linter__lint_cache_identical_files(tmp_path):
+    """Test that identical files sharing a cache entry keep their own paths."""
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for name in ("one.sql", "two.sql"):
+        (src_dir / name).write_text("SELECT a, b   FROM tbl\n")
+    cfg = FluffConfig(overrides={"cache_dir": str(tmp_path / "cache")})
+    Linter(config=cfg).lint_paths((str(src_dir),))
+
+    lntr = Linter(config=cfg)
+    result = lntr.lint_paths((str(src_dir),))
+    assert lntr.lint_cache.hits == 2
+    assert sorted(file.path for file in result.paths[0].files) == [
+        str(src_dir / "one.sql"),
+        str(src_dir / "two.sql"),
+    ]
+    # Timings aren't cached, so aren't reported for cached files.
+    assert all(file.rule_timings is None for file in result.paths[0].files)
+
+
+def test__linter__lint_cache_prune(tmp_path):
+    """Test that the lint cache evicts the oldest entries when full."""
+    cfg = FluffConfig(
+        overrides={"cache_dir": str(tmp_path / "cache"), "cache_max_size": 0}
+    )
+    lntr = Linter(config=cfg)
+    lntr.lint_paths(("test/fixtures/linter/passing.sql",))
+    # With a zero size limit, everything is evicted.
+    assert lntr.lint_cache.size() == 0
+
+
+def test__linter__fix_skips_unchanged_rules():
+    """Test that rules aren't re-crawled in fix mode if the tree is unchanged."""
+    lntr = Linter(config=FluffConfig(overrides=dict(rules="L010,L039")))
+    with patch.object(
+        Rule_L039, "crawl", autospec=True, side_effect=BaseRule.crawl
+    ) as patched_crawl:
+        result = lntr.lint_string("SELECT a from b\n", fix=True)
+    assert result.fix_string()[0] == "SELECT a FROM b\n"
+    # L010 fixes the tree on the first loop, and L039 then finds nothing.
+    # On the second loop, the tree hasn't changed since, so it's skipped.
+    assert patched_crawl.call_count == 1
+
+
+def test__linter__server_requests():
+    """Test handling requests with a warm linter."""
+    server = LintServer(Linter(config=FluffConfig(overrides=dict(dialect="ansi"))))
+    sql = "SELECT a,b FROM tbl\n"
+    response = server.handle({"id": 1, "command": "lint", "sql": sql})
+    assert response["id"] == 1
+    assert response["status"] == "ok"
+    # Violations are given in the same form as the json output.
+    assert (
+        response["violations"]
+        == Linter(config=FluffConfig(overrides=dict(dialect="ansi")))
+        .lint_string_wrapped(sql)
+        .as_records()[0]["violations"]
+    )
+    response = server.handle({"command": "fix", "sql": sql})
+    assert response["fixed"] == "SELECT\n    a,\n    b\nFROM tbl\n"
+    response = server.handle({"command": "parse", "sql": "SELECT 1\n"})
+    assert response["tree"]["file"]["statement"]
+    # Linting a file by name.
+    response = server.handle(
+        {"command": "lint", "fname": "test/fixtures/linter/indentation_errors.sql"}
+    )
+    assert response["violations"][0]["code"] == "L003"
+    # Inline config applies to the request, but doesn't leak into the server.
+    sql = "SELECT a FROM tbl\n"
+    response = server.handle(
+        {"command": "lint", "sql": "-- sqlfluff:rules:max_line_length:10\n" + sql}
+    )
+    assert [v["code"] for v in response["violations"]] == ["L016", "L016"]
+    response = server.handle({"command": "lint", "sql": sql})
+    assert response["violations"] == []
+
+
+@pytest.mark.parametrize(
+    "line,error",
+    [
+        ('{"command": "lint", "fname": "not/a/file.sql"}', "No such file"),
+        ('{"command": "lint"}', "either `sql` or `fname`"),
+        ('{"command": "foo"}', "Unknown command"),
+        ("{not json", "Invalid JSON"),
+        ("[]", "must be objects"),
+    ],
+)
+def test__linter__server_errors(line, error):
+    """Test that bad requests get error responses, rather than raising."""
+    server = LintServer(Linter(config=FluffConfig(overrides=dict(dialect="ansi"))))
+    response = server.handle_line(line)
+    assert response["status"] == "error"
+    assert error in response["error"]
+
+
+def test__linter__server_stream():
+    """Test serving JSON lines until a shutdown."""
+    server = LintServer(Linter(config=FluffConfig(overrides=dict(dialect="ansi"))))
+    in_stream = io.StringIO(
+        '{"id": 1, "command": "ping"}\n\n'
+        '{"id": 2, "command": "shutdown"}\n'
+        '{"id": 3, "command": "ping"}\n'
+    )
+    out_stream = io.StringIO()
+    server.serve_stream(in_stream, out_stream)
+    responses = [json.loads(line) for line in out_stream.getvalue().splitlines()]
+    assert responses == [{"id": 1, "status": "ok"}, {"id": 2, "status": "ok"}]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix sockets.")
+def test__linter__server_socket(tmp_path):
+    """Test serving requests over a Unix socket with the client."""
+    path = str(tmp_path / "sqlfluff.sock")
+    lntr = Linter(config=FluffConfig(overrides=dict(dialect="ansi")))
+    server = LintServer(lntr)
+    thread = threading.Thread(target=server.serve_socket, args=(path,), daemon=True)
+    thread.start()
+    try:
+        while not os.path.exists(path):
+            time.sleep(0.01)
+        with LintClient(path, timeout=60) as client:
+            response = client.request("lint", sql="SELECT a FROM tbl\n")
+            assert response == {"id": 1, "violations": [], "status": "ok"}
+            # Another connection isn't blocked by this one staying open.
+            with LintClient(path, timeout=60) as other_client:
+                response = other_client.request("parse", sql="SELECT\n")
+                assert response["violations"][0]["code"] == "PRS"
+            # A second server can't take over the socket.
+            with pytest.raises(ValueError, match="already listening"):
+                LintServer(lntr).serve_socket(path)
+            assert client.request("shutdown")["status"] == "ok"
+    finally:
+        thread.join(timeout=60)
+    assert not thread.is_alive()
+    assert not os.path.exists(path)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Needs Unix sockets.")
+def test__linter__server_socket_stale(tmp_path):
+    """Test that a socket left behind by a server which has gone is replaced."""
+    path = str(tmp_path / "sqlfluff.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(path)
+    server = LintServer(Linter(config=FluffConfig(overrides=dict(dialect="ansi"))))
+    thread = threading.Thread(target=server.serve_socket, args=(path,), daemon=True)
+    thread.start()
+    try:
+        with LintClient(path, timeout=60) as client:
+            for _ in range(100):
+                try:
+                    assert client.request("ping")["status"] == "ok"
+                    break
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # The server hasn't replaced the stale socket yet.
+                    client.close()
+                    time.sleep(0.05)
+            assert client.request("shutdown")["status"] == "ok"
+    finally:
+        thread.join(timeout=60)
+    assert not thread.is_alive()
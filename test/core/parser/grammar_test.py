@@ -159,6 +159,31 @@ def test__parser__grammar__base__look_ahead_match(
     assert result_match.matched_segments == expected_result
 
 
+def test__parser__grammar__base__look_ahead_match_first_only(
+    generate_test_segments, monkeypatch
+):
+    """Test that _look_ahead_match stops looking at the first match.
+
+    Otherwise looking ahead (e.g. for each delimiter in a long file)
+    takes quadratic time.
+    """
+    seg_list = generate_test_segments(["bar", " ", "foo", " "] * 100)
+    match_calls = []
+    match = StringParser.match
+
+    def spy_match(self, segments, parse_context):
+        match_calls.append(len(segments))
+        return match(self, segments, parse_context)
+
+    monkeypatch.setattr(StringParser, "match", spy_match)
+    matchers = [StringParser("foo", KeywordSegment)]
+    with RootParseContext(dialect=None) as ctx:
+        pre, result_match, _ = BaseGrammar._look_ahead_match(seg_list, matchers, ctx)
+    assert pre == seg_list[:2]
+    assert result_match.matched_segments[0].raw == "foo"
+    assert match_calls == [len(seg_list) - 2]
+
+
 def test__parser__grammar__base__ephemeral_segment(seg_list):
     """Test the ephemeral features on BaseGrammar.
 
@@ -328,6 +353,34 @@ def test__parser__grammar__ref_eq():
     assert r1 not in check_list
 
 
+def test__parser__grammar__ref_memo(seg_list, fresh_ansi_dialect):
+    """Test that Ref matches are memoized in the parse context."""
+    ref = Ref("SelectKeywordSegment")
+    with RootParseContext(dialect=fresh_ansi_dialect) as ctx:
+        first = ref.match(seg_list, parse_context=ctx)
+        assert (ctx.memo.hits, ctx.memo.misses) == (0, 1)
+        # A second attempt at the same span is served from the memo.
+        assert ref.match(seg_list, parse_context=ctx) is first
+        assert (ctx.memo.hits, ctx.memo.misses) == (1, 1)
+        # A different span is a miss.
+        ref.match(seg_list[1:], parse_context=ctx)
+        assert (ctx.memo.hits, ctx.memo.misses) == (1, 2)
+        assert len(ctx.memo) == 2
+        # Invalidating (e.g. on mutation) empties it.
+        ctx.memo.invalidate()
+        assert len(ctx.memo) == 0
+        assert ctx.memo.generation == 1
+
+
+def test__parser__grammar__ref_memo_bounded(seg_list, fresh_ansi_dialect):
+    """Test that the memo table doesn't grow beyond its limit."""
+    ref = Ref("SelectKeywordSegment")
+    with RootParseContext(dialect=fresh_ansi_dialect, memo_max_size=2) as ctx:
+        for idx in range(len(seg_list)):
+            ref.match(seg_list[idx:], parse_context=ctx)
+        assert len(ctx.memo) == 2
+
+
 def test__parser__grammar__oneof__copy():
     """Test grammar copying."""
     bs = StringParser("bar", KeywordSegment)
@@ -394,6 +447,27 @@ def test__parser__grammar_oneof_exclude(seg_list):
         assert not g.match(seg_list, parse_context=ctx)
 
 
+def test__parser__grammar_oneof_prune_options(seg_list):
+    """Test that OneOf only tries the options which could match."""
+    bs = StringParser("bar", KeywordSegment)
+    fs = StringParser("foo", KeywordSegment)
+    fooRegex = RegexParser(r"fo{2}", KeywordSegment)
+    bfs = OneOf(StringParser("bar", KeywordSegment), fs)
+    g = OneOf(fs, fooRegex, bs, bfs)
+    with RootParseContext(dialect=None) as ctx:
+        # Options are looked up by the first raw, keeping their order,
+        # and those which aren't simple are always included.
+        assert g._prune_options(seg_list, parse_context=ctx) == [fooRegex, bs, bfs]
+        assert g._prune_options(seg_list[2:], parse_context=ctx) == [
+            fs,
+            fooRegex,
+            bfs,
+        ]
+        assert g._prune_options(seg_list[3:], parse_context=ctx) == [fooRegex]
+        # The lookup is only made once for each parse context.
+        assert g._option_lookup(ctx) is g._option_lookup(ctx)
+
+
 def test__parser__grammar_oneof_take_longest_match(seg_list):
     """Test that the OneOf grammar takes the longest match."""
     fooRegex = RegexParser(r"fo{2}", KeywordSegment)
@@ -5,6 +5,7 @@ import logging
 
 from sqlfluff.core.parser import Lexer, CodeSegment, NewlineSegment
 from sqlfluff.core.parser.lexer import (
+    CombinedLexer,
     StringLexer,
     LexMatch,
     RegexLexer,
@@ -115,6 +116,47 @@ def test__parser__lexer_lex_match(caplog):
         assert res.elements[2].raw == "#..#"
 
 
+@pytest.mark.parametrize(
+    "matcher,char,res",
+    [
+        (StringLexer("dot", ".", CodeSegment), ".", True),
+        (StringLexer("dot", ".", CodeSegment), "#", False),
+        (RegexLexer("test", r"#[^#]*#", CodeSegment), "#", True),
+        (RegexLexer("test", r"#[^#]*#", CodeSegment), ".", False),
+        # Can only tell from more than one character.
+        (RegexLexer("test", r"\$(\w*)\$[^\1]*?\$\1\$", CodeSegment), "$", True),
+        # Context dependent patterns should always be tried.
+        (RegexLexer("test", r"\bfoo", CodeSegment), ".", True),
+        (RegexLexer("test", r"(?<=\.)foo", CodeSegment), ".", True),
+    ],
+)
+def test__parser__lexer_could_start_with(matcher, char, res):
+    """Test the first character checks of lexers."""
+    assert matcher.could_start_with(char) is res
+
+
+def test__parser__lexer_combined_lexer():
+    """Test the CombinedLexer works on offsets and respects matcher order."""
+    matchers = [
+        StringLexer("dot", ".", CodeSegment),
+        RegexLexer("test", r"#[^#]*#", CodeSegment),
+        RegexLexer("any_hash", r"#", CodeSegment),
+    ]
+    combined = CombinedLexer(matchers)
+    pos, elements = combined.match("xx..#..#..#x", 2)
+    # The last hash isn't closed, so it's matched by the later matcher.
+    assert pos == 11
+    assert [(e.raw, e.matcher.name) for e in elements] == [
+        (".", "dot"),
+        (".", "dot"),
+        ("#..#", "test"),
+        (".", "dot"),
+        (".", "dot"),
+        ("#", "any_hash"),
+    ]
+    assert combined.candidates("#") == matchers[1:]
+
+
 def test__parser__lexer_fail():
     """Test the how the lexer fails and reports errors."""
     lex = Lexer(config=FluffConfig())
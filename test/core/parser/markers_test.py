@@ -1,5 +1,7 @@
 """Tests for PositionMarker."""
 
+import pickle
+
 import pytest
 
 from sqlfluff.core.templaters import TemplatedFile
@@ -41,3 +43,33 @@ def test_markers__setting_position_working():
     pos = PositionMarker(slice(2, 5), slice(2, 5), templ, 4, 4)
     # Can we NOT infer when we're told.
     assert pos.working_loc == (4, 4)
+
+
+def test_markers__shared_when_unchanged():
+    """Test that markers are reused rather than copied, where they can be."""
+    templ = TemplatedFile.from_string("foobar")
+    pos = PositionMarker(slice(2, 5), slice(2, 5), templ)
+    assert pos.source_slice == slice(2, 5)
+    assert pos.templated_slice == slice(2, 5)
+    assert pos.with_working_position(1, 3) is pos
+    assert pos.with_working_position(4, 4) == PositionMarker(
+        slice(2, 5), slice(2, 5), templ, 4, 4
+    )
+    point = pos.start_point_marker()
+    assert point.is_point()
+    assert point.start_point_marker() is point
+    assert PositionMarker.from_child_markers(pos) is pos
+    assert PositionMarker.from_child_markers(
+        pos, pos.end_point_marker()
+    ) == PositionMarker(slice(2, 5), slice(2, 5), templ)
+
+
+def test_markers__pickle():
+    """Test that markers survive pickling."""
+    templ = TemplatedFile.from_string("foo\nbar")
+    pos = PositionMarker(slice(4, 7), slice(4, 7), templ, 3, 2)
+    unpickled = pickle.loads(pickle.dumps(pos))
+    assert unpickled.source_slice == slice(4, 7)
+    assert unpickled.templated_slice == slice(4, 7)
+    assert unpickled.working_loc == (3, 2)
+    assert unpickled.source_position() == (2, 1)
@@ -1,11 +1,23 @@
 """The Test file for The New Parser (Grammar Classes)."""
 
 import logging
+
+import pytest
+
+from sqlfluff.core import FluffConfig
 from sqlfluff.core.errors import SQLParseError
 from sqlfluff.core.linter.linter import Linter
 
-from sqlfluff.core.parser import BaseSegment, KeywordSegment, Anything, StringParser
+from sqlfluff.core.parser import (
+    BaseSegment,
+    KeywordSegment,
+    Anything,
+    Lexer,
+    Parser,
+    StringParser,
+)
 from sqlfluff.core.parser.context import RootParseContext
+from sqlfluff.core.parser.parser import split_top_level_statements
 
 BarKeyword = StringParser("bar", KeywordSegment)
 
@@ -74,3 +86,156 @@ def test__parser__parse_error():
     violation = parsed.violations[0]
     assert isinstance(violation, SQLParseError)
     assert violation.desc() == "Line 1, Position 1: Found unparsable section: 'SELECT'"
+
+
+def test__parser__parse_lazy_logging(caplog, monkeypatch):
+    """Test that trees are only stringified for logging if they'll be logged."""
+    calls = []
+    stringify = BaseSegment.stringify
+
+    def spy_stringify(self, *args, **kwargs):
+        calls.append(self)
+        return stringify(self, *args, **kwargs)
+
+    monkeypatch.setattr(BaseSegment, "stringify", spy_stringify)
+    lnt = Linter()
+    with caplog.at_level(logging.WARNING):
+        lnt.parse_string("SELECT a FROM b\n")
+    assert not calls
+    with caplog.at_level(logging.DEBUG):
+        lnt.parse_string("SELECT a FROM b\n")
+    assert calls
+    assert "Initial Structure:" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "in_str,statements",
+    [
+        ("SELECT 1", ["SELECT 1"]),
+        ("SELECT 1;\nSELECT 2;\n", ["SELECT 1;", "\nSELECT 2;\n"]),
+        # Runs of delimiters stay together.
+        ("SELECT 1;;\n;SELECT 2", ["SELECT 1;;\n;", "SELECT 2"]),
+        # Delimiters in brackets don't split.
+        ("SELECT (1;2); SELECT 3", ["SELECT (1;2);", " SELECT 3"]),
+        # Nor do delimiters in templated blocks.
+        (
+            "{% if true %}SELECT 1; SELECT 2{% endif %};SELECT 3",
+            ["{% if true %}SELECT 1; SELECT 2{% endif %};", "SELECT 3"],
+        ),
+    ],
+)
+def test__parser__split_top_level_statements(in_str, statements):
+    """Test splitting lexed tokens into top level statements."""
+    config = FluffConfig(overrides=dict(dialect="ansi"))
+    templated_file, _ = Linter(config=config).templater.process(
+        in_str=in_str, fname="<string>", config=config
+    )
+    tokens, _ = Lexer(config=config).lex(templated_file)
+    splits = split_top_level_statements(tokens, (";",))
+    bounds = [0] + splits + [len(tokens)]
+    assert [
+        templated_file.source_str[
+            tokens[start]
+            .pos_marker.source_slice.start : tokens[stop - 1]
+            .pos_marker.source_slice.stop
+        ]
+        for start, stop in zip(bounds, bounds[1:])
+    ] == statements
+
+
+@pytest.mark.parametrize(
+    "in_str",
+    [
+        "SELECT a FROM b;\n" * 10 + "INSERT INTO c VALUES (1, 2);\n\n-- end\n",
+        # Unparsable sections fall back to parsing the file as a whole.
+        "SELECT a FROM b;\n" * 5 + "SELECT ;\n" + "SELECT c FROM d;\n" * 5,
+    ],
+)
+def test__parser__parse_in_parallel(in_str, monkeypatch):
+    """Test that parsing statements in parallel gives the same tree."""
+    monkeypatch.setattr(Parser, "parallel_min_statements", 2)
+    sequential = Linter(dialect="ansi").parse_string(in_str)
+    parallel = Linter(
+        config=FluffConfig(overrides=dict(dialect="ansi", parse_processes=2))
+    ).parse_string(in_str)
+
+    assert parallel.tree.to_tuple(show_raw=True) == sequential.tree.to_tuple(
+        show_raw=True
+    )
+
+    def positions(tree):
+        return [
+            (seg.pos_marker.source_slice, seg.pos_marker.working_loc)
+            for seg in (tree,) + tree.segments
+        ]
+
+    assert positions(parallel.tree) == positions(sequential.tree)
+    # The whole tree points at the same templated file.
+    assert all(
+        seg.pos_marker.templated_file is parallel.templated_file
+        for seg in parallel.tree.get_raw_segments()
+    )
+    assert [v.desc() for v in parallel.violations] == [
+        v.desc() for v in sequential.violations
+    ]
+
+
+def test__parser__parse_in_batches(monkeypatch):
+    """Test that long files are split into batches of about the right size."""
+    in_str = "SELECT a FROM b;\n" * 30
+    lntr = Linter(dialect="ansi")
+    tokens, _ = Lexer(config=lntr.config).lex(in_str)
+    parser = Parser(config=lntr.config)
+    batches = parser._batch_statements(tokens, 20)
+    # Each statement is about 9 tokens, so batches are of three statements.
+    assert len(batches) == 10
+    assert batches[-1][1] == len(tokens)
+    calls = []
+    parse_root = Parser._parse_root
+
+    def spy_parse_root(self, segments, *args):
+        calls.append(len(segments))
+        return parse_root(self, segments, *args)
+
+    monkeypatch.setattr(Parser, "_parse_root", spy_parse_root)
+    parsed = parser._parse_in_batches(tokens, 20)
+    assert calls == [stop - start for start, stop, _, _ in batches]
+    assert parsed.raw == in_str
+
+
+def test__parser__parse_in_batches_tree():
+    """Test that parsing statements a batch at a time gives the same tree."""
+    in_str = "SELECT a FROM b;\n" * 10 + "INSERT INTO c VALUES (1, 2);\n\n-- end\n"
+    sequential = Linter(dialect="ansi").parse_string(in_str)
+    batched = Linter(
+        config=FluffConfig(overrides=dict(dialect="ansi", parse_batch_size=10))
+    ).parse_string(in_str)
+    assert batched.tree.to_tuple(show_raw=True) == sequential.tree.to_tuple(
+        show_raw=True
+    )
+    assert not batched.violations
+
+
+def test__parser__parse_in_batches_unparsable(monkeypatch):
+    """Test that only the batch with an unparsable section is parsed again."""
+    parsed_tokens = []
+    parse_root = Parser._parse_root
+
+    def spy_parse_root(self, segments, *args):
+        parsed_tokens.append(len(segments))
+        return parse_root(self, segments, *args)
+
+    monkeypatch.setattr(Parser, "_parse_root", spy_parse_root)
+    in_str = "SELECT a FROM b;\n" * 10 + "SELECT ;\n" + "SELECT c FROM d;\n" * 10
+    parsed = Linter(
+        config=FluffConfig(overrides=dict(dialect="ansi", parse_batch_size=20))
+    ).parse_string(in_str)
+    # The file isn't parsed as a whole, just the one batch again.
+    assert max(parsed_tokens) < sum(parsed_tokens) / 2
+    assert parsed.tree.raw == in_str
+    unparsables = list(parsed.tree.iter_unparsables())
+    assert len(unparsables) == 1
+    assert "SELECT c FROM d" not in unparsables[0].raw
+    # The statements after the batches parsed again are still parsed.
+    statements = [seg for seg in parsed.tree.segments if seg.is_type("statement")]
+    assert statements[-1].raw == "SELECT c FROM d"
@@ -1,5 +1,7 @@
 """The Test file for The New Parser (Base Segment Classes)."""
 
+import pickle
+
 import pytest
 
 from sqlfluff.core.parser import (
@@ -10,6 +12,7 @@ from sqlfluff.core.parser import (
 )
 from sqlfluff.core.templaters import TemplatedFile
 from sqlfluff.core.parser.context import RootParseContext
+from sqlfluff.core.parser.segments.base import type_mask
 
 
 @pytest.fixture(scope="module")
@@ -128,6 +131,43 @@ def test__parser__base_segments_base_compare():
     assert ds1 != dsa2
 
 
+def test__parser__base_segments_compact(raw_seg_list):
+    """Test that segments are slotted, and their caches still cleared."""
+    ds1 = DummySegment(raw_seg_list[:1])
+    for seg in (ds1, raw_seg_list[0]):
+        assert not hasattr(seg, "__dict__")
+    # A parent with one child shares its position marker.
+    assert ds1.pos_marker is raw_seg_list[0].pos_marker
+
+    assert ds1.raw == "foobar"
+    assert ds1.raw_segments_upper == "FOOBAR"
+    # Changing the segments clears the cached properties.
+    ds1.segments = tuple(raw_seg_list)
+    assert ds1.raw == "foobar.barfoo"
+    assert ds1.raw_segments == list(raw_seg_list)
+
+
+def test__parser__base_segments_descendant_types(raw_seg_list):
+    """Test that recursive_crawl skips segments without what it's after."""
+    inner = DummyAuxSegment(raw_seg_list[:1])
+    outer = DummySegment([inner, raw_seg_list[1]])
+    assert DummySegment._class_types == frozenset(("dummy", "base"))
+    assert inner.descendant_type_mask == type_mask("raw")
+    assert outer.descendant_type_mask == type_mask("dummy_aux", "raw", "base")
+    assert list(outer.recursive_crawl("dummy_aux")) == [inner]
+    assert list(outer.recursive_crawl("raw")) == list(raw_seg_list)
+    # Nothing below the outer segment is of a type it doesn't contain.
+    assert list(outer.recursive_crawl("dummy")) == [outer]
+    assert not outer.descendant_type_mask & type_mask("dummy", "foo")
+    # The masks are cleared when the segments change.
+    inner.segments = (DummySegment(raw_seg_list[:1]),)
+    outer.invalidate_caches()
+    assert list(outer.recursive_crawl("dummy")) == [outer, inner.segments[0]]
+    # They also aren't pickled, as the bits differ between processes.
+    assert "_cached_descendant_type_mask" not in outer.__getstate__()[1]
+    assert pickle.loads(pickle.dumps(outer)).raw == outer.raw
+
+
 def test__parser__base_segments_file(raw_seg_list):
     """Test BaseFileSegment to behave as expected."""
     base_seg = BaseFileSegment(raw_seg_list, fname="/some/dir/file.sql")
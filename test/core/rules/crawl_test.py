@@ -0,0 +1,105 @@
+"""Tests for crawling trees with rules."""
+import pytest
+
+from sqlfluff.core import Linter, FluffConfig
+from sqlfluff.core.rules.base import BaseRule, LintResult, crawl_rules
+
+
+class Rule_T002(BaseRule):
+    """Flags the third raw segment, counting them using memory."""
+
+    def _eval(self, context):
+        if not context.segment.segments:
+            count = context.memory.get("count", 0) + 1
+            return LintResult(
+                anchor=context.segment if count == 3 else None,
+                memory={"count": count},
+            )
+        return LintResult(memory=context.memory)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT a, b FROM tbl WHERE a = 1\n",
+        # Includes an unparsable section
+        "SELECT a FROM tbl\n;\nSELECT FROM WHERE ()\n",
+    ],
+)
+def test__rules__crawl_rules_matches_crawl(sql):
+    """Test that crawling all rules at once is the same as crawling each."""
+    linter = Linter(config=FluffConfig(overrides=dict(dialect="ansi")))
+    parsed = linter.parse_string(sql)
+    rule_set = linter.get_ruleset()
+    dialect = linter.config.get("dialect_obj")
+    results = crawl_rules(
+        rule_set,
+        parsed.tree,
+        ignore_mask=[],
+        dialect=dialect,
+        templated_file=parsed.templated_file,
+    )
+    assert len(results) == len(rule_set)
+    for rule, (vs, fixes) in zip(rule_set, results):
+        single_vs, _, single_fixes, _ = rule.crawl(
+            parsed.tree,
+            ignore_mask=[],
+            dialect=dialect,
+            templated_file=parsed.templated_file,
+        )
+        assert [v.check_tuple() for v in vs] == [v.check_tuple() for v in single_vs]
+        # Newly created segments don't compare equal, so compare reprs.
+        assert repr(fixes) == repr(single_fixes)
+
+
+def test__rules__crawl_rules_separate_memory():
+    """Test that each rule keeps its own memory in a shared crawl."""
+    linter = Linter(config=FluffConfig(overrides=dict(dialect="ansi")))
+    tree = linter.parse_string("SELECT a FROM tbl\n").tree
+    rules = [Rule_T002("T002", "A rule."), Rule_T002("T003", "Another rule.")]
+    vs, _, _, memory = rules[0].crawl(tree, [], dialect=None)
+    assert memory["count"] == len(tree.get_raw_segments())
+    assert [v.check_tuple() for v in vs] == [("T002", 1, 7)]
+    # Crawling both together, they should each still flag the third segment.
+    results = crawl_rules(rules, tree, [], dialect=None)
+    assert [[v.check_tuple() for v in vs] for vs, _ in results] == [
+        [("T002", 1, 7)],
+        [("T003", 1, 7)],
+    ]
+
+
+def test__rules__crawl_target_types():
+    """Test that rules with target_types are only evaluated on those types."""
+    seen = []
+
+    class Rule_T004(BaseRule):
+        """Records the segments it's evaluated on."""
+
+        target_types = ("keyword",)
+
+        def _eval(self, context):
+            seen.append(context.segment.raw)
+
+    linter = Linter(config=FluffConfig(overrides=dict(dialect="ansi")))
+    tree = linter.parse_string("SELECT a FROM tbl\n").tree
+    Rule_T004("T004", "A rule.").crawl(tree, [], dialect=None)
+    assert seen == ["SELECT", "FROM"]
+
+
+def test__rules__crawl_rule_timings():
+    """Test that crawling records the calls and fixes of each rule."""
+    linter = Linter(config=FluffConfig(overrides=dict(dialect="ansi")))
+    tree = linter.parse_string("SELECT a FROM tbl  \n").tree
+    rules = [r for r in linter.get_ruleset() if r.code in ("L001", "L010")]
+    rule_timings = {}
+    crawl_rules(rules, tree, [], dialect=None, rule_timings=rule_timings)
+    assert set(rule_timings) == {"L001", "L010"}
+    assert rule_timings["L001"]["fixes"] == 1
+    assert rule_timings["L010"]["fixes"] == 0
+    # Crawling the rules separately adds to the same totals.
+    for rule in rules:
+        rule.crawl(tree, [], dialect=None, rule_timings=rule_timings)
+    assert rule_timings["L001"]["fixes"] == 2
+    for timing in rule_timings.values():
+        assert timing["calls"] > 0
+        assert timing["time"] >= 0
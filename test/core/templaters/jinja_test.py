@@ -4,8 +4,9 @@ import logging
 from typing import List, NamedTuple
 
 import pytest
+from jinja2 import Environment, Template
 
-from sqlfluff.core.templaters import JinjaTemplater
+from sqlfluff.core.templaters import JinjaTemplater, jinja
 from sqlfluff.core.templaters.jinja import JinjaTracer
 from sqlfluff.core import Linter, FluffConfig
 
@@ -405,6 +406,72 @@ def test__templater_jinja_lint_empty():
     assert parsed.tree is None
 
 
+def test__templater_jinja_single_parse_and_render(monkeypatch):
+    """Check the source is only parsed and rendered once."""
+    calls = {"parse": [], "render": 0}
+    original_parse = Environment._parse
+    original_render = Template.render
+
+    def parse(self, source, *args, **kwargs):
+        calls["parse"].append(source)
+        return original_parse(self, source, *args, **kwargs)
+
+    def render(self, *args, **kwargs):
+        calls["render"] += 1
+        return original_render(self, *args, **kwargs)
+
+    monkeypatch.setattr(Environment, "_parse", parse)
+    monkeypatch.setattr(Template, "render", render)
+    t = JinjaTemplater(override_context=dict(blah="foo", condition="a < 10"))
+    outstr, vs = t.process(in_str=JINJA_STRING, fname="test", config=FluffConfig())
+    assert str(outstr) == "SELECT * FROM f, o, o WHERE a < 10\n\n"
+    assert not vs
+    # The source is parsed and rendered once. The only other render is of
+    # the tracer's instrumented copy.
+    assert calls["parse"].count(JINJA_STRING) == 1
+    assert calls["render"] == 2
+
+
+def test__templater_jinja_macro_and_library_cache(tmp_path):
+    """Check macros and libraries are cached, but changes are picked up."""
+    macro_path = tmp_path / "macros"
+    macro_path.mkdir()
+    (macro_path / "my_macros.sql").write_text("{% macro tbl() %}tbl_a{% endmacro %}")
+    library_path = tmp_path / "libs"
+    library_path.mkdir()
+    (library_path / "cache_test_lib.py").write_text("def col():\n    return 'a'\n")
+    config = FluffConfig(
+        configs={
+            "templater": {
+                "jinja": {
+                    "load_macros_from_path": str(macro_path),
+                    "library_path": str(library_path),
+                }
+            }
+        },
+        overrides=dict(dialect="ansi"),
+    )
+    instr = "SELECT {{ cache_test_lib.col() }} FROM {{ tbl() }}\n"
+    t = JinjaTemplater()
+
+    def render():
+        outstr, vs = t.process(in_str=instr, fname="test", config=config)
+        assert not vs
+        return str(outstr)
+
+    assert render() == "SELECT a FROM tbl_a\n"
+    cached_code = jinja._macro_code_cache[str(macro_path / "my_macros.sql")][1]
+    cached_libs = jinja._library_cache[str(library_path)][1]
+    assert render() == "SELECT a FROM tbl_a\n"
+    # The second render should have reused the compiled macros and libraries.
+    assert jinja._macro_code_cache[str(macro_path / "my_macros.sql")][1] is cached_code
+    assert jinja._library_cache[str(library_path)][1] is cached_libs
+    # Changes to the files (here, to their sizes) should be picked up.
+    (macro_path / "my_macros.sql").write_text("{% macro tbl() %}tbl_bb{% endmacro %}")
+    (library_path / "cache_test_lib.py").write_text("def col():\n    return 'bb'\n")
+    assert render() == "SELECT bb FROM tbl_bb\n"
+
+
 def assert_structure(yaml_loader, path, code_only=True, include_meta=False):
     """Check that a parsed sql file matches the yaml file with the same name."""
     lntr = Linter()
@@ -72,6 +72,13 @@ def benchmark(cmd, runs, from_file):
         post_results = True
         click.echo(f"Commit hash is: {commit_hash!r}")
 
+    # Some benchmarks generate their input files, rather than checking
+    # them in. Do that once, before any of the runs.
+    for benchmark in benchmarks:
+        if "setup" in benchmark:
+            click.echo("Setting up benchmark: {!r}".format(benchmark["name"]))
+            subprocess.run(benchmark["setup"], check=True)
+
     all_results = {}
     for run_no in range(runs):
         click.echo(f"===== Run #{run_no + 1} =====")